@@ -3,158 +3,239 @@ import os
 import json
 import csv
 import time
+import sys
 import datetime
-from selenium import webdriver
+import pandas as pd
+from contextlib import contextmanager
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from scraper_utils.columnar import write_parquet
+from scraper_utils.driver_pool import get_driver_pool
+from scraper_utils.http_fetch import StaticPage, fetch_tree
+from scraper_utils.metrics import metrics
+from scraper_utils.replay import record_page, replay_page
+
+# Label for this scraper's metrics
+SOURCE = "research_papers"
+
+ARXIV_SEARCH_URL = "https://arxiv.org/search/"
+
+
+def _class_xpath(tag, css_class):
+    """XPath for ``tag.css_class`` (works in the browser and on lxml trees without cssselect)."""
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]"
+
+
+ARXIV_RESULT_XPATH = "//" + _class_xpath("li", "arxiv-result")
+
 
 class ResearchPaperScraper:
     """Scraper to fetch research paper metadata from multiple sources."""
 
-    def __init__(self, driver_path="./chromedriver.exe", headless=True):
-        """Initialize the web driver and storage."""
+    def __init__(self, driver_path="./chromedriver.exe", headless=True, pool=None, sink=None,
+                 fetch_mode="browser", arxiv_url=ARXIV_SEARCH_URL):
+        """Initialize the shared driver pool and storage."""
         self.driver_path = os.path.abspath(driver_path)
         self.headless = headless
+        self.fetch_mode = fetch_mode  # "browser", or "http" to read arXiv results with plain HTTP + lxml
+        self.arxiv_url = arxiv_url
+        self.pool = pool or get_driver_pool(headless=headless, driver_path=self.driver_path, profile=SOURCE)
         self.output_folder = "output"
         os.makedirs(self.output_folder, exist_ok=True)
         self.all_results = []  # This is our collector
+        self.sink = sink  # optional scraper_utils.sinks sink: results are streamed to it instead
 
-    def _setup_driver(self):
-        """Configure Selenium WebDriver."""
-        chrome_options = webdriver.ChromeOptions()
-        if self.headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920x1080")
-        service = Service(self.driver_path)
-        return webdriver.Chrome(service=service, options=chrome_options)
-
+    @metrics.timed("scrape", scraper=SOURCE, site="arxiv")
     def scrape_arxiv(self, query, max_results=10):
         """Scrape research papers from arXiv."""
-        driver = self._setup_driver()
+        search_url = f"{self.arxiv_url}?query={query}&searchtype=all&abstracts=show&size={max_results}&order=-announced_date_first"
+        if self.fetch_mode == "http":
+            # arXiv search results are server-rendered: no browser needed
+            tree = fetch_tree(search_url, expected_xpath=ARXIV_RESULT_XPATH)
+            if tree is not None:
+                try:
+                    return self._parse_arxiv(StaticPage(tree, search_url))
+                except Exception as e:
+                    print(f"[ERROR] arXiv scraping failed: {e}")
+                    return []
+
         results = []
         try:
-            search_url = f"https://arxiv.org/search/?query={query}&searchtype=all&abstracts=show&size={max_results}&order=-announced_date_first"
-            driver.get(search_url)
-            time.sleep(2)
-
-            papers = driver.find_elements(By.CSS_SELECTOR, "li.arxiv-result")
-            results = [
-                {
-                    "title": p.find_element(By.CSS_SELECTOR, "p.title").text.strip(),
-                    "authors": p.find_element(By.CSS_SELECTOR, "p.authors").text.replace("Authors:", "").strip(),
-                    "date": p.find_element(By.CSS_SELECTOR, "p.is-size-7 span").text.strip(),
-                    "source": "arXiv",
-                    "link": p.find_element(By.CSS_SELECTOR, "p.list-title a").get_attribute("href")
-                }
-                for p in papers
-            ]
+            with self._results_page(search_url) as page:
+                results = self._parse_arxiv(page)
         except Exception as e:
             print(f"[ERROR] arXiv scraping failed: {e}")
-        finally:
-            driver.quit()
         return results
 
+    def _parse_arxiv(self, page):
+        """Result dicts from an arXiv search page (WebDriver or StaticPage)."""
+        papers = page.find_elements(By.XPATH, ARXIV_RESULT_XPATH)
+        return [
+            {
+                "title": p.find_element(By.XPATH, ".//" + _class_xpath("p", "title")).text.strip(),
+                "authors": p.find_element(By.XPATH, ".//" + _class_xpath("p", "authors")).text.replace("Authors:", "").strip(),
+                "date": p.find_element(By.XPATH, ".//" + _class_xpath("p", "is-size-7") + "//span").text.strip(),
+                "source": "arXiv",
+                "link": p.find_element(By.XPATH, ".//" + _class_xpath("p", "list-title") + "//a").get_attribute("href")
+            }
+            for p in papers
+        ]
+
+    @metrics.timed("scrape", scraper=SOURCE, site="citeseerx")
     def scrape_citeseerx(self, query, max_results=10):
         """Scrape research papers from CiteSeerX."""
-        driver = self._setup_driver()
         results = []
+        search_url = f"https://citeseerx.ist.psu.edu/search?q={query.replace(' ', '+')}&submit=Search&sort=rlv&t=doc"
         try:
-            search_url = f"https://citeseerx.ist.psu.edu/search?q={query.replace(' ', '+')}&submit=Search&sort=rlv&t=doc"
-            driver.get(search_url)
-            time.sleep(2)
-
-            papers = driver.find_elements(By.CSS_SELECTOR, "div.result")
-            results = [
-                {
-                    "title": p.find_element(By.CSS_SELECTOR, "a.doc_details").text.strip(),
-                    "authors": "Unknown",
-                    "date": "Unknown",
-                    "source": "CiteSeerX",
-                    "link": p.find_element(By.CSS_SELECTOR, "a.doc_details").get_attribute("href")
-                }
-                for p in papers[:max_results]
-            ]
+            with self._results_page(search_url) as page:
+                papers = page.find_elements(By.XPATH, "//" + _class_xpath("div", "result"))
+                results = [
+                    {
+                        "title": p.find_element(By.XPATH, ".//" + _class_xpath("a", "doc_details")).text.strip(),
+                        "authors": "Unknown",
+                        "date": "Unknown",
+                        "source": "CiteSeerX",
+                        "link": p.find_element(By.XPATH, ".//" + _class_xpath("a", "doc_details")).get_attribute("href")
+                    }
+                    for p in papers[:max_results]
+                ]
         except Exception as e:
             print(f"[ERROR] CiteSeerX scraping failed: {e}")
-        finally:
-            driver.quit()
         return results
 
+    @metrics.timed("scrape", scraper=SOURCE, site="core")
     def scrape_core(self, query, max_results=10):
         """Scrape research papers from CORE."""
-        driver = self._setup_driver()
         results = []
+        search_url = f"https://core.ac.uk/search?q={query.replace(' ', '+')}"
         try:
-            search_url = f"https://core.ac.uk/search?q={query.replace(' ', '+')}"
-            driver.get(search_url)
-            time.sleep(2)
-
-            papers = driver.find_elements(By.CSS_SELECTOR, "div.result__body")
-            results = [
-                {
-                    "title": p.find_element(By.CSS_SELECTOR, "a.result__title").text.strip(),
-                    "authors": "Unknown",
-                    "date": "Unknown",
-                    "source": "CORE",
-                    "link": p.find_element(By.CSS_SELECTOR, "a.result__title").get_attribute("href")
-                }
-                for p in papers[:max_results]
-            ]
+            with self._results_page(search_url) as page:
+                papers = page.find_elements(By.XPATH, "//" + _class_xpath("div", "result__body"))
+                results = [
+                    {
+                        "title": p.find_element(By.XPATH, ".//" + _class_xpath("a", "result__title")).text.strip(),
+                        "authors": "Unknown",
+                        "date": "Unknown",
+                        "source": "CORE",
+                        "link": p.find_element(By.XPATH, ".//" + _class_xpath("a", "result__title")).get_attribute("href")
+                    }
+                    for p in papers[:max_results]
+                ]
         except Exception as e:
             print(f"[ERROR] CORE scraping failed: {e}")
-        finally:
-            driver.quit()
         return results
 
-    def collect_results(self, query, max_results=10):
-        """Collector method to gather from multiple sources in parallel."""
-        sources = [
+    def collect_results(self, queries, max_results=10, sources=None, max_workers=None):
+        """Collector method to gather every query from every source in parallel.
+
+        ``queries`` is one query string or a list of them. Each (query, source)
+        pair runs on a bounded thread pool (at most one worker per CPU and per
+        pooled browser). A task leases a browser only when its page is neither
+        replayed nor fetched over HTTP, and hands it back as soon as the page
+        is read, so the pool's ``max_pages`` recycling and health checks run
+        between tasks and a crashed session costs one task, not the rest of
+        the batch. Results are appended to ``all_results`` (or written to
+        ``sink``) as soon as each task ends.
+        """
+        if isinstance(queries, str):
+            queries = [queries]
+        sources = sources or [
             self.scrape_arxiv,
             self.scrape_citeseerx,
             self.scrape_core
         ]
+        tasks = [(query, source) for query in queries for source in sources]
+        if not tasks:
+            return
 
-        with ThreadPoolExecutor() as executor:
-            future_to_source = {
-                executor.submit(source, query, max_results): source.__name__
-                for source in sources
-            }
-            for future in as_completed(future_to_source):
-                source_name = future_to_source[future]
-                try:
-                    results = future.result()
-                    print(f"[INFO] {source_name} returned {len(results)} results.")
-                    self.all_results.extend(results)
-                except Exception as e:
-                    print(f"[ERROR] {source_name} failed: {e}")
+        # Each worker leases at most one browser at a time, so more workers than browsers would only wait
+        max_workers = min(max_workers or os.cpu_count() or 1, self.pool.max_size, len(tasks))
 
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_task = {
+                    executor.submit(source, query, max_results): (query, source.__name__)
+                    for query, source in tasks
+                }
+                for future in as_completed(future_to_task):
+                    query, source_name = future_to_task[future]
+                    try:
+                        results = future.result()
+                        for result in results:
+                            result["query"] = query
+                        print(f"[INFO] {source_name} returned {len(results)} results for '{query}'.")
+                        self._emit(results)
+                    except Exception as e:
+                        print(f"[ERROR] {source_name} failed for '{query}': {e}")
+        finally:
+            if self.sink is not None:
+                self.sink.flush()
+
+    def _emit(self, results):
+        """Stream results to the sink, or keep them in ``all_results`` when there is none."""
+        metrics.count("rows", len(results), scraper=SOURCE)
+        if self.sink is not None:
+            self.sink.write_many(results)
+        else:
+            self.all_results.extend(results)
+
+    def _results(self):
+        """The results collected in ``all_results``; raises when they were streamed to the sink instead."""
+        if self.sink is not None:
+            raise RuntimeError(f"Results were streamed to {self.sink.path}; read them from there")
+        return self.all_results
+
+    @contextmanager
+    def _results_page(self, search_url):
+        """Yield the rendered results page: archived when replaying, else loaded in a pooled browser."""
+        page = replay_page(search_url)
+        if page is not None:
+            yield page
+            return
+        # Leased per page: the release health-checks the browser and recycles it after max_pages loads
+        with self.pool.lease() as driver:
+            self.pool.load(driver, search_url)
+            with metrics.timer("wait", scraper=SOURCE):
+                time.sleep(2)
+            record_page(search_url, driver)
+            yield driver
+
+    @metrics.timed("save", scraper=SOURCE)
     def save_data(self):
         """Save collected results to JSON and CSV."""
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         json_path = os.path.join(self.output_folder, f"papers_{timestamp}.json")
         csv_path = os.path.join(self.output_folder, f"papers_{timestamp}.csv")
+        results = self._results()
 
         try:
             with open(json_path, "w", encoding="utf-8") as jf:
-                json.dump(self.all_results, jf, ensure_ascii=False, indent=4)
+                json.dump(results, jf, ensure_ascii=False, indent=4)
 
             with open(csv_path, "w", encoding="utf-8", newline="") as cf:
-                writer = csv.DictWriter(cf, fieldnames=self.all_results[0].keys())
+                writer = csv.DictWriter(cf, fieldnames=results[0].keys())
                 writer.writeheader()
-                writer.writerows(self.all_results)
+                writer.writerows(results)
 
             print(f"[INFO] Data saved to {json_path} and {csv_path}")
         except Exception as e:
             print(f"[ERROR] Saving data failed: {e}")
 
+    @metrics.timed("save", scraper=SOURCE)
+    def save_parquet(self):
+        """Save collected results as Parquet, with source and query dictionary-encoded."""
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        parquet_path = os.path.join(self.output_folder, f"papers_{timestamp}.parquet")
+        return write_parquet(pd.DataFrame(self._results()), parquet_path, dictionary_columns=["source", "query"])
+
     def generate_summary(self):
         """Generate summary statistics."""
+        results = self._results()
         summary = {
-            "total_papers": len(self.all_results),
-            "sources_used": len(set(r["source"] for r in self.all_results)),
+            "total_papers": len(results),
+            "sources_used": len(set(r["source"] for r in results)),
             "duplicates_removed": 0
         }
         summary_path = os.path.join(self.output_folder, "summary.json")
@@ -163,8 +244,10 @@ class ResearchPaperScraper:
         print(f"[INFO] Summary saved: {summary_path}")
 
 
-# Example usage (no main method)
-scraper = ResearchPaperScraper(headless=False)
-scraper.collect_results("machine learning agriculture", max_results=5)
-scraper.save_data()
-scraper.generate_summary()
+# Example usage
+if __name__ == "__main__":
+    scraper = ResearchPaperScraper(headless=False)
+    scraper.collect_results("machine learning agriculture", max_results=5)
+    scraper.save_data()
+    scraper.save_parquet()
+    scraper.generate_summary()
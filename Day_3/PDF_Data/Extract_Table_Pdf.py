@@ -1,25 +1,117 @@
-import pdfplumber
+"""Extract every table from a PDF support matrix and stream the rows to a file.
+
+Page ranges are extracted in parallel (see ``scraper_utils.pdf_tables``);
+each table row is written to the sink as soon as its range finishes, as
+``{"page", "table", "row", "cells"}``. The output type follows the file
+extension: ``.jsonl`` (default) or ``.parquet``. Tables of pages extracted
+on a previous run (same page content, same settings) come from the page
+cache instead of being extracted again.
+
+In the same pass, tables that continue across pages are stitched together
+and every logical table is saved as a typed DataFrame to
+``<tables_dir>/table_<n>.csv`` and ``.parquet``.
+
+The combined export of earlier versions, every page table's rows one after
+another in ``extracted_tables.csv`` and ``extracted_tables.parquet``, is
+still written at the end (``--combined``; ``--no-combined`` skips it, as it
+keeps every row in memory).
+"""
+
+import argparse
+import os
+import sys
+
 import pandas as pd
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from scraper_utils.columnar import write_parquet
+from scraper_utils.pdf_cache import DEFAULT_CACHE_DIR, PdfTableCache
+from scraper_utils.pdf_stitch import stitch_tables, typed_frame
+from scraper_utils.pdf_tables import iter_pdf_tables, table_records
+from scraper_utils.sinks import open_sink
+
 pdf_path = "Windows-and-Office-Configuration-Support-Matrix-2024-10-01.pdf"
 
-tables_list = []  # To store all tables
 
-with pdfplumber.open(pdf_path) as pdf:
-    for page_num, page in enumerate(pdf.pages, start=1):
-        tables = page.extract_tables()
-        if tables:
-            for table in tables:
-                df = pd.DataFrame(table)
-                print(f"\n--- Page {page_num} ---\n")
-                print(df.to_string(index=False))
-                tables_list.append(df)
+def _decimal_places(series):
+    """Digits after the point needed to store the numbers of ``series`` exactly (at most 6)."""
+    places = [len(f"{v:.6f}".rstrip("0").split(".")[1]) for v in series.dropna()]
+    return max(places, default=0)
+
+
+def save_logical_table(df, tables_dir, number):
+    """Write one stitched table as CSV and typed Parquet (the date and number columns ``typed_frame`` found)."""
+    os.makedirs(tables_dir, exist_ok=True)
+    stem = os.path.join(tables_dir, f"table_{number}")
+    df.to_csv(f"{stem}.csv", index=False)
+    date_columns = [c for c in df.columns if pd.api.types.is_datetime64_any_dtype(df[c])]
+    decimal_columns = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+    write_parquet(df, f"{stem}.parquet", date_columns=date_columns, decimal_columns=decimal_columns,
+                  scale=max((_decimal_places(df[c]) for c in decimal_columns), default=2))
+
+
+def save_combined(rows, csv_path):
+    """Write every page table's rows, one after another, as CSV and Parquet (columns 0..n)."""
+    combined_df = pd.DataFrame(rows)
+    combined_df.to_csv(csv_path, index=False)
+    write_parquet(combined_df, os.path.splitext(csv_path)[0] + ".parquet")
+
+
+def extract_pdf(pdf_path, output_path="extracted_tables.jsonl", workers=None, pages_per_task=8,
+                table_settings=None, cache_dir=DEFAULT_CACHE_DIR, tables_dir="extracted_tables",
+                combined_path="extracted_tables.csv"):
+    """Stream all tables of ``pdf_path`` to ``output_path`` and save the stitched tables.
+
+    Returns (page tables, raw rows, logical tables). Pass ``cache_dir=None``
+    to extract every page from scratch, ``tables_dir=None`` to skip stitching
+    and ``combined_path=None`` to skip the combined CSV/Parquet export.
+    """
+    cache = PdfTableCache(cache_dir, table_settings) if cache_dir else None
+    counts = {"tables": 0, "logical": 0}
+    combined_rows = []
+
+    with open_sink(output_path, batch_size=500) as sink:
+        def streamed():
+            for table in iter_pdf_tables(pdf_path, workers, pages_per_task, table_settings, cache):
+                sink.write_many(table_records(table))
+                if combined_path:
+                    combined_rows.extend(table["rows"])
+                counts["tables"] += 1
+                yield table
 
+        if tables_dir:
+            for logical in stitch_tables(streamed()):
+                counts["logical"] += 1
+                save_logical_table(typed_frame(logical), tables_dir, counts["logical"])
+        else:
+            for _ in streamed():
+                pass
 
-if tables_list:
-    combined_df = pd.concat(tables_list, ignore_index=True)
-    # print("\n=== Combined Table Data ===\n")
-    # print(combined_df.to_string(index=False))
+    print(f"[INFO] {counts['tables']} tables, {sink.rows_written} rows written to {output_path}")
+    if combined_path and combined_rows:
+        save_combined(combined_rows, combined_path)
+    if tables_dir:
+        print(f"[INFO] {counts['logical']} stitched tables saved to {tables_dir}")
+    if cache is not None:
+        print(f"[INFO] Page cache: {cache.hits} hits, {cache.misses} misses")
+    return counts["tables"], sink.rows_written, counts["logical"]
 
-combined_df.to_csv("extracted_tables.csv", index=False)
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdf", nargs="?", default=pdf_path)
+    parser.add_argument("--output", default="extracted_tables.jsonl")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--pages-per-task", type=int, default=8)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--no-cache", action="store_true", help="extract every page from scratch")
+    parser.add_argument("--tables-dir", default="extracted_tables")
+    parser.add_argument("--no-stitch", action="store_true", help="only stream the raw page tables")
+    parser.add_argument("--combined", default="extracted_tables.csv",
+                        help="combined CSV of all page tables (a .parquet is written next to it)")
+    parser.add_argument("--no-combined", action="store_true", help="skip the combined CSV/Parquet export")
+    args = parser.parse_args()
+    extract_pdf(args.pdf, args.output, args.workers, args.pages_per_task,
+                cache_dir=None if args.no_cache else args.cache_dir,
+                tables_dir=None if args.no_stitch else args.tables_dir,
+                combined_path=None if args.no_combined else args.combined)
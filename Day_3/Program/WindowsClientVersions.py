@@ -1,62 +1,87 @@
 """File for scraping Windows Server release tables from the Microsoft Wiki page."""
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 import os
-import time
+import re
+import sys
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from scraper_utils.driver_pool import get_driver_pool
+from scraper_utils.eol_store import store_records, windows_release_records
+from scraper_utils.metrics import metrics
+from scraper_utils.replay import record_page
+from scraper_utils.scraper_mixin import ScraperMixin
+from scraper_utils.table_extract import data_rows, extract_tables, header_texts, td_cells
 
-class WindowsClientVersions:
+# Label for this scraper's metrics
+SOURCE = "windows_client"
+
+# Columns that identify a row across runs for delta output
+DELTA_KEY_COLUMNS = ["Version", "Servicing option", "Build", "KB article"]
+
+# "date" as a word, so "Latest update" / "Update type" stay strings
+DATE_HEADER = re.compile(r"\bdate\b", re.IGNORECASE)
+
+# Windows 11 builds start at 22000; the page lists Windows 11 and Windows 10 releases
+WINDOWS_11_FIRST_BUILD = 22000
+BUILD_COLUMNS = ["OS build", "Build", "Latest build"]
+
+# Repeated labels stored dictionary-encoded in Parquet output
+DICTIONARY_COLUMNS = ["Servicing option", "Update type", "Month", "Type"]
+
+
+def date_columns(columns):
+    """Headers holding dates ("Availability date", "End of servicing: ...", ...)."""
+    return [c for c in columns if DATE_HEADER.search(c) or c.startswith("End of servicing")]
+
+
+def windows_product(row):
+    """"Windows 11" or "Windows 10" for a release row, from its build number."""
+    build = next((row[c] for c in BUILD_COLUMNS if row.get(c)), "")
+    match = re.match(r"\d+", build)
+    if match and int(match.group()) >= WINDOWS_11_FIRST_BUILD:
+        return "Windows 11"
+    return "Windows 10"
+
+
+class WindowsClientVersions(ScraperMixin):
     """Scraper class to extract Windows Server tables from the Microsoft Wiki page."""
-    def __init__(self, headless=True):
+
+    SOURCE = SOURCE
+    WAIT_TIMEOUT = 10
+    SETTLE_SECONDS = 1
+
+    def __init__(self, headless=True, pool=None, fetch_mode="browser", state=None):
         self.headless = headless
-        self.driver = self._setup_driver()
-        self.wait = WebDriverWait(self.driver, 10)
+        self.fetch_mode = fetch_mode  # "browser", or "http" to try plain HTTP + lxml first
+        self.pool = pool or get_driver_pool(headless=headless, profile=SOURCE)
+        self.driver = None
+        self.wait = None
+        self.page = None  # WebDriver or StaticPage the XPath lookups run against
+        self.url = None
+        self.state = state  # optional CrawlState: only emit tables/rows changed since the last run
         self.tables_data = {}
         self.output_folder = "output"
         os.makedirs(self.output_folder, exist_ok=True)
 
-    def _setup_driver(self):
-        """Initialize and configure the Selenium WebDriver."""
-        chrome_options = Options()
-        if self.headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920x1080")
-        chrome_options.add_argument("--log-level=3")
-
-        # Automatically install and use correct ChromeDriver
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=chrome_options)
-
-    def open_website(self, url):
-        """Opens the given website URL."""
-        self.driver.get(url)
-        self.wait.until(EC.presence_of_element_located((By.XPATH, "//table")))
-        time.sleep(1)
-
+    @metrics.timed("extract", scraper=SOURCE)
     def scrape_tables(self):
         """Scrape all tables from the opened page and combine into a single DataFrame."""
-        tables = self.driver.find_elements(By.XPATH, "//table")
+        if self.page is None:
+            return pd.DataFrame()  # page unchanged since the last incremental run
+        record_page(self.url, self.page)  # rendered DOM, when recording
+
+        # One round trip for the whole page instead of one WebDriver call per cell
+        tables = extract_tables(self.page, "//table")
         all_dfs = []
 
-        for idx, table in enumerate(tables, start=1):
-            # Extract headers
-            headers = [th.text.strip() for th in table.find_elements(By.XPATH, ".//th")]
+        for t_index, table in enumerate(tables, start=1):
+            if self.state is not None and not self.state.table_changed(self.url, t_index, table):
+                continue  # identical to the last run, skip parsing
 
-            # Extract rows
-            rows_data = []
-            row_elements = table.find_elements(By.XPATH, ".//tr[position()>1]")
-            for row in row_elements:
-                cells = row.find_elements(By.XPATH, ".//td")
-                row_text = [cell.text.strip() for cell in cells]
-                if row_text:
-                    rows_data.append(row_text)
+            headers = header_texts(table)
+            rows_data = [[cell["text"] for cell in td_cells(row)] for row in data_rows(table)]
+            if self.state is not None:
+                rows_data = self.state.changed_rows(self.url, t_index, rows_data)
 
             if headers and rows_data:
                 df = pd.DataFrame(rows_data, columns=headers)
@@ -64,23 +89,49 @@ class WindowsClientVersions:
 
         if all_dfs:
             combined_df = pd.concat(all_dfs, ignore_index=True).fillna("")
+            metrics.count("rows", len(combined_df), scraper=SOURCE)
             return combined_df
         else:
             return pd.DataFrame()
 
-    def save_to_csv(self, df, filename="combined_windows_tables.csv"):
-        """Save the DataFrame to CSV."""
-        output_path = os.path.join(self.output_folder, filename)
-        df.to_csv(output_path, index=False, encoding="utf-8-sig")
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_csv(self, df, filename="combined_windows_tables.csv", delta=False):
+        """Save the DataFrame to CSV (and the changes since the previous file when delta=True).
+
+        An incremental run (``state`` set) only returns changed rows; they go to
+        ``<filename>_changes.csv`` so the full snapshot stays complete.
+        """
+        output_path = self._write_csv(
+            df, os.path.join(self.output_folder, filename), delta,
+            [c for c in DELTA_KEY_COLUMNS if c in df.columns], encoding="utf-8-sig",
+        )
         print(f"Data saved to: {output_path}")
 
-    def close(self):
-        """Close the browser."""
-        self.driver.quit()
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_parquet(self, df, filename="combined_windows_tables.parquet"):
+        """Save the DataFrame as typed Parquet (dates as date32, builds and versions as strings)."""
+        return self._write_parquet(
+            df, os.path.join(self.output_folder, filename),
+            date_columns=date_columns(df.columns),
+            dictionary_columns=[c for c in DICTIONARY_COLUMNS if c in df.columns],
+        )
+
+    def to_eol_records(self, df):
+        """Rows for the EOL store, one per version and servicing option (update-history rows have no version)."""
+        return windows_release_records(df, windows_product, SOURCE)
+
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_store(self, df, store=None):
+        """Upsert the rows into the local EOL store (``output/eol.sqlite`` unless ``store`` is given)."""
+        return store_records(self.to_eol_records(df), store)
+
 
 # Usage
-scraper = WindowsClientVersions(headless=True)
-scraper.open_website("https://learn.microsoft.com/en-us/windows/release-health/supported-versions-windows-client")
-df = scraper.scrape_tables()
-scraper.save_to_csv(df)
-scraper.close()
+if __name__ == "__main__":
+    scraper = WindowsClientVersions(headless=True, fetch_mode="http")
+    scraper.open_website("https://learn.microsoft.com/en-us/windows/release-health/supported-versions-windows-client")
+    df = scraper.scrape_tables()
+    scraper.save_to_csv(df)
+    scraper.save_to_parquet(df)
+    scraper.save_to_store(df)
+    scraper.close()
@@ -0,0 +1,224 @@
+"""Crawl the whole Troemner catalog instead of one category.
+
+``TroemnerScraper`` reads a single listing. This crawler:
+
+1. discovers the category URLs (``.../c/<code>``) from the site navigation,
+   and keeps adding sub-categories found on every category page,
+2. crawls the category listings concurrently on ``workers`` threads, over
+   plain HTTP through ``TroemnerScraper.load_listing_pages`` where the
+   listing is server-rendered, in a pooled browser tab otherwise,
+3. optionally fans out to every product's detail page and extracts its
+   specification table (label/value rows and definition lists).
+
+Products listed in several categories are written once. Every URL goes
+through a ``Frontier`` saved to disk, so ``--resume`` continues an
+interrupted run. Listing rows (the ``TroemnerScraper`` fields plus
+``category``) are streamed to ``--output`` and specifications to
+``--details-output``; the sink type follows the file extension.
+"""
+
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import TimeoutException
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from scraper_utils.driver_pool import get_driver_pool
+from scraper_utils.frontier import Frontier
+from scraper_utils.http_fetch import element_text, fetch_tree, parse_html
+from scraper_utils.metrics import metrics
+from scraper_utils.orchestrator import load_scraper_module
+from scraper_utils.sinks import open_sink
+
+troemner = load_scraper_module("Day_4/Program/TroemnerScraper.py")
+
+ROOT_URL = "https://www.troemner.com/"
+
+# Label for this crawler's metrics
+SOURCE = "troemner_catalog"
+
+# Category pages end in /c/<category code>
+CATEGORY_PATH = re.compile(r"/c/[\w-]+/?$")
+
+# Specification rows: two-cell table rows and definition-list pairs
+SPEC_ROW_XPATH = "//table//tr[count(th|td)=2]"
+SPEC_TERM_XPATH = "//dl/dt[following-sibling::*[1][self::dd]]"
+
+
+def category_links(tree, site_url=ROOT_URL):
+    """Absolute category URLs linked from ``tree`` on the same host as ``site_url``."""
+    host = urlsplit(site_url).netloc.lower()
+    links = []
+    for href in tree.xpath("//a/@href"):
+        parts = urlsplit(href)
+        if parts.netloc.lower() == host and CATEGORY_PATH.search(parts.path):
+            links.append(parts._replace(query="", fragment="").geturl())
+    return links
+
+
+@metrics.timed("extract", scraper=SOURCE, page="detail")
+def product_specifications(tree):
+    """{label: value} from the specification rows of a product detail page."""
+    specs = {}
+    pairs = [row.xpath("th|td") for row in tree.xpath(SPEC_ROW_XPATH)]
+    pairs += [(term, term.getnext()) for term in tree.xpath(SPEC_TERM_XPATH)]
+    for label_cell, value_cell in pairs:
+        label = element_text(label_cell).rstrip(":").strip()
+        value = element_text(value_cell)
+        if label and value and label not in specs:
+            specs[label] = value
+    return specs
+
+
+class TroemnerCatalogCrawler:
+    """Concurrent, resumable crawl of every Troemner category listing (and product pages)."""
+
+    def __init__(self, root_url=ROOT_URL, workers=4, fetch_details=False, use_browser=True,
+                 output="output/troemner_catalog.csv", details_output="output/troemner_details.jsonl",
+                 frontier_path="output/troemner_frontier.json", resume=False, pool=None):
+        self.root_url = root_url
+        self.workers = workers
+        self.fetch_details = fetch_details
+        self.use_browser = use_browser  # render listings that aren't server-rendered in a browser tab
+        self.pool = pool or get_driver_pool(headless=True, profile="troemner")
+        self.frontier = Frontier(frontier_path, reset=not resume)
+        self.sink = open_sink(output, resume=resume, key_fields=["productURL"])
+        self.details_sink = open_sink(details_output, resume=resume, key_fields=["productURL"]) if fetch_details else None
+
+    def _page_tree(self, url):
+        """Static tree of ``url``; rendered in a pooled browser when plain HTTP fails."""
+        tree = fetch_tree(url)
+        if tree is not None or not self.use_browser:
+            return tree
+        with self.pool.lease() as driver:
+            self.pool.load(driver, url)
+            return parse_html(driver.page_source, base_url=url)
+
+    def discover_categories(self):
+        """Queue the categories linked from the site navigation; returns how many were new."""
+        tree = self._page_tree(self.root_url)
+        if tree is None:
+            print(f"[ERROR] Could not load {self.root_url}")
+            return 0
+        added = sum(self.frontier.add(url, "category") for url in category_links(tree, self.root_url))
+        print(f"[INFO] Discovered {added} categories from the navigation")
+        return added
+
+    def _crawl_category(self, url):
+        """Worker: (product records, sub-category URLs) of one category."""
+        scraper = troemner.TroemnerScraper(pool=self.pool)
+        try:
+            tree = fetch_tree(url)
+            links = category_links(tree, self.root_url) if tree is not None else []
+            loaded = tree is not None and tree.xpath(troemner.PRODUCT_XPATH) and scraper.load_listing_pages(url)
+            if not loaded and self.use_browser:
+                # Listing built by JavaScript (or not paginated over HTTP), or a parent category without products
+                try:
+                    scraper.open_website(url)
+                    scraper.scroll_and_load()
+                    scraper.scrape_products()
+                except TimeoutException:
+                    pass  # no product grid: only its sub-categories matter
+                if scraper.driver is not None:
+                    links = category_links(parse_html(scraper.driver.page_source, base_url=url), self.root_url)
+            return [{**record, "category": url} for record in scraper.data], links
+        finally:
+            scraper.close()
+
+    def _crawl_detail(self, url):
+        """Worker: specification record of one product page."""
+        tree = fetch_tree(url)
+        if tree is None:
+            raise RuntimeError("detail page could not be fetched")
+        specs = product_specifications(tree)
+        return {"productURL": url, "specCount": len(specs), "specifications": specs}
+
+    def _handle_category(self, url, result):
+        records, links = result
+        new_categories = sum(self.frontier.add(link, "category") for link in links)
+        new_products = [r for r in records if self.frontier.add(r["productURL"], "product", category=url)]
+        self.sink.write_many(new_products)
+        metrics.count("rows", len(new_products), scraper=SOURCE)
+        self.frontier.mark_done(url, products=len(records))
+        print(f"[INFO] {url}: {len(records)} products ({len(new_products)} new), {new_categories} new categories")
+
+    def _handle_detail(self, url, record):
+        self.details_sink.write(record)
+        self.frontier.mark_done(url, specs=record["specCount"])
+
+    def _run_stage(self, kind, worker, handle, save_every=1):
+        """Crawl pending ``kind`` URLs until none are left (handlers may queue more)."""
+        done = 0
+        attempted = set()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                batch = [key for key in self.frontier.pending(kind) if key not in attempted]
+                if not batch:
+                    break
+                attempted.update(batch)
+                urls = [self.frontier.get(key)["url"] for key in batch]
+                futures = {executor.submit(worker, url): url for url in urls}
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        handle(url, future.result())
+                    except Exception as e:
+                        print(f"[WARN] {kind} {url} failed: {e}")
+                        self.frontier.mark_failed(url, e)
+                    done += 1
+                    if done % save_every == 0:
+                        self._checkpoint()
+        self._checkpoint()
+        return done
+
+    def _checkpoint(self):
+        """Flush the rows before saving the frontier, so no URL is marked done without its rows on disk."""
+        self.sink.flush()
+        if self.details_sink is not None:
+            self.details_sink.flush()
+        self.frontier.save()
+
+    def run(self):
+        """Discover, crawl every category and (optionally) every product page; returns the frontier counts."""
+        if not self.frontier.urls:
+            self.discover_categories()
+        with metrics.timer("scrape", scraper=SOURCE, phase="categories"):
+            self._run_stage("category", self._crawl_category, self._handle_category)
+        if self.fetch_details:
+            with metrics.timer("scrape", scraper=SOURCE, phase="details"):
+                self._run_stage("product", self._crawl_detail, self._handle_detail, save_every=25)
+        counts = self.frontier.counts()
+        print(f"[INFO] Frontier: {counts}")
+        return counts
+
+    def close(self):
+        """Flush the sinks and save the frontier."""
+        self._checkpoint()
+        self.sink.close()
+        if self.details_sink is not None:
+            self.details_sink.close()
+
+
+# Usage
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", default=ROOT_URL)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--details", action="store_true", help="also fetch every product page's specifications")
+    parser.add_argument("--no-browser", action="store_true", help="plain HTTP only")
+    parser.add_argument("--resume", action="store_true", help="continue the previous run's frontier")
+    parser.add_argument("--output", default="output/troemner_catalog.csv")
+    parser.add_argument("--details-output", default="output/troemner_details.jsonl")
+    parser.add_argument("--frontier", default="output/troemner_frontier.json")
+    args = parser.parse_args()
+
+    crawler = TroemnerCatalogCrawler(args.root, args.workers, args.details, not args.no_browser,
+                                     args.output, args.details_output, args.frontier, args.resume)
+    try:
+        crawler.run()
+    finally:
+        crawler.close()
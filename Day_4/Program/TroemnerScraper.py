@@ -5,77 +5,207 @@ OIML Calibration Weight Sets listing page. It extracts the following fields:
 
 - vendor (fixed as "Troemner")
 - productName
-- model
+- model (as shown, e.g. "(80780388)") and modelNumber ("80780388")
 - description
 - productURL
-- cost
+- cost (as shown, e.g. "$3,150.00"), price (3150.0) and currency ("USD")
 
 The results are stored in a pandas DataFrame and exported to CSV.
 """
 
+import os
+import re
+import sys
 import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import pandas as pd
-from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from scraper_utils.columnar import write_parquet
+from scraper_utils.driver_pool import get_driver_pool
+from scraper_utils.http_fetch import StaticPage, fetch_tree, parse_html
+from scraper_utils.metrics import metrics
+from scraper_utils.replay import record_page, replay_page
+from scraper_utils.scraper_mixin import ScraperMixin
 
-class TroemnerScraper:
+PRODUCT_XPATH = "//h3[@class='title text-left hover-highlight header-padding headerGtmEvent']"
+
+# Label for this scraper's metrics
+SOURCE = "troemner"
+
+# Typed columns for Parquet output
+PARQUET_COLUMNS = {"decimal_columns": ["price"], "dictionary_columns": ["vendor", "currency"]}
+
+# "$3,150.00", "USD 3,150.00", "3150 EUR": an amount (thousands separators allowed) right next to a
+# currency symbol or code; a bare number ("ships in 2 weeks", "SALE 99.00") is not a price
+AMOUNT = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+CURRENCY = r"[$\u20ac\u00a3\u00a5]|\b(?:USD|EUR|GBP|JPY|CAD|AUD|CHF|CNY|MXN)\b"
+PRICE_PATTERN = re.compile(
+    rf"(?P<prefix>{CURRENCY})\s*(?P<amount>{AMOUNT})|(?P<suffixed>{AMOUNT})\s*(?P<suffix>{CURRENCY})"
+)
+CURRENCY_SYMBOLS = {"$": "USD", "\u20ac": "EUR", "\u00a3": "GBP", "\u00a5": "JPY"}
+
+# "(80780388)" -> "80780388"
+MODEL_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9./-]*")
+
+# Counts product headings in the page without a round trip per element
+PRODUCT_COUNT_JS = (
+    "return document.evaluate(arguments[0], document, null, "
+    "XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;"
+)
+
+
+def parse_price(text):
+    """(amount as float, ISO currency code) for a price label; (None, "") without an amount in a currency."""
+    match = PRICE_PATTERN.search(text or "")
+    if not match:
+        return None, ""
+    code = match.group("prefix") or match.group("suffix")
+    amount = match.group("amount") or match.group("suffixed")
+    return float(amount.replace(",", "")), CURRENCY_SYMBOLS.get(code, code)
+
+
+def model_number(text):
+    """Model number without the brackets and spacing of the listing label."""
+    match = MODEL_PATTERN.search(text or "")
+    return match.group() if match else ""
+
+
+class TroemnerScraper(ScraperMixin):
     """Scraper for Troemner product listings."""
 
-    def __init__(self, headless=True):
+    SOURCE = SOURCE
+
+    def __init__(self, headless=True, pool=None, sink=None):
         """Initialize scraper and WebDriver."""
         self.headless = headless
-        self.driver = self._setup_driver()
-        self.wait = WebDriverWait(self.driver, 15)
+        self.pool = pool or get_driver_pool(headless=headless, profile=SOURCE)
+        self.driver = None
+        self.wait = None
+        self.page = None  # WebDriver, or an archived StaticPage when replaying
+        self.url = None
+        self.sink = sink  # optional scraper_utils.sinks sink: rows are streamed to it instead of kept in self.data
         self.data = []
+        self.seen_urls = set()  # product URLs already emitted, across listing pages
         self.vendor = "Troemner"
 
-    def _setup_driver(self):
-        """Set up Chrome WebDriver."""
-        chrome_options = Options()
-        if self.headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920x1080")
-        chrome_options.add_argument("--log-level=3")
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=chrome_options)
-
     def open_website(self, url):
-        """Open the website and wait for products."""
-        self.driver.get(url)
-        self.wait.until(EC.presence_of_element_located(
-            (By.XPATH, "//h3[@class='title text-left hover-highlight header-padding headerGtmEvent']"))
-        )
-
-    def scroll_and_load(self):
-        """Scroll to load all products."""
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        while True:
+        """Open the website and wait for products (or read it from the archive when replaying)."""
+        self.url = url
+        self.page = replay_page(url)
+        if self.page is not None:
+            return
+        self._ensure_driver()
+        self.pool.load(self.driver, url)
+        with metrics.timer("wait", scraper=SOURCE):
+            self.wait.until(EC.presence_of_element_located((By.XPATH, PRODUCT_XPATH)))
+        self.page = self.driver
+
+    def _product_count(self):
+        """Number of product headings currently in the DOM."""
+        return self.driver.execute_script(PRODUCT_COUNT_JS, PRODUCT_XPATH)
+
+    @metrics.timed("scroll", scraper=SOURCE)
+    def scroll_and_load(self, poll_interval=0.2, idle_timeout=3, max_wait=120):
+        """Scroll until no new products arrive within ``idle_timeout`` seconds.
+
+        Instead of sleeping a fixed time per scroll, each scroll waits (polling
+        every ``poll_interval`` seconds) only until the product count grows, so
+        the loop runs as fast as the server delivers pages. ``max_wait`` caps
+        the whole loop.
+        """
+        if self.driver is None:
+            return 0  # replayed page: already fully loaded when it was recorded
+        count = self._product_count()
+        deadline = time.monotonic() + max_wait
+        while time.monotonic() < deadline:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
+            try:
+                WebDriverWait(self.driver, idle_timeout, poll_frequency=poll_interval).until(
+                    lambda d: self._product_count() > count
+                )
+            except TimeoutException:
+                break  # nothing new arrived: the listing is complete
+            count = self._product_count()
+        return count
+
+    def load_listing_pages(self, url, max_pages=50):
+        """Read the listing through its server-rendered ``?page=N`` pages over plain HTTP.
+
+        Returns the number of products added; 0 means the listing isn't
+        available without JavaScript and the browser path should be used.
+        A server that ignores ``?page=N`` answers every page with the first
+        one, so page 0 is only emitted once page 1 turned out to hold other
+        products (or not to exist); otherwise nothing is emitted and 0 is
+        returned.
+        """
+        added = 0
+        pending = None  # page 0, held back until pagination is confirmed
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query))
+
+        for page_number in range(max_pages):
+            query["page"] = str(page_number)
+            page_url = urlunsplit(parts._replace(query=urlencode(query)))
+            tree = fetch_tree(page_url, expected_xpath=PRODUCT_XPATH)
+            if tree is None:
                 break
-            last_height = new_height
+            page = StaticPage(tree, page_url)
+
+            if page_number == 0:
+                pending = page
+                continue
+            if page_number == 1:
+                if not self._product_urls(page) - self._product_urls(pending):
+                    print(f"[WARN] {url} ignores ?page=N, the listing needs the browser")
+                    return 0
+                added += self._extract_products(pending)
+                pending = None
+
+            new = self._extract_products(page)
+            if not new:
+                break  # page repeated the previous one or was empty: past the last page
+            added += new
+
+        if pending is not None:
+            added += self._extract_products(pending)  # single-page listing
+        return added
+
+    def _product_urls(self, page):
+        """Links inside the product tiles of a static page."""
+        return {link.get_attribute("href") for link in page.find_elements(By.XPATH, PRODUCT_XPATH + "//a")}
 
     def scrape_products(self):
         """Scrape product data from listing page."""
-        products = self.driver.find_elements(
-            By.XPATH, "//h3[@class='title text-left hover-highlight header-padding headerGtmEvent']"
-        )
+        record_page(self.url, self.page)  # fully scrolled DOM, when recording
+        self._extract_products(self.page)
+
+    def _snapshot(self, page):
+        """Parse a browser's DOM once, so the per-product XPaths run in lxml instead of as WebDriver calls."""
+        if isinstance(page, StaticPage):
+            return page
+        url = page.current_url
+        return StaticPage(parse_html(page.page_source, base_url=url), url)
+
+    @metrics.timed("extract", scraper=SOURCE)
+    def _extract_products(self, page):
+        """Emit one record per product on ``page`` not seen yet; returns how many were new."""
+        products = self._snapshot(page).find_elements(By.XPATH, PRODUCT_XPATH)
         print(f"Found {len(products)} products")
+        records = []
 
         for product in products:
             try:
                 link_elem = product.find_element(By.XPATH, ".//a")
                 product_name = link_elem.text.strip()
                 product_url = link_elem.get_attribute("href")
+                if product_url in self.seen_urls:
+                    continue
+                self.seen_urls.add(product_url)
 
                 model_elem = product.find_element(By.XPATH, ".//span[@class='code hover-highlight hidden-xs']")
                 model = model_elem.text.strip()
@@ -85,34 +215,47 @@ class TroemnerScraper:
 
                 price_elem = product.find_element(By.XPATH, "../following-sibling::div//span[@class='priceValue']")
                 cost = price_elem.text.strip()
+                price, currency = parse_price(cost)
 
-                self.data.append({
+                records.append({
                     "vendor": self.vendor,
                     "productName": product_name,
                     "model": model,
+                    "modelNumber": model_number(model),
                     "description": description,
                     "productURL": product_url,
-                    "cost": cost
+                    "cost": cost,
+                    "price": price,
+                    "currency": currency,
                 })
             except Exception as e:
                 print("Error scraping one product:", e)
 
+        self._emit(records)
+        return len(records)
+
+    @metrics.timed("save", scraper=SOURCE)
     def save_to_csv(self, filename="troemner_products.csv"):
         """Save scraped data to CSV."""
-        df = pd.DataFrame(self.data)
+        df = pd.DataFrame(self._rows())
         df.to_csv(filename, index=False)
         print(f"Saved {len(df)} products to {filename}")
         return df
 
-    def close(self):
-        """Close WebDriver."""
-        self.driver.quit()
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_parquet(self, filename="troemner_products.parquet"):
+        """Save scraped data as typed Parquet (price as decimal, vendor and currency dictionary-encoded)."""
+        return write_parquet(pd.DataFrame(self._rows()), filename, **PARQUET_COLUMNS)
 
 # Usage
-scraper = TroemnerScraper(headless=False)
-scraper.open_website("https://www.troemner.com/Calibration-Weights/Balance-Calibration-Weights/OIML-Calibration-Weight-Sets/c/3944")
-scraper.scroll_and_load()
-scraper.scrape_products()
-df = scraper.save_to_csv("troemner_products.csv")
-scraper.close()
-
+if __name__ == "__main__":
+    url = "https://www.troemner.com/Calibration-Weights/Balance-Calibration-Weights/OIML-Calibration-Weight-Sets/c/3944"
+    scraper = TroemnerScraper(headless=False)
+    if not scraper.load_listing_pages(url):
+        # Listing needs JavaScript: fall back to the browser and infinite scroll
+        scraper.open_website(url)
+        scraper.scroll_and_load()
+        scraper.scrape_products()
+    df = scraper.save_to_csv("troemner_products.csv")
+    scraper.save_to_parquet("troemner_products.parquet")
+    scraper.close()
@@ -1,79 +1,94 @@
+import os
 import re
+import sys
 import pandas as pd
-from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from scraper_utils.dates import DateNormalizer
+from scraper_utils.driver_pool import get_driver_pool
+from scraper_utils.eol_store import eol_record, number_repeats, store_records
+from scraper_utils.metrics import metrics
+from scraper_utils.replay import record_page
+from scraper_utils.scraper_mixin import ScraperMixin
+from scraper_utils.table_extract import extract_tables, section_rows, td_cells
 
-class PaloAltoScraper:
+# Label for this scraper's metrics
+SOURCE = "palo_alto_software_eol"
+
+# Vendor the rows are stored under in the EOL store
+VENDOR = "Palo Alto"
+
+# Typed columns for Parquet output
+PARQUET_COLUMNS = {"date_columns": ["Release Date", "EOL Date"], "dictionary_columns": ["Software Name"]}
+
+# Output columns, so a run without rows still yields a well-formed frame
+COLUMNS = ["Software Name", "Version", "Release Date", "EOL Date"]
+
+# Columns that identify a row across runs for delta output
+DELTA_KEY_COLUMNS = ["Software Name", "Version"]
+
+
+class PaloAltoScraper(ScraperMixin):
     """Scraper for Palo Alto Software End-of-Life tables using XPath only."""
 
-    def __init__(self, headless=True):
+    SOURCE = SOURCE
+    WAIT_TIMEOUT = 20
+    STATIC_XPATH = "//div[@class='text baseComponent parbase section']//table"
+    READY_XPATH = "//div[@class='mainParsys parsys']"
+
+    def __init__(self, headless=True, pool=None, fetch_mode="browser", state=None, sink=None):
         self.headless = headless
-        self.driver = self._setup_driver()
-        self.wait = WebDriverWait(self.driver, 20)
+        self.fetch_mode = fetch_mode  # "browser", or "http" to try plain HTTP + lxml first
+        self.pool = pool or get_driver_pool(headless=headless, profile=SOURCE)
+        self.driver = None
+        self.wait = None
+        self.page = None  # WebDriver or StaticPage the XPath lookups run against
+        self.url = None
+        self.state = state  # optional CrawlState: only emit tables/rows changed since the last run
+        self.sink = sink  # optional scraper_utils.sinks sink: rows are streamed to it instead of kept in self.data
         self.data = []
-
-    def _setup_driver(self):
-        chrome_options = Options()
-        if self.headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920x1080")
-        chrome_options.add_argument("--log-level=3")
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=chrome_options)
-
-    def open_website(self, url):
-        self.driver.get(url)
-        self.wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='mainParsys parsys']")))
+        self.dates = DateNormalizer()
 
     def format_date(self, date_str):
-        """Convert many date formats to yyyy-mm-dd."""
-        if not date_str or date_str.strip() == "":
-            return ""
-        date_str = date_str.strip()
-
-        # Try multiple formats
-        fmts = ["%m/%d/%Y", "%m/%d/%y", "%B %d, %Y", "%b %d, %Y", "%Y-%m-%d"]
-        for fmt in fmts:
-            try:
-                return datetime.strptime(date_str, fmt).strftime("%Y-%m-%d")
-            except:
-                continue
-        return date_str  # return as-is if parsing fails
+        """Convert many date formats to yyyy-mm-dd (as-is if parsing fails)."""
+        return self.dates(date_str)
 
+    @metrics.timed("extract", scraper=SOURCE)
     def scrape_tables(self):
         """Scrape software tables with regex-based column detection."""
+        if self.page is None:
+            return  # page unchanged since the last incremental run
+        record_page(self.url, self.page)  # rendered DOM, when recording
 
-        tables = self.driver.find_elements(By.XPATH, "//div[@class='text baseComponent parbase section']//table")
+        tables = extract_tables(self.page, "//div[@class='text baseComponent parbase section']//table")
         prev_software_name = ""
 
         for t_index, table in enumerate(tables, start=1):
+            body_rows = section_rows(table, "tbody")
+            head_rows = section_rows(table, "thead")
+
             # --- Software Name ---
-            try:
-                software_name = table.find_element(By.XPATH, ".//tbody/tr[2]/td/p/b").text.strip()
-            except:
-                try:
-                    software_name = table.find_element(By.XPATH, ".//thead/tr[2]/th/p/b").text.strip()
-                except:
-                    software_name = ""
+            software_name = ""
+            for rows, tag in ((body_rows, "td"), (head_rows, "th")):
+                if len(rows) > 1:
+                    names = [b for cell in rows[1]["cells"] if cell["tag"] == tag for b in cell["b"] if b]
+                    if names:
+                        software_name = names[0]
+                        break
 
             if not software_name:
                 software_name = prev_software_name if prev_software_name else f"Unknown_Table_{t_index}"
 
             prev_software_name = software_name
 
+            if self.state is not None and not self.state.table_changed(self.url, t_index, table):
+                continue  # identical to the last run, skip parsing
+
             # --- Column Headings ---
             col_map = {"version": None, "release": None, "eol": None}
-            headings = table.find_elements(By.XPATH, ".//tbody/tr[3]/td/b")
+            headings = [b for cell in td_cells(body_rows[2]) for b in cell["b"]] if len(body_rows) > 2 else []
             for idx, h in enumerate(headings):
-                h_text = h.text.strip().lower()
+                h_text = h.lower()
                 if re.search(r"version", h_text):
                     col_map["version"] = idx
                 elif re.search(r"release", h_text):
@@ -82,20 +97,20 @@ class PaloAltoScraper:
                     col_map["eol"] = idx
 
             # --- Data Rows ---
-            rows = table.find_elements(By.XPATH, ".//tbody/tr")
-            for row in rows:
-                cols = row.find_elements(By.XPATH, ".//td")
+            records = []
+            for row in body_rows:
+                cols = td_cells(row)
                 if not cols:
                     continue
 
                 # skip heading row
-                if any(c.find_elements(By.XPATH, ".//b") for c in cols):
+                if any(c["b"] for c in cols):
                     continue
 
                 def safe_get(col_key):
                     idx = col_map.get(col_key)
                     if idx is not None and idx < len(cols):
-                        return cols[idx].text.strip()
+                        return cols[idx]["text"]
                     return ""
 
                 version = safe_get("version")
@@ -109,29 +124,55 @@ class PaloAltoScraper:
                 if not any([version, release_date, eol_date]):
                     continue  # skip empty rows
 
-                self.data.append({
+                records.append({
                     "Software Name": software_name,
                     "Version": version,
                     "Release Date": release_date,
                     "EOL Date": eol_date
                 })
 
-    def to_dataframe(self):
-        return pd.DataFrame(self.data, columns=["Software Name", "Version", "Release Date", "EOL Date"])
-
-    def save_to_csv(self, filename="paloalto_software_eol3.csv"):
-        df = self.to_dataframe()
-        df.to_csv(filename, index=False)
-        return filename
-
-    def close(self):
-        self.driver.quit()
+            if self.state is not None:
+                records = self.state.changed_rows(self.url, t_index, records)
+            self._emit(records)
 
-
-scraper = PaloAltoScraper(headless=True)
-scraper.open_website("https://www.paloaltonetworks.com/services/support/end-of-life-announcements/end-of-life-summary")
-scraper.scrape_tables()
-df = scraper.to_dataframe()
-print(df.head(20))   # preview
-scraper.save_to_csv("paloalto_software_eol3.csv")
-scraper.close()
+    def to_dataframe(self):
+        return pd.DataFrame(self._rows(), columns=COLUMNS)
+
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_csv(self, filename="paloalto_software_eol3.csv", delta=False):
+        """Save the data to CSV (plus a delta file when delta=True); incremental runs write ``*_changes.csv``."""
+        return self._write_csv(self.to_dataframe(), filename, delta, DELTA_KEY_COLUMNS)
+
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_parquet(self, filename="paloalto_software_eol3.parquet"):
+        """Save the data as typed Parquet (dates as date32, names dictionary-encoded)."""
+        return self._write_parquet(self.to_dataframe(), filename, **PARQUET_COLUMNS)
+
+    def to_eol_records(self):
+        """Rows for the EOL store, one per software version (section title rows are skipped).
+
+        Some tables list the same version more than once (the Panorama plugins
+        share version numbers); ``number_repeats`` keeps every one of them.
+        """
+        return number_repeats(
+            eol_record(VENDOR, row["Software Name"], row["Version"], row["EOL Date"], row["Release Date"],
+                       source=SOURCE, extra=row)
+            for row in self._rows() if row.get("Version")
+        )
+
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_store(self, store=None):
+        """Upsert the rows into the local EOL store (``output/eol.sqlite`` unless ``store`` is given)."""
+        return store_records(self.to_eol_records(), store)
+
+
+if __name__ == "__main__":
+    scraper = PaloAltoScraper(headless=True, fetch_mode="http")
+    scraper.open_website("https://www.paloaltonetworks.com/services/support/end-of-life-announcements/end-of-life-summary")
+    scraper.scrape_tables()
+    df = scraper.to_dataframe()
+    print(df.head(20))   # preview
+    scraper.save_to_csv("paloalto_software_eol3.csv")
+    scraper.save_to_parquet("paloalto_software_eol3.parquet")
+    scraper.save_to_store()
+    scraper.close()
@@ -1,112 +1,154 @@
+import os
+import sys
 import time
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from datetime import datetime
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from scraper_utils.dates import DateNormalizer
+from scraper_utils.driver_pool import get_driver_pool
+from scraper_utils.eol_store import eol_record, number_repeats, store_records
+from scraper_utils.metrics import metrics
+from scraper_utils.replay import record_page
+from scraper_utils.scraper_mixin import ScraperMixin
+from scraper_utils.table_extract import extract_tables, section_rows, td_cells
 
-class PaloAltoScraper:
+# Label for this scraper's metrics
+SOURCE = "palo_alto_software_eol_summary"
+
+# Vendor the rows are stored under in the EOL store
+VENDOR = "Palo Alto"
+
+# Typed columns for Parquet output
+PARQUET_COLUMNS = {"date_columns": ["Release Date", "EOL Date"], "dictionary_columns": ["Software Name"]}
+
+# Output columns, so a run without rows still yields a well-formed frame
+COLUMNS = ["Software Name", "Version", "Release Date", "EOL Date"]
+
+# Columns that identify a row across runs for delta output
+DELTA_KEY_COLUMNS = ["Software Name", "Version"]
+
+
+class PaloAltoScraper(ScraperMixin):
     """Scraper for Palo Alto Software End-of-Life product tables using XPath only."""
 
-    def __init__(self, headless=True):
+    SOURCE = SOURCE
+    STATIC_XPATH = "//div[@class='text baseComponent parbase section']//table"
+    READY_XPATH = "//div[@class='mainParsys parsys']"
+
+    def __init__(self, headless=True, pool=None, fetch_mode="browser", state=None, sink=None):
         self.headless = headless
-        self.driver = self._setup_driver()
-        self.wait = WebDriverWait(self.driver, 15)
+        self.fetch_mode = fetch_mode  # "browser", or "http" to try plain HTTP + lxml first
+        self.pool = pool or get_driver_pool(headless=headless, profile=SOURCE)
+        self.driver = None
+        self.wait = None
+        self.page = None  # WebDriver or StaticPage the XPath lookups run against
+        self.url = None
+        self.state = state  # optional CrawlState: only emit tables/rows changed since the last run
+        self.sink = sink  # optional scraper_utils.sinks sink: rows are streamed to it instead of kept in self.data
         self.data = []
-
-    def _setup_driver(self):
-        chrome_options = Options()
-        if self.headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920x1080")
-        chrome_options.add_argument("--log-level=3")
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=chrome_options)
-
-    def open_website(self, url):
-        self.driver.get(url)
-        self.wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='mainParsys parsys']")))
+        self.dates = DateNormalizer()
 
     def parse_date(self, date_str):
         """Convert to yyyy-mm-dd format, keep original if parsing fails."""
-        if not date_str or date_str.strip() == "":
-            return ""
-        for fmt in ["%B %d, %Y", "%b %d, %Y", "%Y-%m-%d"]:
-            try:
-                return datetime.strptime(date_str.strip(), fmt).strftime("%Y-%m-%d")
-            except:
-                continue
-        return date_str.strip()
+        return self.dates(date_str)
 
+    @metrics.timed("extract", scraper=SOURCE)
     def scrape_tables(self):
         """Scrape all software tables inside mainParsys."""
-        tables = self.driver.find_elements(By.XPATH, "//div[@class='text baseComponent parbase section']//table")
+        if self.page is None:
+            return  # page unchanged since the last incremental run
+        record_page(self.url, self.page)  # rendered DOM, when recording
 
-        for t_index, table in enumerate(tables, start=1):
-            # try software name from b-tag OR thead
-            try:
-                software_name = table.find_element(By.XPATH, ".//tbody/tr/td[@colspan='3']//b").text.strip()
-            except:
-                try:
-                    software_name = table.find_element(By.XPATH, ".//thead").text.strip()
-                except:
-                    software_name = f"Unknown_Table_{t_index}"
+        tables = extract_tables(self.page, "//div[@class='text baseComponent parbase section']//table")
 
-            rows = table.find_elements(By.XPATH, ".//tbody/tr")
+        for t_index, table in enumerate(tables, start=1):
+            rows = section_rows(table, "tbody")
+            head_rows = section_rows(table, "thead")
 
+            # try software name from b-tag OR thead
+            names = [b for row in rows for c in td_cells(row) if c["colspan"] == 3 for b in c["b"]]
+            if names:
+                software_name = names[0]
+            elif head_rows:
+                software_name = "\n".join(c["text"] for row in head_rows for c in row["cells"]).strip()
+            else:
+                software_name = f"Unknown_Table_{t_index}"
+
+            if self.state is not None and not self.state.table_changed(self.url, t_index, table):
+                continue  # identical to the last run, skip parsing
+
+            records = []
             # Special handling for 2nd table (QRadar SaaS Products)
             if "QRadar SaaS" in software_name or t_index == 2:
                 for row in rows:
-                    cols = row.find_elements(By.XPATH, ".//td")
-                    if len(cols) > 0:
-                        for col in cols:
-                            col_text = col.text.strip()
-                            if col_text and col_text != "EOL Date":
-                                self.data.append({
-                                    "Software Name": col_text,
-                                    "Version": "",
-                                    "Release Date": "",
-                                    "EOL Date": ""
-                                })
-                continue
+                    for col in td_cells(row):
+                        col_text = col["text"]
+                        if col_text and col_text != "EOL Date":
+                            records.append({
+                                "Software Name": col_text,
+                                "Version": "",
+                                "Release Date": "",
+                                "EOL Date": ""
+                            })
 
             # Normal tables
-            for row in rows:
-                cols = row.find_elements(By.XPATH, ".//td")
-                if len(cols) >= 3:
-                    version = cols[0].text.strip()
-                    release_date = self.parse_date(cols[1].text.strip())
-                    eol_date = self.parse_date(cols[2].text.strip())
-
-                    self.data.append({
-                        "Software Name": software_name,
-                        "Version": version,
-                        "Release Date": release_date,
-                        "EOL Date": eol_date
-                    })
+            else:
+                for row in rows:
+                    cols = td_cells(row)
+                    if len(cols) >= 3:
+                        version = cols[0]["text"]
+                        release_date = self.parse_date(cols[1]["text"])
+                        eol_date = self.parse_date(cols[2]["text"])
+
+                        records.append({
+                            "Software Name": software_name,
+                            "Version": version,
+                            "Release Date": release_date,
+                            "EOL Date": eol_date
+                        })
+
+            if self.state is not None:
+                records = self.state.changed_rows(self.url, t_index, records)
+            self._emit(records)
 
     def to_dataframe(self):
-        return pd.DataFrame(self.data)
-
-    def save_to_csv(self, filename="paloalto_software_eol.csv"):
-        df = self.to_dataframe()
-        df.to_csv(filename, index=False)
-        return filename
-
-    def close(self):
-        self.driver.quit()
-
-
-scraper = PaloAltoScraper(headless=True)
-scraper.open_website("https://www.paloaltonetworks.com/services/support/end-of-life-announcements/end-of-life-summary")
-scraper.scrape_tables()
-df = scraper.to_dataframe()
-print(df.head())   # preview
-scraper.save_to_csv("paloalto_software_eol.csv")
-scraper.close()
+        return pd.DataFrame(self._rows(), columns=COLUMNS)
+
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_csv(self, filename="paloalto_software_eol.csv", delta=False):
+        """Save the data to CSV (plus a delta file when delta=True); incremental runs write ``*_changes.csv``."""
+        return self._write_csv(self.to_dataframe(), filename, delta, DELTA_KEY_COLUMNS)
+
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_parquet(self, filename="paloalto_software_eol.parquet"):
+        """Save the data as typed Parquet (dates as date32, names dictionary-encoded)."""
+        return self._write_parquet(self.to_dataframe(), filename, **PARQUET_COLUMNS)
+
+    def to_eol_records(self):
+        """Rows for the EOL store, one per software version (section title rows are skipped).
+
+        Some tables list the same version more than once (the Panorama plugins
+        share version numbers); ``number_repeats`` keeps every one of them.
+        """
+        return number_repeats(
+            eol_record(VENDOR, row["Software Name"], row["Version"], row["EOL Date"], row["Release Date"],
+                       source=SOURCE, extra=row)
+            for row in self._rows() if row.get("Version")
+        )
+
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_store(self, store=None):
+        """Upsert the rows into the local EOL store (``output/eol.sqlite`` unless ``store`` is given)."""
+        return store_records(self.to_eol_records(), store)
+
+
+if __name__ == "__main__":
+    scraper = PaloAltoScraper(headless=True, fetch_mode="http")
+    scraper.open_website("https://www.paloaltonetworks.com/services/support/end-of-life-announcements/end-of-life-summary")
+    scraper.scrape_tables()
+    df = scraper.to_dataframe()
+    print(df.head())   # preview
+    scraper.save_to_csv("paloalto_software_eol.csv")
+    scraper.save_to_parquet("paloalto_software_eol.parquet")
+    scraper.save_to_store()
+    scraper.close()
@@ -1,122 +1,149 @@
+import os
+import sys
 import time
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from datetime import datetime
-import re
-
-
-class PaloAltoScraper:
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from scraper_utils.dates import DateNormalizer, normalize_date_column
+from scraper_utils.driver_pool import get_driver_pool
+from scraper_utils.eol_store import eol_record, store_records
+from scraper_utils.metrics import metrics
+from scraper_utils.replay import record_page
+from scraper_utils.scraper_mixin import ScraperMixin
+from scraper_utils.table_extract import extract_tables, section_rows, td_cells
+
+# Label for this scraper's metrics
+SOURCE = "palo_alto_hardware_eol"
+
+# Typed columns for Parquet output
+PARQUET_COLUMNS = {"date_columns": ["EOL Date"], "dictionary_columns": ["vendor"]}
+
+# Output columns, so a run without rows still yields a well-formed frame
+COLUMNS = ["vendor", "productName", "EOL Date", "resource", "Recommended replacement"]
+
+# Columns that identify a row across runs for delta output
+DELTA_KEY_COLUMNS = ["productName"]
+
+
+class PaloAltoScraper(ScraperMixin):
     """Scraper for Palo Alto hardware End-of-Life product data using XPath only."""
 
-    def __init__(self, headless=True):
+    SOURCE = SOURCE
+    # lxml adds no implicit <tbody>, so the static probe can't rely on one
+    STATIC_XPATH = "//table//tr"
+    READY_XPATH = "//tbody//tr"
+
+    def __init__(self, headless=True, pool=None, fetch_mode="browser", state=None, sink=None):
         """Initialize scraper with WebDriver and default settings."""
         self.headless = headless
-        self.driver = self._setup_driver()
-        self.wait = WebDriverWait(self.driver, 15)
+        self.fetch_mode = fetch_mode  # "browser", or "http" to try plain HTTP + lxml first
+        self.pool = pool or get_driver_pool(headless=headless, profile=SOURCE)
+        self.driver = None
+        self.wait = None
+        self.page = None  # WebDriver or StaticPage the XPath lookups run against
+        self.url = None
+        self.state = state  # optional CrawlState: only emit tables/rows changed since the last run
+        self.sink = sink  # optional scraper_utils.sinks sink: rows are streamed to it instead of kept in self.data
         self.data = []
+        self.dates = DateNormalizer()
         self.vendor = "Palo Alto"
 
-    def _setup_driver(self):
-        """Configure and return Chrome WebDriver."""
-        chrome_options = Options()
-        if self.headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920x1080")
-        chrome_options.add_argument("--log-level=3")
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=chrome_options)
-
-    def open_website(self, url):
-        """Open the target website and wait for table data to load."""
-        self.driver.get(url)
-        self.wait.until(EC.presence_of_element_located((By.XPATH, "//tbody//tr")))
-
     def _format_date(self, date_str):
         """Convert date to yyyy-mm-dd format (handles short/full month names and ordinals)."""
-        if not date_str:
-            return ""
-
-        # Remove ordinal suffixes (st, nd, rd, th)
-        clean_date = re.sub(r"(\d+)(st|nd|rd|th)", r"\1", date_str.strip())
-
-        # Try parsing with both short and full month formats
-        for fmt in ("%B %d, %Y", "%b %d, %Y"):  # January vs Jan
-            try:
-                return datetime.strptime(clean_date, fmt).strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        return date_str
+        return self.dates(date_str)
 
     def extract_table_headers(self):
         """Extract column names from table header (th tags) using XPath."""
-        headers = self.driver.find_elements(By.XPATH, "//thead//tr/th")
-        return [h.text.strip() for h in headers]
+        tables = extract_tables(self.page, "//table")
+        return [c["text"] for table in tables for row in section_rows(table, "thead") for c in row["cells"] if c["tag"] == "th"]
 
+    @metrics.timed("extract", scraper=SOURCE)
     def extract_data(self):
-        """Extract all product rows and store as dictionaries using XPath only."""
-        rows = self.driver.find_elements(By.XPATH, "//tbody/tr")
-
-        for row in rows:
-            tds = row.find_elements(By.XPATH, "./td")
-            if len(tds) < 6:   # Skip rows without enough columns
-                continue
-
-            # Product names (replace <br> with commas)
-            product_html = tds[0].get_attribute("innerHTML")
-            product_name = " ".join(product_html.replace("<br>", "\n").split()).strip('", ')
-
-            # EOL date
-            eol_date = self._format_date(tds[2].text.strip())
-
-            # Resource link
-            resource_link = (
-                tds[3].find_element(By.XPATH, ".//a").get_attribute("href")
-                if tds[3].find_elements(By.XPATH, ".//a") else ""
-            )
-
-            # Recommended replacement (replace <br> with commas)
-            replacement_html = tds[5].get_attribute("innerHTML")
-            replacement = " ".join(replacement_html.replace("<br>", "\n ").split()).strip()
-
-            # One row per original <tr>
-            record = {
-                "vendor": self.vendor,
-                "productName": product_name,
-                "EOL Date": eol_date,
-                "resource": resource_link,
-                "Recommended replacement": replacement
-            }
-            self.data.append(record)
-
+        """Extract all product rows and store as dictionaries from one table snapshot."""
+        if self.page is None:
+            return  # page unchanged since the last incremental run
+        record_page(self.url, self.page)  # rendered DOM, when recording
+
+        tables = extract_tables(self.page, "//table")
+        for t_index, table in enumerate(tables, start=1):
+            if self.state is not None and not self.state.table_changed(self.url, t_index, table):
+                continue  # identical to the last run, skip parsing
+
+            records = []
+            for row in section_rows(table, "tbody"):
+                tds = td_cells(row)
+                if len(tds) < 6:   # Skip rows without enough columns
+                    continue
+
+                # Product names (replace <br> with commas)
+                product_html = tds[0]["html"]
+                product_name = " ".join(product_html.replace("<br>", "\n").split()).strip('", ')
+
+                # EOL date
+                eol_date = self._format_date(tds[2]["text"])
+
+                # Resource link
+                resource_link = tds[3]["links"][0] if tds[3]["links"] else ""
+
+                # Recommended replacement (replace <br> with commas)
+                replacement_html = tds[5]["html"]
+                replacement = " ".join(replacement_html.replace("<br>", "\n ").split()).strip()
+
+                # One row per original <tr>
+                record = {
+                    "vendor": self.vendor,
+                    "productName": product_name,
+                    "EOL Date": eol_date,
+                    "resource": resource_link,
+                    "Recommended replacement": replacement
+                }
+                records.append(record)
+
+            if self.state is not None:
+                records = self.state.changed_rows(self.url, t_index, records)
+            self._emit(records)
 
     def to_dataframe(self):
         """Convert collected data to pandas DataFrame and format dates."""
-        df = pd.DataFrame(self.data)
-        if "EOL Date" in df.columns:
-            df["EOL Date"] = df["EOL Date"].apply(self._format_date)
+        df = pd.DataFrame(self._rows(), columns=COLUMNS)
+        df["EOL Date"] = normalize_date_column(df["EOL Date"])
         return df
 
-    def save_to_csv(self, filename="palo_alto_eol5.csv"):
-        """Save extracted data to CSV with formatted dates."""
-        df = self.to_dataframe()
-        df.to_csv(filename, index=False)
-        return filename
-
-    def close(self):
-        """Close the WebDriver."""
-        self.driver.quit()
-
-
-scraper = PaloAltoScraper(headless=True)
-scraper.open_website("https://www.paloaltonetworks.com/services/support/end-of-life-announcements/hardware-end-of-life-dates")
-scraper.extract_data()
-df = scraper.to_dataframe()
-scraper.save_to_csv("palo_alto_eol5.csv")
-scraper.close()
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_csv(self, filename="palo_alto_eol5.csv", delta=False):
+        """Save extracted data to CSV with formatted dates (plus a delta file when delta=True).
+
+        An incremental run (``state`` set) only holds changed rows; they go to
+        ``<filename>_changes.csv`` so the full snapshot stays complete.
+        """
+        return self._write_csv(self.to_dataframe(), filename, delta, DELTA_KEY_COLUMNS)
+
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_parquet(self, filename="palo_alto_eol5.parquet"):
+        """Save the data as typed Parquet (dates as date32, names dictionary-encoded)."""
+        return self._write_parquet(self.to_dataframe(), filename, **PARQUET_COLUMNS)
+
+    def to_eol_records(self):
+        """Rows for the EOL store, one per table row (SKU lists stay joined, as in the CSV)."""
+        return [
+            eol_record(row["vendor"], row["productName"], eol_date=row["EOL Date"],
+                       replacement=row["Recommended replacement"], resource=row["resource"],
+                       source=SOURCE, extra=row)
+            for row in self._rows()
+        ]
+
+    @metrics.timed("save", scraper=SOURCE)
+    def save_to_store(self, store=None):
+        """Upsert the rows into the local EOL store (``output/eol.sqlite`` unless ``store`` is given)."""
+        return store_records(self.to_eol_records(), store)
+
+
+if __name__ == "__main__":
+    scraper = PaloAltoScraper(headless=True, fetch_mode="http")
+    scraper.open_website("https://www.paloaltonetworks.com/services/support/end-of-life-announcements/hardware-end-of-life-dates")
+    scraper.extract_data()
+    df = scraper.to_dataframe()
+    scraper.save_to_csv("palo_alto_eol5.csv")
+    scraper.save_to_parquet("palo_alto_eol5.parquet")
+    scraper.save_to_store()
+    scraper.close()
@@ -0,0 +1,189 @@
+"""Deterministic HTML fixtures for the offline benchmarks.
+
+The pages mimic the markup each scraper's XPath expects and are filled from
+the CSV snapshots committed under ``Day_*/output`` (arXiv results, which
+have no snapshot, come from a seeded random generator). ``scale`` repeats
+the data to make larger pages. The same inputs always produce byte-identical
+files, so runs on different days are comparable.
+
+Layout written under ``out_dir``::
+
+    troemner/listing_<n>.html     product listing, one file per ?page=N
+    paloalto/software.html        software EOL summary
+    paloalto/hardware.html        hardware EOL dates
+    windows/client.html           supported Windows client versions
+    windows/windows11.html        Windows 11 release information
+    arxiv/search/index.html       arXiv search results
+"""
+
+import datetime
+import html
+import os
+import random
+
+import pandas as pd
+
+from scraper_utils.orchestrator import REPO_ROOT
+
+TROEMNER_CSV = os.path.join(REPO_ROOT, "Day_4", "output", "troemner_products.csv")
+PALO_ALTO_SOFTWARE_CSV = os.path.join(REPO_ROOT, "Day_5", "output", "paloalto_software_eol4.csv")
+PALO_ALTO_HARDWARE_CSV = os.path.join(REPO_ROOT, "Day_5", "output", "palo_alto_eol5.csv")
+WINDOWS_CLIENT_CSV = os.path.join(REPO_ROOT, "Day_3", "output", "combined_windows_tables.csv")
+WINDOWS_11_CSV = os.path.join(REPO_ROOT, "Day_3", "output", "combined_windows_tables2.csv")
+
+PRODUCTS_PER_PAGE = 24
+ARXIV_RESULTS = 50
+
+e = html.escape
+
+
+def _read(path):
+    return pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+
+
+def _scaled(df, scale, key_column):
+    """Repeat ``df`` ``scale`` times, suffixing ``key_column`` so copies stay distinct."""
+    if scale <= 1:
+        return df
+    copies = []
+    for copy in range(scale):
+        part = df.copy()
+        if copy:
+            part[key_column] = part[key_column] + f" #{copy + 1}"
+        copies.append(part)
+    return pd.concat(copies, ignore_index=True)
+
+
+def _vendor_date(value):
+    """ISO date as the vendor writes it ("August 13, 2025"); other text unchanged."""
+    try:
+        day = datetime.date.fromisoformat(value)
+    except ValueError:
+        return value
+    return f"{day.strftime('%B')} {day.day}, {day.year}"
+
+
+def _page(title, body):
+    return f"<!DOCTYPE html>\n<html><head><title>{e(title)}</title></head><body>\n{body}\n</body></html>\n"
+
+
+def _write(out_dir, relative_path, text):
+    path = os.path.join(out_dir, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(text)
+    return 1
+
+
+def troemner_pages(out_dir, scale=1):
+    df = _scaled(_read(TROEMNER_CSV), scale, "productURL")
+    pages = 0
+    for number, start in enumerate(range(0, len(df), PRODUCTS_PER_PAGE)):
+        items = []
+        for row in df.iloc[start:start + PRODUCTS_PER_PAGE].itertuples(index=False):
+            items.append(
+                '<div class="product-item"><div class="details">'
+                '<h3 class="title text-left hover-highlight header-padding headerGtmEvent">'
+                f'<a href="{e(row.productURL)}">{e(row.productName)}</a>'
+                f'<span class="code hover-highlight hidden-xs">{e(row.model)}</span></h3></div>'
+                f'<div class="body"><div class="description product-description">{e(row.description)}</div>'
+                f'<div class="price"><span class="priceValue">{e(row.cost)}</span></div></div></div>'
+            )
+        pages += _write(out_dir, f"troemner/listing_{number}.html", _page("Troemner", "\n".join(items)))
+    return pages
+
+
+def palo_alto_software_page(out_dir, scale=1):
+    df = _scaled(_read(PALO_ALTO_SOFTWARE_CSV), scale, "Software Name")
+    tables = []
+    for name, group in df.groupby("Software Name", sort=False):
+        rows = [
+            '<tr><td colspan="3">&nbsp;</td></tr>',
+            f'<tr><td colspan="3"><b>{e(name)}</b></td></tr>',
+            "<tr><td><b>Version</b></td><td><b>Release Date</b></td><td><b>End-of-Life Date</b></td></tr>",
+        ]
+        rows += [
+            f"<tr><td>{e(r.Version)}</td><td>{e(_vendor_date(r[2]))}</td><td>{e(_vendor_date(r[3]))}</td></tr>"
+            for r in group.itertuples(index=False)
+        ]
+        tables.append(f'<div class="text baseComponent parbase section"><table><tbody>{"".join(rows)}</tbody></table></div>')
+    body = f'<div class="mainParsys parsys">{"".join(tables)}</div>'
+    return _write(out_dir, "paloalto/software.html", _page("End-of-Life Summary", body))
+
+
+def palo_alto_hardware_page(out_dir, scale=1):
+    df = _scaled(_read(PALO_ALTO_HARDWARE_CSV), scale, "productName")
+    rows = [
+        "<tr>"
+        f"<td>{'<br>'.join(e(part.strip()) for part in r.productName.split(','))}</td>"
+        "<td>&nbsp;</td>"
+        f"<td>{e(_vendor_date(r[2]))}</td>"
+        f'<td><a href="{e(r.resource)}">Hardware reference</a></td>'
+        "<td>&nbsp;</td>"
+        f"<td>{e(r[4])}</td>"
+        "</tr>"
+        for r in df.itertuples(index=False)
+    ]
+    header = "".join(f"<th>{h}</th>" for h in ("Product", "EOS", "EOL Date", "Resources", "Notes", "Replacement"))
+    body = f"<table><thead><tr>{header}</tr></thead><tbody>{''.join(rows)}</tbody></table>"
+    return _write(out_dir, "paloalto/hardware.html", _page("Hardware End-of-Life Dates", body))
+
+
+def _release_tables(df):
+    """Split a combined Windows CSV back into tables of consecutive rows sharing columns."""
+    tables = []
+    columns = set()
+    rows = []
+    for row in df.to_dict("records"):
+        filled = {c for c, v in row.items() if v}
+        if rows and not (filled <= columns or columns <= filled):
+            tables.append((columns, rows))
+            columns, rows = set(), []
+        columns |= filled
+        rows.append(row)
+    if rows:
+        tables.append((columns, rows))
+    return [([c for c in df.columns if c in columns], rows) for columns, rows in tables]
+
+
+def windows_page(out_dir, csv_path, relative_path, scale=1):
+    df = _read(csv_path)
+    df = pd.concat([df] * max(scale, 1), ignore_index=True)
+    parts = []
+    for headers, rows in _release_tables(df):
+        head = "".join(f"<th>{e(h)}</th>" for h in headers)
+        body = "".join("<tr>" + "".join(f"<td>{e(row[h])}</td>" for h in headers) + "</tr>" for row in rows)
+        parts.append(f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>")
+    return _write(out_dir, relative_path, _page("Windows release health", "\n".join(parts)))
+
+
+def arxiv_page(out_dir, scale=1, seed=7):
+    rng = random.Random(seed)
+    words = ["learning", "crop", "yield", "neural", "soil", "sensor", "remote", "sensing", "graph", "transformer"]
+    items = []
+    for number in range(ARXIV_RESULTS * max(scale, 1)):
+        title = " ".join(rng.choice(words) for _ in range(6)).capitalize()
+        authors = ", ".join(f"A. Author{rng.randint(1, 999)}" for _ in range(rng.randint(1, 4)))
+        day = datetime.date(2020, 1, 1) + datetime.timedelta(days=rng.randint(0, 2000))
+        items.append(
+            '<li class="arxiv-result">'
+            f'<div class="is-marginless"><p class="list-title is-inline-block"><a href="https://arxiv.org/abs/2501.{number:05d}">arXiv:2501.{number:05d}</a></p></div>'
+            f'<p class="title is-5 mathjax">{e(title)}</p>'
+            f'<p class="authors"><span>Authors:</span> {e(authors)}</p>'
+            f'<p class="is-size-7"><span class="has-text-black-bis">Submitted</span> {day.day} {day.strftime("%B")}, {day.year}</p>'
+            "</li>"
+        )
+    body = f'<ol class="breathe-horizontal">{"".join(items)}</ol>'
+    return _write(out_dir, "arxiv/search/index.html", _page("arXiv search", body))
+
+
+def generate_fixtures(out_dir, scale=1):
+    """Write every fixture page under ``out_dir``; returns {fixture: pages written}."""
+    return {
+        "troemner": troemner_pages(out_dir, scale),
+        "palo_alto_software": palo_alto_software_page(out_dir, scale),
+        "palo_alto_hardware": palo_alto_hardware_page(out_dir, scale),
+        "windows_client": windows_page(out_dir, WINDOWS_CLIENT_CSV, "windows/client.html", scale),
+        "windows_11": windows_page(out_dir, WINDOWS_11_CSV, "windows/windows11.html", scale),
+        "arxiv": arxiv_page(out_dir, scale),
+    }
@@ -0,0 +1,67 @@
+"""Record the live pages the benchmark cases read, for ``benchmarks.run --snapshots``.
+
+Runs every case (or the named ones) once against its real URL with a
+``PageArchive`` in record mode, so the archive holds exactly the responses
+the HTTP extraction path fetches: every Troemner ``?page=N`` listing page,
+the Palo Alto and Windows release-health pages and one arXiv search. The
+archive is rewritten from scratch. Needs network access; run from the
+repository root and commit the archive together with a fresh baseline::
+
+    python -m benchmarks.record
+    python -m benchmarks.run --snapshots --save-baseline
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+from benchmarks.run import CASES, SNAPSHOT_ARCHIVE
+from scraper_utils.replay import PageArchive, set_archive
+
+
+def record_snapshots(path=SNAPSHOT_ARCHIVE, names=None):
+    """Run the cases against the live sites while recording; returns {case: rows}."""
+    if os.path.exists(path):
+        os.remove(path)
+    archive = PageArchive(path, "record")
+    set_archive(archive)
+    rows = {}
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)  # scrapers create their output/ folders here
+            try:
+                for name in names or CASES:
+                    run, _, live_url = CASES[name]
+                    rows[name] = run(live_url)
+                    print(f"[INFO] {name}: {rows[name]} rows from {live_url}")
+            finally:
+                os.chdir(cwd)
+    finally:
+        set_archive(None)
+    recorded = PageArchive(path, "replay")
+    print(f"[INFO] {len(recorded.urls())} pages recorded to {path}")
+    recorded.close()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cases", nargs="*", help=f"cases to record (default: all of {', '.join(CASES)})")
+    parser.add_argument("--archive", default=SNAPSHOT_ARCHIVE)
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+    rows = record_snapshots(args.archive, args.cases or None)
+    empty = [name for name, count in rows.items() if not count]
+    if empty:
+        print(f"[WARN] No rows for {', '.join(empty)}: check the pages before committing the archive")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""Offline benchmarks: run each scraper's HTTP extraction path against local pages.
+
+Two page sources:
+
+- the generated fixtures (default, see ``benchmarks.fixtures``), served on a
+  local port: synthetic markup filled with the committed CSV data, scalable
+  with ``--scale``;
+- ``--snapshots``: the live pages recorded by ``benchmarks.record`` into
+  ``benchmarks/snapshots.zip``, replayed under their real URLs, so the
+  numbers reflect the vendors' actual markup and page sizes.
+
+Per scraper it reports:
+
+- ``pages_per_sec`` and ``rows_per_sec`` from the median of ``--repeat`` timed runs,
+- ``peak_mb``, the tracemalloc peak of one extra run (tracing slows code
+  down, so it is kept out of the timed runs).
+
+Results can be compared with a stored baseline (one per page source);
+throughput that drops, or peak memory that grows, by more than
+``--threshold`` is flagged. Run from the repository root::
+
+    python -m benchmarks.run                  # compare with benchmarks/baseline.json
+    python -m benchmarks.run --save-baseline  # store this run as the baseline
+    python -m benchmarks.run --snapshots      # replay, compare with benchmarks/baseline_snapshots.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.fixtures import generate_fixtures
+from benchmarks.server import FixtureServer
+from scraper_utils.metrics import metrics
+from scraper_utils.orchestrator import (
+    PALO_ALTO_HARDWARE_URL, PALO_ALTO_SOFTWARE_URL, TROEMNER_URL, WINDOWS_11_URL, WINDOWS_CLIENT_URL,
+    load_scraper_module,
+)
+from scraper_utils.replay import PageArchive, set_archive
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+SNAPSHOT_ARCHIVE = os.path.join(BENCHMARKS_DIR, "snapshots.zip")
+SNAPSHOT_BASELINE_FILE = os.path.join(BENCHMARKS_DIR, "baseline_snapshots.json")
+
+ARXIV_URL = "https://arxiv.org/search/"
+
+
+# --- Cases: each runs one scraper against its page URL and returns its row count ---
+
+def bench_troemner(url):
+    scraper = load_scraper_module("Day_4/Program/TroemnerScraper.py").TroemnerScraper()
+    return scraper.load_listing_pages(url)
+
+
+def bench_palo_alto_software(url):
+    scraper = load_scraper_module("Day_5/Program/EOL_Summary_2ndScript.py").PaloAltoScraper(fetch_mode="http")
+    scraper.open_website(url)
+    scraper.scrape_tables()
+    return len(scraper.data)
+
+
+def bench_palo_alto_hardware(url):
+    scraper = load_scraper_module("Day_5/Program/PaloAltoScraper.py").PaloAltoScraper(fetch_mode="http")
+    scraper.open_website(url)
+    scraper.extract_data()
+    return len(scraper.to_dataframe())
+
+
+def bench_windows_client(url):
+    scraper = load_scraper_module("Day_3/Program/WindowsClientVersions.py").WindowsClientVersions(fetch_mode="http")
+    scraper.open_website(url)
+    return len(scraper.scrape_tables())
+
+
+def bench_windows_11(url):
+    scraper = load_scraper_module("Day_3/Program/Windows11ReleaseInfo.py").Windows11ReleaseInfo(fetch_mode="http")
+    scraper.open_website(url)
+    return len(scraper.scrape_tables())
+
+
+def bench_arxiv(url):
+    module = load_scraper_module("Day_2/Program/research_paper_scrapper.py")
+    scraper = module.ResearchPaperScraper(fetch_mode="http", arxiv_url=url)
+    return len(scraper.scrape_arxiv("machine learning agriculture", max_results=50))
+
+
+# name -> (runner(url), path on the fixture server, live URL recorded into the snapshots)
+CASES = {
+    "troemner": (bench_troemner, "/troemner/listing", TROEMNER_URL),
+    "palo_alto_software": (bench_palo_alto_software, "/paloalto/software", PALO_ALTO_SOFTWARE_URL),
+    "palo_alto_hardware": (bench_palo_alto_hardware, "/paloalto/hardware", PALO_ALTO_HARDWARE_URL),
+    "windows_client": (bench_windows_client, "/windows/client", WINDOWS_CLIENT_URL),
+    "windows_11": (bench_windows_11, "/windows/windows11", WINDOWS_11_URL),
+    "arxiv": (bench_arxiv, "/arxiv/search/", ARXIV_URL),
+}
+
+
+def _pages_loaded():
+    """Page loads (fetched or replayed) recorded since the last metrics reset."""
+    return sum(t["count"] for t in metrics.report()["timers"] if t["name"] == "page_load")
+
+
+def _run_once(case, url):
+    metrics.reset()
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        rows = case(url)
+        seconds = time.perf_counter() - started
+    return seconds, rows, _pages_loaded()
+
+
+def run_case(case, url, repeat=5):
+    """Median timing of ``repeat`` runs (after one warm-up) plus a traced run for peak memory."""
+    _run_once(case, url)
+    runs = [_run_once(case, url) for _ in range(repeat)]
+    seconds = statistics.median(r[0] for r in runs)
+    _, rows, pages = runs[-1]
+
+    tracemalloc.start()
+    try:
+        _run_once(case, url)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds": round(seconds, 6),
+        "pages": pages,
+        "rows": rows,
+        "pages_per_sec": round(pages / seconds, 2) if seconds else 0.0,
+        "rows_per_sec": round(rows / seconds, 2) if seconds else 0.0,
+        "peak_mb": round(peak / 2**20, 3),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Per-case change against the baseline; ``regression`` marks changes past ``threshold``."""
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        speed = result["pages_per_sec"] / base["pages_per_sec"] - 1 if base["pages_per_sec"] else 0.0
+        memory = result["peak_mb"] / base["peak_mb"] - 1 if base["peak_mb"] else 0.0
+        rows.append({
+            "case": name,
+            "pages_per_sec_change": f"{speed:+.1%}",
+            "peak_mb_change": f"{memory:+.1%}",
+            "regression": speed < -threshold or memory > threshold,
+        })
+    return pd.DataFrame(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline scraper benchmarks")
+    parser.add_argument("cases", nargs="*", help=f"cases to run (default: all of {', '.join(CASES)})")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=int, default=1, help="repeat the fixture data N times")
+    parser.add_argument("--snapshots", nargs="?", const=SNAPSHOT_ARCHIVE, metavar="ARCHIVE",
+                        help=f"replay recorded live pages (default archive: {SNAPSHOT_ARCHIVE}) instead of the fixtures")
+    parser.add_argument("--baseline", help=f"default: {BASELINE_FILE}, or {SNAPSHOT_BASELINE_FILE} with --snapshots")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown / memory growth")
+    parser.add_argument("--output", help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    names = args.cases or list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+    baseline_file = args.baseline or (SNAPSHOT_BASELINE_FILE if args.snapshots else BASELINE_FILE)
+    if args.snapshots and not os.path.exists(args.snapshots):
+        parser.error(f"no snapshot archive at {args.snapshots}; record one with python -m benchmarks.record")
+
+    results = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)  # scrapers create their output/ folders here
+        try:
+            if args.snapshots:
+                set_archive(PageArchive(args.snapshots, "replay"))
+                try:
+                    for name in names:
+                        run, _, live_url = CASES[name]
+                        results[name] = run_case(run, live_url, args.repeat)
+                        print(f"[INFO] {name}: {results[name]}")
+                finally:
+                    set_archive(None)
+            else:
+                fixtures = os.path.join(workdir, "fixtures")
+                generate_fixtures(fixtures, scale=args.scale)
+                with FixtureServer(fixtures) as server:
+                    for name in names:
+                        run, path, _ = CASES[name]
+                        results[name] = run_case(run, server.base_url + path, args.repeat)
+                        print(f"[INFO] {name}: {results[name]}")
+        finally:
+            os.chdir(cwd)
+
+    print(pd.DataFrame.from_dict(results, orient="index").to_string())
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+    if args.save_baseline:
+        with open(baseline_file, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+            fh.write("\n")
+        print(f"[INFO] Baseline saved to {baseline_file}")
+        return 0
+
+    if not os.path.exists(baseline_file):
+        print("[INFO] No baseline yet; run with --save-baseline to store one")
+        return 0
+    with open(baseline_file, "r", encoding="utf-8") as fh:
+        comparison = compare(results, json.load(fh), args.threshold)
+    print(comparison.to_string(index=False))
+    if not comparison.empty and comparison["regression"].any():
+        print(f"[WARN] Regression beyond {args.threshold:.0%} against {baseline_file}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Local HTTP server for the benchmark fixtures.
+
+Serves ``root`` on 127.0.0.1 with two routing rules so scrapers can use
+their normal URLs:
+
+- ``/path?page=N`` -> ``path_N.html`` (paginated listings),
+- ``/path`` -> ``path.html`` or ``path/index.html``; other query strings are ignored.
+
+Missing pages answer 404, which is how paginated scrapers find the end.
+"""
+
+import http.server
+import os
+import threading
+from urllib.parse import parse_qs, unquote, urlsplit
+
+
+class _FixtureHandler(http.server.BaseHTTPRequestHandler):
+    root = "."
+
+    def _resolve(self):
+        parts = urlsplit(self.path)
+        path = unquote(parts.path).strip("/")
+        page = parse_qs(parts.query).get("page")
+        candidates = [f"{path}_{page[0]}.html"] if page else [path, f"{path}.html", os.path.join(path, "index.html")]
+        for candidate in candidates:
+            full = os.path.normpath(os.path.join(self.root, candidate))
+            if full.startswith(os.path.abspath(self.root)) and os.path.isfile(full):
+                return full
+        return None
+
+    def do_GET(self):
+        path = self._resolve()
+        if path is None:
+            self.send_error(404)
+            return
+        with open(path, "rb") as fh:
+            body = fh.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # keep benchmark output readable
+
+
+class FixtureServer:
+    """Context manager running the fixture server in a background thread."""
+
+    def __init__(self, root):
+        handler = type("FixtureHandler", (_FixtureHandler,), {"root": os.path.abspath(root)})
+        self.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
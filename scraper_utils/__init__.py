@@ -0,0 +1 @@
+"""Shared helpers used by the scraper scripts in the Day_* folders."""
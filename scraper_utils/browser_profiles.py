@@ -0,0 +1,157 @@
+"""Per-source Chrome profiles that cut what the browser downloads.
+
+The scrapers only need each page's HTML and the scripts that build it, yet
+Chrome also fetches images, web fonts, video and a tail of analytics/ad
+hosts on the vendor pages. A ``BrowserProfile`` describes what one source
+can do without:
+
+- resource types to block (images, fonts, media), matched by file extension,
+- third-party hosts to block (analytics, tag managers, ads, chat widgets),
+- the page-load strategy (``eager`` returns at DOMContentLoaded instead of
+  waiting for every subresource; the scrapers wait for their own elements),
+- whether extensions are disabled.
+
+Blocking uses the DevTools ``Network.setBlockedURLs`` command, which takes
+URL patterns, so third-party traffic is blocked by a host list rather than
+by "everything not first-party". The driver pool applies a profile to every
+browser it starts and keeps one pool per profile::
+
+    pool = get_driver_pool(headless=True, profile="troemner")
+"""
+
+IMAGE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp"]
+FONT_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+MEDIA_PATTERNS = ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.m4a", "*.wav", "*.m3u8"]
+
+# Analytics, tag managers, ads, consent banners and chat widgets seen on the vendor pages
+THIRD_PARTY_HOSTS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "facebook.com",
+    "linkedin.com",
+    "licdn.com",
+    "twitter.com",
+    "ads-twitter.com",
+    "bat.bing.com",
+    "clarity.ms",
+    "hotjar.com",
+    "demdex.net",
+    "omtrdc.net",
+    "adobedtm.com",
+    "everesttech.net",
+    "optimizely.com",
+    "onetrust.com",
+    "cookielaw.org",
+    "qualtrics.com",
+    "drift.com",
+    "driftt.com",
+    "intercom.io",
+    "hubspot.com",
+    "hs-scripts.com",
+    "hs-analytics.net",
+    "newrelic.com",
+    "nr-data.net",
+    "youtube.com",
+    "ytimg.com",
+    "vimeo.com",
+]
+
+
+class BrowserProfile:
+    """Chrome options and request blocking for one kind of source."""
+
+    def __init__(self, name, block_images=True, block_fonts=True, block_media=True,
+                 block_third_party=True, extra_blocked=(), page_load_strategy="eager",
+                 disable_extensions=True):
+        self.name = name
+        self.block_images = block_images
+        self.block_fonts = block_fonts
+        self.block_media = block_media
+        self.block_third_party = block_third_party
+        self.extra_blocked = list(extra_blocked)  # more Network.setBlockedURLs patterns
+        self.page_load_strategy = page_load_strategy
+        self.disable_extensions = disable_extensions
+
+    def blocked_urls(self):
+        """URL patterns for ``Network.setBlockedURLs``."""
+        patterns = []
+        if self.block_images:
+            patterns += IMAGE_PATTERNS
+        if self.block_fonts:
+            patterns += FONT_PATTERNS
+        if self.block_media:
+            patterns += MEDIA_PATTERNS
+        if self.block_third_party:
+            for host in THIRD_PARTY_HOSTS:
+                patterns += [f"*://{host}/*", f"*://*.{host}/*"]
+        return patterns + self.extra_blocked
+
+    def apply_options(self, chrome_options):
+        """Set the start-up options of this profile on ``chrome_options``."""
+        chrome_options.page_load_strategy = self.page_load_strategy
+        if self.disable_extensions:
+            chrome_options.add_argument("--disable-extensions")
+        if self.block_images:
+            # Also skips decoding images that slip past the URL patterns (data: URIs, no extension)
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        return chrome_options
+
+    def apply(self, driver):
+        """Install the request blocking on a started driver (kept across navigations)."""
+        patterns = self.blocked_urls()
+        if not patterns:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except Exception as e:
+            print(f"[WARN] Could not apply browser profile '{self.name}': {e}")
+
+
+# Chrome as the scrapers used it before profiles: nothing blocked, wait for the full load
+DEFAULT_PROFILE = BrowserProfile(
+    "default", block_images=False, block_fonts=False, block_media=False,
+    block_third_party=False, page_load_strategy="normal", disable_extensions=False,
+)
+
+PROFILES = {
+    profile.name: profile
+    for profile in [
+        DEFAULT_PROFILE,
+        # Product listing: the lazy-loaded product images are the bulk of every scroll
+        BrowserProfile("troemner"),
+        # Static EOL tables behind a marketing page full of tags and video
+        BrowserProfile("palo_alto"),
+        # Release-health pages: tables are server-rendered, telemetry and media can go
+        BrowserProfile("windows"),
+        # CiteSeerX and CORE build results client-side from CDN scripts: keep third-party hosts
+        BrowserProfile("research_papers", block_third_party=False),
+    ]
+}
+
+# Scraper SOURCE labels -> profile name
+SOURCE_PROFILES = {
+    "troemner": "troemner",
+    "palo_alto_software_eol": "palo_alto",
+    "palo_alto_software_eol_summary": "palo_alto",
+    "palo_alto_hardware_eol": "palo_alto",
+    "windows_client": "windows",
+    "windows_11_release_info": "windows",
+    "research_papers": "research_papers",
+}
+
+
+def get_profile(profile=None):
+    """Resolve a profile, profile name or scraper SOURCE label; ``None`` is the default profile."""
+    if isinstance(profile, BrowserProfile):
+        return profile
+    if profile is None:
+        return DEFAULT_PROFILE
+    name = SOURCE_PROFILES.get(profile, profile)
+    if name not in PROFILES:
+        raise ValueError(f"Unknown browser profile {profile!r}; known: {', '.join(PROFILES)}")
+    return PROFILES[name]
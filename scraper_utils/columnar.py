@@ -0,0 +1,85 @@
+"""Typed Parquet output for the scraper datasets.
+
+CSV makes every consumer re-parse strings and dates. ``write_parquet``
+stores a DataFrame with real column types instead:
+
+- date columns as ``date32`` (values that aren't dates become null),
+- money columns as ``decimal128`` (``"$3,150.00"`` -> ``3150.00``),
+- everything else, versions included, as strings, so ``10.1`` never turns
+  into the float ``10.1`` and ``139.12.x.x`` survives as-is,
+- repeated labels (``vendor``, ``Software Name``, ...) dictionary-encoded,
+  which keeps files small and loads them as pandas categoricals.
+
+``pyarrow`` is imported lazily so the scrapers still run without it when
+only CSV output is needed.
+"""
+
+import datetime
+import decimal
+import os
+import re
+
+from scraper_utils.dates import normalize_date
+
+_AMOUNT = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def _is_missing(value):
+    # NaN and NaT are the values not equal to themselves
+    return value is None or (isinstance(value, (float, datetime.date)) and value != value)
+
+
+def to_date(value):
+    """``datetime.date`` for a vendor date string (or a datetime), or None if it isn't a date."""
+    if _is_missing(value):
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    try:
+        return datetime.date.fromisoformat(normalize_date(value))
+    except ValueError:
+        return None
+
+
+def to_decimal(value, scale=2):
+    """``Decimal`` rounded to ``scale`` places for an amount like ``"$1,234.50"``, or None."""
+    if _is_missing(value):
+        return None
+    match = _AMOUNT.search(str(value).replace(",", ""))
+    if not match:
+        return None
+    return decimal.Decimal(match.group()).quantize(decimal.Decimal(1).scaleb(-scale))
+
+
+def to_arrow_table(df, date_columns=(), decimal_columns=(), dictionary_columns=(), precision=18, scale=2):
+    """Convert ``df`` to a ``pyarrow.Table`` with the given typed columns; the rest are strings."""
+    import pyarrow as pa
+
+    arrays = []
+    for column in df.columns:
+        values = df[column].tolist()
+        if column in date_columns:
+            array = pa.array([to_date(v) for v in values], type=pa.date32())
+        elif column in decimal_columns:
+            array = pa.array([to_decimal(v, scale) for v in values], type=pa.decimal128(precision, scale))
+        else:
+            array = pa.array([None if _is_missing(v) else str(v) for v in values], type=pa.string())
+        if column in dictionary_columns:
+            array = array.dictionary_encode()
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, names=[str(column) for column in df.columns])
+
+
+def write_parquet(df, path, date_columns=(), decimal_columns=(), dictionary_columns=(), **kwargs):
+    """Write ``df`` to ``path`` as typed Parquet (see :func:`to_arrow_table`); returns the path."""
+    import pyarrow.parquet as pq
+
+    table = to_arrow_table(df, date_columns, decimal_columns, dictionary_columns, **kwargs)
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    pq.write_table(table, path, compression="zstd")
+    print(f"[INFO] Saved {table.num_rows} rows to {path}")
+    return path
@@ -0,0 +1,130 @@
+"""Shared date normalization for the EOL scrapers.
+
+All scrapers turn vendor dates into ``yyyy-mm-dd``. Instead of trying
+``datetime.strptime`` with one format after another (and paying for an
+exception on every miss), ``DateNormalizer``:
+
+- matches precompiled regexes for the formats we see (``2025-08-13``,
+  ``8/13/2025``, ``8/13/25``, ``August 13, 2025``, ``Aug 13th, 2025``),
+- remembers which format last matched and tries it first, so a column that
+  always uses one format costs a single regex match per value (the order is
+  kept per thread, so concurrent scrapers sharing ``normalize_date`` don't
+  reorder each other's list mid-loop),
+- memoizes parsed dates, since EOL tables repeat the same dates many times
+  (text that isn't a date is not kept, so free-form cells don't fill the
+  process-wide cache),
+- normalizes whole pandas columns by converting each distinct value once.
+
+Values that don't parse are returned stripped but otherwise unchanged.
+"""
+
+import calendar
+import datetime
+import re
+import threading
+
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+_MONTHS.update({name.lower(): number for number, name in enumerate(calendar.month_abbr) if name})
+_MONTHS["sept"] = 9
+
+
+def _two_digit_year(year):
+    """Same pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s."""
+    return year + (1900 if year >= 69 else 2000)
+
+
+def _iso(match):
+    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+def _month_day_year(match):
+    year = int(match.group(3))
+    return (year if len(match.group(3)) == 4 else _two_digit_year(year)), int(match.group(1)), int(match.group(2))
+
+
+def _month_name(match):
+    month = _MONTHS.get(match.group(1).lower())
+    if month is None:
+        return None
+    return int(match.group(3)), month, int(match.group(2))
+
+
+# (name, compiled pattern, match -> (year, month, day))
+_FORMATS = [
+    ("iso", re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$"), _iso),
+    ("month_name", re.compile(r"^([A-Za-z]+)\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})$"), _month_name),
+    ("slash", re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})$"), _month_day_year),
+]
+
+_CACHE_LIMIT = 50000
+_cache = {}
+
+
+class DateNormalizer:
+    """Callable that converts vendor date strings to ``yyyy-mm-dd``."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def _formats(self):
+        """This thread's format order, most recently matched first."""
+        formats = getattr(self._local, "formats", None)
+        if formats is None:
+            formats = self._local.formats = list(_FORMATS)
+        return formats
+
+    def _parse(self, text):
+        """``yyyy-mm-dd`` for ``text``, or None if no format matches."""
+        formats = self._formats
+        for position, (name, pattern, build) in enumerate(formats):
+            match = pattern.match(text)
+            if not match:
+                continue
+            parts = build(match)
+            if parts is None:
+                continue
+            try:
+                result = datetime.date(*parts).isoformat()
+            except ValueError:
+                continue
+            if position:
+                # Learn the format: try it first for the next value
+                formats.insert(0, formats.pop(position))
+            return result
+        return None
+
+    def __call__(self, value):
+        if value is None:
+            return ""
+        text = str(value).strip()
+        if not text:
+            return ""
+        result = _cache.get(text)
+        if result is None:
+            result = self._parse(text)
+            if result is None:
+                return text
+            if len(_cache) >= _CACHE_LIMIT:
+                _cache.clear()
+            _cache[text] = result
+        return result
+
+    def normalize_column(self, series):
+        """Vectorized path for a pandas Series: each distinct value is parsed once."""
+        values = series.fillna("").astype(str)
+        mapping = {value: self(value) for value in values.unique()}
+        return values.map(mapping)
+
+
+_default = DateNormalizer()
+
+
+def normalize_date(value):
+    """Convert one date string to ``yyyy-mm-dd`` (or return it stripped if unknown)."""
+    return _default(value)
+
+
+def normalize_date_column(series):
+    """Convert a whole pandas column, learning its format as it goes."""
+    return DateNormalizer().normalize_column(series)
@@ -0,0 +1,111 @@
+"""Row-level change detection between two snapshots of a dataset.
+
+Instead of reloading a whole EOL CSV every night, downstream jobs can apply
+the delta written here: one CSV holding only the inserted, updated and
+removed rows (marked in a ``change`` column), plus one line per run in a
+JSONL change log. Rows are matched on key columns such as
+(Software Name, Version) or (productName).
+
+The snapshot must be a full extract; feed it the output of a normal run,
+not an incremental one, or rows that weren't re-emitted look removed. An
+incremental run (one with a ``CrawlState``) writes its changed rows to
+``changes_path(snapshot)`` instead and leaves the snapshot alone.
+"""
+
+import datetime
+import json
+import os
+
+import pandas as pd
+
+CHANGE_COLUMN = "change"
+
+
+def changes_path(snapshot_path):
+    """``<snapshot>_changes<ext>``: where an incremental run writes the rows it emitted."""
+    stem, ext = os.path.splitext(snapshot_path)
+    return f"{stem}_changes{ext}"
+
+
+def read_snapshot(path):
+    """Load a previous snapshot as strings, or an empty DataFrame if there is none."""
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    return pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+
+
+def _keyed(df, key_columns):
+    """Index rows by key; repeated keys get an occurrence number so none are lost."""
+    df = df.astype(str)
+    occurrence = df.groupby(list(key_columns), sort=False).cumcount()
+    return df.set_index([*(df[c] for c in key_columns), occurrence.rename("_occurrence")])
+
+
+def diff_snapshots(previous, current, key_columns):
+    """Return {"inserts", "updates", "removals"} DataFrames between two snapshots."""
+    key_columns = list(key_columns)
+    if not key_columns:
+        raise ValueError("diff_snapshots needs at least one key column")
+    if current.empty and not set(key_columns) <= set(current.columns):
+        # A run without rows may not know its columns: everything in ``previous`` is gone
+        current = pd.DataFrame(columns=list(dict.fromkeys([*key_columns, *previous.columns])))
+    if previous.empty:
+        return {"inserts": current.copy(), "updates": current.iloc[0:0], "removals": current.iloc[0:0]}
+
+    old = _keyed(previous, key_columns)
+    new = _keyed(current.fillna(""), key_columns)
+
+    inserted = new.index.difference(old.index, sort=False)
+    removed = old.index.difference(new.index, sort=False)
+    common = new.index.intersection(old.index, sort=False)
+
+    columns = [c for c in new.columns if c in old.columns]
+    old_common = old.loc[common, columns]
+    new_common = new.loc[common, columns]
+    changed = (old_common != new_common).any(axis=1) | (len(new.columns) != len(columns))
+
+    return {
+        "inserts": new.loc[inserted].reset_index(drop=True),
+        "updates": new.loc[common[changed.to_numpy()]].reset_index(drop=True),
+        "removals": old.loc[removed].reset_index(drop=True),
+    }
+
+
+def write_delta(current, snapshot_path, key_columns, log_path=None):
+    """Diff ``current`` against the CSV at ``snapshot_path`` and write the changes.
+
+    Writes ``<snapshot>_delta_<timestamp>.csv`` (only when something changed)
+    and appends a summary line to ``log_path`` (default
+    ``<snapshot>_changes.jsonl``). Returns the summary. The caller still
+    writes the new full snapshot afterwards.
+    """
+    changes = diff_snapshots(read_snapshot(snapshot_path), current, key_columns)
+    stem = os.path.splitext(snapshot_path)[0]
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    summary = {
+        "timestamp": timestamp,
+        "snapshot": os.path.basename(snapshot_path),
+        "key": list(key_columns),
+        "inserts": len(changes["inserts"]),
+        "updates": len(changes["updates"]),
+        "removals": len(changes["removals"]),
+        "delta_file": "",
+    }
+
+    parts = [
+        df.assign(**{CHANGE_COLUMN: change})
+        for change, df in (("insert", changes["inserts"]), ("update", changes["updates"]), ("remove", changes["removals"]))
+        if not df.empty
+    ]
+    if parts:
+        delta_path = f"{stem}_delta_{timestamp}.csv"
+        pd.concat(parts, ignore_index=True).to_csv(delta_path, index=False)
+        summary["delta_file"] = os.path.basename(delta_path)
+
+    with open(log_path or f"{stem}_changes.jsonl", "a", encoding="utf-8") as lf:
+        lf.write(json.dumps(summary) + "\n")
+
+    print(f"[INFO] {summary['snapshot']}: {summary['inserts']} inserts, "
+          f"{summary['updates']} updates, {summary['removals']} removals")
+    return summary
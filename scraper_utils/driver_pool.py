@@ -0,0 +1,241 @@
+"""Shared, bounded pool of Chrome WebDriver instances used by all scrapers.
+
+Starting Chrome is the most expensive step of every scraper, so instead of
+building a new browser per scraper (or per call) the scrapers lease a driver
+from a pool, use it, and hand it back. The pool:
+
+- caps the number of live browsers (``max_size``), and shares a
+  process-wide cap (``MAX_BROWSERS``) with every other pool, so one pool per
+  profile doesn't multiply the Chromes a run can start; when the shared cap
+  is reached, an idle browser of another pool is quit to make room,
+- health checks idle drivers before handing them out,
+- recycles a driver after it has loaded ``max_pages`` pages,
+- starts every browser with one ``BrowserProfile`` (request blocking and
+  page-load strategy, see ``scraper_utils.browser_profiles``).
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+
+from scraper_utils.browser_profiles import get_profile
+from scraper_utils.driver_resolver import resolve_chromedriver
+from scraper_utils.metrics import metrics
+
+# Live Chrome instances across all pools (there is one pool per browser profile)
+MAX_BROWSERS = 3
+
+# How often a pool waiting for a shared slot looks for an idle browser to quit
+_EVICT_INTERVAL = 0.5
+
+_browser_slots = threading.BoundedSemaphore(MAX_BROWSERS)
+_live_pools = set()  # every open pool, to find idle browsers to quit
+_live_pools_lock = threading.Lock()
+
+
+class DriverPool:
+    """Bounded pool of reusable Chrome WebDriver instances."""
+
+    def __init__(self, headless=True, max_size=3, max_pages=25, driver_path=None, lease_timeout=None, profile=None):
+        """Configure the pool; browsers are only started when first leased."""
+        self.headless = headless
+        self.profile = get_profile(profile)
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.driver_path = driver_path
+        self.lease_timeout = lease_timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._pages = {}      # id(driver) -> pages loaded since start
+        self._leased = set()  # id(driver) of drivers currently handed out
+        self._drivers = {}    # id(driver) -> driver, every live browser
+        self._closed = False
+        with _live_pools_lock:
+            _live_pools.add(self)
+
+    def _create_driver(self):
+        """Start a new Chrome instance with the shared options and the pool's profile."""
+        chrome_options = Options()
+        if self.headless:
+            chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920x1080")
+        chrome_options.add_argument("--log-level=3")
+        self.profile.apply_options(chrome_options)
+        if self.driver_path and os.path.isfile(self.driver_path):
+            service = Service(self.driver_path)
+        else:
+            service = Service(resolve_chromedriver())
+        with metrics.timer("driver_startup"):
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.profile.apply(driver)
+        metrics.count("drivers_started")
+        return driver
+
+    def _is_healthy(self, driver):
+        """Return True if the browser session still answers commands."""
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        """Quit a driver, forget about it and give back its shared browser slot."""
+        with self._lock:
+            self._pages.pop(id(driver), None)
+            owned = self._drivers.pop(id(driver), None) is not None
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        if owned:
+            _browser_slots.release()
+
+    def _evict_idle(self):
+        """Quit one idle browser; returns False if the pool has none."""
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            return False
+        self._discard(driver)
+        return True
+
+    def _reserve_browser(self):
+        """Take a process-wide browser slot, quitting idle browsers of any pool while none is free."""
+        deadline = None if self.lease_timeout is None else time.monotonic() + self.lease_timeout
+        while not _browser_slots.acquire(blocking=False):
+            with _live_pools_lock:
+                pools = list(_live_pools)
+            if any(pool._evict_idle() for pool in pools):
+                continue
+            wait = _EVICT_INTERVAL if deadline is None else min(_EVICT_INTERVAL, deadline - time.monotonic())
+            if wait <= 0:
+                raise TimeoutError(f"No browser became available within {self.lease_timeout}s")
+            if _browser_slots.acquire(timeout=wait):
+                return
+
+    def acquire(self):
+        """Lease a driver, reusing a healthy idle one or starting a new one."""
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+        if not self._slots.acquire(timeout=self.lease_timeout):
+            raise TimeoutError(f"No browser became available within {self.lease_timeout}s")
+
+        try:
+            driver = None
+            while driver is None:
+                try:
+                    candidate = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if self._is_healthy(candidate):
+                    driver = candidate
+                else:
+                    self._discard(candidate)
+
+            if driver is None:
+                self._reserve_browser()
+                try:
+                    driver = self._create_driver()
+                except Exception:
+                    _browser_slots.release()
+                    raise
+                with self._lock:
+                    self._drivers[id(driver)] = driver
+                    self._pages[id(driver)] = 0
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._leased.add(id(driver))
+        return driver
+
+    def release(self, driver):
+        """Return a leased driver to the pool (or quit it if it is worn out)."""
+        if driver is None:
+            return
+        with self._lock:
+            if id(driver) not in self._leased:
+                return
+            self._leased.discard(id(driver))
+            worn_out = self._pages.get(id(driver), 0) >= self.max_pages
+
+        if self._closed or worn_out or not self._is_healthy(driver):
+            self._discard(driver)
+        else:
+            try:
+                # Drop the previous page so idle browsers don't hold its memory
+                driver.get("about:blank")
+                self._idle.put(driver)
+            except Exception:
+                self._discard(driver)
+        self._slots.release()
+
+    @contextmanager
+    def lease(self):
+        """Context manager that leases a driver and always returns it."""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def load(self, driver, url):
+        """Navigate a leased driver to ``url`` and count the page towards recycling."""
+        with metrics.timer("page_load", mode="browser"):
+            driver.get(url)
+        with self._lock:
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + 1
+
+    def close_all(self):
+        """Quit every browser owned by the pool."""
+        self._closed = True
+        with _live_pools_lock:
+            _live_pools.discard(self)
+        with self._lock:
+            drivers = list(self._drivers.values())
+        for driver in drivers:
+            self._discard(driver)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(headless=True, driver_path=None, profile=None, **kwargs):
+    """Return the process-wide pool for the given browser settings and profile.
+
+    ``profile`` is a ``BrowserProfile``, a profile name or a scraper's SOURCE
+    label; each profile gets its own pool, as its browsers are started
+    differently, and all pools share the ``MAX_BROWSERS`` cap.
+    """
+    profile = get_profile(profile)
+    key = (headless, driver_path, profile.name)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = DriverPool(headless=headless, driver_path=driver_path, profile=profile, **kwargs)
+            _pools[key] = pool
+        return pool
+
+
+def close_all_pools():
+    """Quit the browsers of every shared pool."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
+
+
+atexit.register(close_all_pools)
@@ -0,0 +1,130 @@
+"""Cached, offline-friendly resolution of the chromedriver binary.
+
+``ChromeDriverManager().install()`` does a version lookup (and sometimes a
+download) every time it is called. This module resolves the driver once,
+stores the binary path and browser version on disk, and keeps using that
+cache for ``max_age`` seconds without touching the network. When the cache
+is stale but the download endpoint is unreachable, the last known good
+driver is still used.
+
+Resolution order:
+
+1. ``CHROMEDRIVER_PATH`` environment variable
+2. the in-process result of a previous call (a failed lookup included, so
+   an offline run doesn't retry the download for every browser it starts)
+3. a fresh on-disk cache entry
+4. ``ChromeDriverManager().install()`` (network)
+5. a stale cache entry, or ``chromedriver`` on ``PATH``
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "scraper_utils", "chromedriver.json")
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60  # one week
+
+# In-process result; None is a valid answer (no driver found), so "not resolved yet" needs its own marker
+_UNRESOLVED = object()
+_resolved_path = _UNRESOLVED
+_resolve_lock = threading.Lock()
+
+
+def _read_cache(cache_file):
+    """Return the cached entry, or an empty dict if missing or unreadable."""
+    try:
+        with open(cache_file, "r", encoding="utf-8") as cf:
+            return json.load(cf)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache_file, driver_path, browser_version):
+    """Store the resolved driver path and browser version."""
+    entry = {
+        "driver_path": driver_path,
+        "browser_version": browser_version,
+        "resolved_at": time.time(),
+    }
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as cf:
+            json.dump(entry, cf, indent=4)
+    except OSError as e:
+        print(f"[WARN] Could not write chromedriver cache: {e}")
+
+
+def detect_browser_version():
+    """Return the installed Chrome major version (e.g. "139"), or "" if unknown."""
+    if sys.platform.startswith("win"):
+        commands = [["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"]]
+    elif sys.platform == "darwin":
+        commands = [["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"]]
+    else:
+        commands = [[name, "--version"] for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")]
+
+    for command in commands:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+)\.\d+\.\d+\.\d+", output)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def _install_with_manager():
+    """Resolve the driver through webdriver-manager (may hit the network)."""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def resolve_chromedriver(cache_file=DEFAULT_CACHE_FILE, max_age=DEFAULT_MAX_AGE, refresh=False):
+    """Return a path to a usable chromedriver binary, or None to let Selenium decide."""
+    global _resolved_path
+
+    env_path = os.environ.get("CHROMEDRIVER_PATH")
+    if env_path and os.path.isfile(env_path):
+        return env_path
+
+    with _resolve_lock:
+        if _resolved_path is not _UNRESOLVED and not refresh:
+            return _resolved_path
+
+        cache = _read_cache(cache_file)
+        cached_path = cache.get("driver_path")
+        cached_usable = bool(cached_path) and os.path.isfile(cached_path)
+        fresh = time.time() - cache.get("resolved_at", 0) < max_age
+
+        # --- Fast path: fresh cache, no network and no subprocess ---
+        if cached_usable and fresh and not refresh:
+            _resolved_path = cached_path
+            return _resolved_path
+
+        # --- Stale cache: keep it if the browser has not been upgraded ---
+        browser_version = detect_browser_version()
+        if cached_usable and not refresh and browser_version and browser_version == cache.get("browser_version"):
+            _write_cache(cache_file, cached_path, browser_version)
+            _resolved_path = cached_path
+            return _resolved_path
+
+        try:
+            driver_path = _install_with_manager()
+            _write_cache(cache_file, driver_path, browser_version)
+            _resolved_path = driver_path
+            return _resolved_path
+        except Exception as e:
+            print(f"[WARN] chromedriver download failed, using local fallback: {e}")
+
+        if cached_usable:
+            _resolved_path = cached_path
+        else:
+            # None lets Selenium Manager locate a driver on its own
+            _resolved_path = shutil.which("chromedriver")
+        return _resolved_path
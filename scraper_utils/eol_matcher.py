@@ -0,0 +1,264 @@
+"""Match an asset inventory against the EOL store in bulk.
+
+Two indexes are built in memory from the store's rows:
+
+- **SKUs** (hardware). ``productName`` often packs a whole series into one
+  comma-joined string ("PA-7000 Series PAN-PA-7000-100G-NPC-A,
+  PAN-PA-7000-LFC-A, ..."). ``split_skus`` explodes it into single SKUs, and
+  a character trie per vendor answers exact lookups, the longest indexed SKU
+  that prefixes an asset's SKU at a ``-`` boundary ("PA-220R-AC" ->
+  "PA-220R"), and "every SKU of a family" queries.
+- **Versions** (software). Per product, exact versions sit in a dict and
+  wildcard rows ("139.12.x.x") under their fixed prefix ("139", "12"). A
+  shorter version covers its own point releases ("10.1" covers "10.1.9-h3").
+  A lookup tries the exact version, then ever shorter prefixes of it, so the
+  most specific row wins.
+
+``EolMatcher.match_frame`` matches each distinct (vendor, product, version)
+of an inventory once and joins the answers back, and single lookups are
+memoized, so a million assets with a few thousand distinct models match in
+seconds::
+
+    matcher = EolMatcher.from_store()
+    matched = matcher.match_frame(assets, "vendor", "model", "os_version")
+
+When several rows tie (Windows servicing channels, repeated plugin
+versions) the earliest EOL date wins unless an ``edition`` is given: an
+asset is flagged too early rather than too late.
+"""
+
+import re
+
+import pandas as pd
+
+from scraper_utils.eol_store import DEFAULT_STORE, EolStore, lookup_key
+
+# SKU-like tokens: letters/digits joined by hyphens or dots, with at least one digit
+SKU_TOKEN = re.compile(r"\b(?=[A-Z0-9.-]*\d)[A-Z0-9]+(?:[-.][A-Z0-9]+)+\b")
+SKU_SEPARATORS = re.compile(r"[,;\n]|\s+/\s+")
+# Vendor prefixes an inventory may leave out ("PAN-PA-7080-AC-SYS" is sold as "PA-7080-AC-SYS")
+SKU_PREFIXES = ("PAN-",)
+
+VERSION_SEPARATORS = re.compile(r"[.\-_ ]+")
+WILDCARDS = {"x", "*", "xx"}
+
+MATCH_COLUMNS = ["eol_date", "release_date", "matched_product", "matched_version", "edition", "match"]
+
+
+def normalize_sku(value):
+    """Upper-case SKU without surrounding punctuation or inner spacing differences."""
+    return " ".join(str(value or "").upper().split()).strip("()[]\"' ")
+
+
+def split_skus(product):
+    """Every SKU a product cell stands for: each comma-separated part plus the SKU tokens inside it."""
+    skus = []
+    for part in SKU_SEPARATORS.split(str(product or "")):
+        part = normalize_sku(part)
+        if not part:
+            continue
+        candidates = [part] + SKU_TOKEN.findall(part)
+        for sku in candidates:
+            skus.append(sku)
+            for prefix in SKU_PREFIXES:
+                if sku.startswith(prefix) and len(sku) > len(prefix):
+                    skus.append(sku[len(prefix):])
+    return list(dict.fromkeys(skus))
+
+
+def version_parts(version):
+    """(fixed components, has wildcard) of a version: "139.12.x.x" -> (("139", "12"), True)."""
+    parts = [p for p in VERSION_SEPARATORS.split(lookup_key(version)) if p]
+    for index, part in enumerate(parts):
+        if part in WILDCARDS:
+            return tuple(parts[:index]), True
+    return tuple(parts), False
+
+
+class SkuTrie:
+    """Character trie over normalized SKUs; a node's ``None`` key holds the row ids of its SKU."""
+
+    def __init__(self):
+        self.root = {}
+        self.size = 0
+
+    def insert(self, sku, row_id):
+        node = self.root
+        for char in sku:
+            node = node.setdefault(char, {})
+        if None not in node:
+            node[None] = []
+            self.size += 1
+        if row_id not in node[None]:
+            node[None].append(row_id)
+
+    def get(self, sku):
+        """Row ids of exactly ``sku``."""
+        node = self.root
+        for char in sku:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node.get(None, [])
+
+    def longest_prefix(self, sku, boundary="-"):
+        """(indexed SKU, row ids) of the longest SKU that prefixes ``sku`` up to a ``boundary`` character."""
+        node = self.root
+        best = ("", [])
+        for index, char in enumerate(sku):
+            node = node.get(char)
+            if node is None:
+                break
+            following = sku[index + 1:index + 2]
+            if None in node and (not following or following in boundary):
+                best = (sku[:index + 1], node[None])
+        return best
+
+    def with_prefix(self, prefix):
+        """{SKU: row ids} of every indexed SKU starting with ``prefix``."""
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return {}
+        found = {}
+        stack = [(prefix, node)]
+        while stack:
+            text, node = stack.pop()
+            for char, child in node.items():
+                if char is None:
+                    found[text] = child
+                else:
+                    stack.append((text + char, child))
+        return found
+
+    def __len__(self):
+        return self.size
+
+
+class EolMatcher:
+    """SKU trie and wildcard-aware version index over EOL rows, with memoized lookups."""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.skus = {}      # vendor key -> SkuTrie
+        self.versions = {}  # (vendor key, product key) -> {"exact": {parts: ids}, "prefix": {parts: ids}}
+        self._cache = {}
+        self._version_vendors = set()
+        for row_id, row in enumerate(self.rows):
+            vendor = lookup_key(row["vendor"])
+            if row.get("version"):
+                self._version_vendors.add(vendor)
+                index = self.versions.setdefault((vendor, lookup_key(row["product"])), {"exact": {}, "prefix": {}})
+                parts, wildcard = version_parts(row["version"])
+                if not wildcard:
+                    index["exact"].setdefault(parts, []).append(row_id)
+                # A wildcard row covers its fixed prefix; a plain version also covers its point releases
+                index["prefix"].setdefault(parts, []).append(row_id)
+            else:
+                trie = self.skus.setdefault(vendor, SkuTrie())
+                for sku in split_skus(row["product"]):
+                    trie.insert(sku, row_id)
+
+    @classmethod
+    def from_store(cls, store=None):
+        """Build the indexes from an ``EolStore`` (or the store file at a path)."""
+        if store is None or isinstance(store, str):
+            with EolStore(store or DEFAULT_STORE) as opened:
+                return cls(opened.rows())
+        return cls(store.rows())
+
+    def _vendors(self, vendor, indexed):
+        key = lookup_key(vendor)
+        if key:
+            return [key] if key in indexed else []
+        return list(indexed)
+
+    def _match_version(self, vendor, product, version):
+        product_key = lookup_key(product)
+        parts, _ = version_parts(version)
+        for vendor_key in self._vendors(vendor, self._version_vendors):
+            index = self.versions.get((vendor_key, product_key))
+            if index is None:
+                continue
+            if parts in index["exact"]:
+                return index["exact"][parts], "exact"
+            for length in range(len(parts), 0, -1):
+                ids = index["prefix"].get(parts[:length])
+                if ids:
+                    return ids, "wildcard"
+        return [], None
+
+    def _match_sku(self, vendor, product):
+        sku = normalize_sku(product)
+        variants = [sku] + [sku[len(p):] for p in SKU_PREFIXES if sku.startswith(p)]
+        tries = [self.skus[v] for v in self._vendors(vendor, self.skus)]
+        for trie in tries:
+            for variant in variants:
+                ids = trie.get(variant)
+                if ids:
+                    return ids, "sku"
+        for trie in tries:
+            for variant in variants:
+                _, ids = trie.longest_prefix(variant)
+                if ids:
+                    return ids, "sku_prefix"
+        return [], None
+
+    def _best(self, ids, edition):
+        """Row among ``ids`` for ``edition``, else the one with the earliest EOL date."""
+        rows = [self.rows[i] for i in ids]
+        if edition:
+            wanted = [r for r in rows if lookup_key(r.get("edition")) == lookup_key(edition)]
+            rows = wanted or rows
+        return min(rows, key=lambda r: (r.get("eol_date") or "9999-12-31", r.get("edition") or ""))
+
+    def match(self, vendor, product, version=None, edition=None):
+        """EOL answer for one asset: dict with ``MATCH_COLUMNS`` plus the row, or None."""
+        key = (lookup_key(vendor), lookup_key(product), lookup_key(version), lookup_key(edition))
+        if key in self._cache:
+            return self._cache[key]
+
+        ids, how = ([], None)
+        if version:
+            ids, how = self._match_version(vendor, product, version)
+        if not ids:
+            ids, how = self._match_sku(vendor, product)
+        result = None
+        if ids:
+            row = self._best(ids, edition)
+            result = {
+                "eol_date": row.get("eol_date"),
+                "release_date": row.get("release_date"),
+                "matched_product": row["product"],
+                "matched_version": row.get("version", ""),
+                "edition": row.get("edition", ""),
+                "match": how,
+                "row": row,
+            }
+        self._cache[key] = result
+        return result
+
+    def match_many(self, assets):
+        """Match (vendor, product, version) tuples; returns one answer (or None) per asset."""
+        return [self.match(*asset) for asset in assets]
+
+    def match_frame(self, df, vendor_column, product_column, version_column=None, edition_column=None):
+        """``df`` (same index, same row order) plus ``MATCH_COLUMNS``, matching each distinct key combination once."""
+        columns = [c for c in (vendor_column, product_column, version_column, edition_column) if c]
+        keys = df[columns].drop_duplicates()
+        answers = []
+        for values in keys.itertuples(index=False, name=None):
+            named = {c: None if pd.isna(v) else v for c, v in zip(columns, values)}
+            result = self.match(
+                named[vendor_column], named[product_column],
+                named.get(version_column), named.get(edition_column),
+            ) or {}
+            answers.append([result.get(c) for c in MATCH_COLUMNS])
+        matched = pd.concat(
+            [keys.reset_index(drop=True), pd.DataFrame(answers, columns=MATCH_COLUMNS)], axis=1
+        )
+        result = df.merge(matched, on=columns, how="left")
+        # merge renumbers the rows; keys are unique in ``matched``, so rows line up one to one
+        result.index = df.index
+        return result
@@ -0,0 +1,246 @@
+"""Local SQLite store of end-of-life data with indexed lookups.
+
+The scrapers' CSVs are snapshots for people; asset-matching jobs need point
+lookups. Every EOL scraper can upsert its rows into one table, keyed by
+(vendor, product, version, edition) and indexed on vendor, product and
+version, so a lookup is an index seek instead of a pandas scan::
+
+    store = EolStore("output/eol.sqlite")
+    store.upsert(scraper.to_eol_records())
+    lookup_eol("Palo Alto", "Prisma Access Browser", "139.12.x.x")
+
+Names are matched case- and whitespace-insensitively. ``edition`` tells
+rows of one version apart (a Windows servicing channel, for example) and is
+empty for most sources. Dates are stored as ISO ``YYYY-MM-DD`` text; the
+full scraped row is kept as JSON in ``extra``.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from scraper_utils.dates import normalize_date
+
+DEFAULT_STORE = os.path.join("output", "eol.sqlite")
+
+FIELDS = ["vendor", "product", "version", "edition", "release_date", "eol_date",
+          "replacement", "resource", "source", "extra", "updated_at"]
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS eol (
+    vendor TEXT NOT NULL,
+    product TEXT NOT NULL,
+    version TEXT NOT NULL DEFAULT '',
+    edition TEXT NOT NULL DEFAULT '',
+    vendor_key TEXT NOT NULL,
+    product_key TEXT NOT NULL,
+    version_key TEXT NOT NULL,
+    release_date TEXT,
+    eol_date TEXT,
+    replacement TEXT NOT NULL DEFAULT '',
+    resource TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT '',
+    extra TEXT NOT NULL DEFAULT '{}',
+    updated_at TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_eol_key ON eol (vendor_key, product_key, version_key, edition);
+CREATE INDEX IF NOT EXISTS idx_eol_vendor ON eol (vendor_key);
+CREATE INDEX IF NOT EXISTS idx_eol_product ON eol (product_key);
+CREATE INDEX IF NOT EXISTS idx_eol_version ON eol (version_key);
+"""
+
+UPSERT = """
+INSERT INTO eol (vendor, product, version, edition, vendor_key, product_key, version_key,
+                 release_date, eol_date, replacement, resource, source, extra, updated_at)
+VALUES (:vendor, :product, :version, :edition, :vendor_key, :product_key, :version_key,
+        :release_date, :eol_date, :replacement, :resource, :source, :extra, :updated_at)
+ON CONFLICT (vendor_key, product_key, version_key, edition) DO UPDATE SET
+    vendor = excluded.vendor,
+    product = excluded.product,
+    version = excluded.version,
+    release_date = excluded.release_date,
+    eol_date = excluded.eol_date,
+    replacement = excluded.replacement,
+    resource = excluded.resource,
+    source = excluded.source,
+    extra = excluded.extra,
+    updated_at = excluded.updated_at
+"""
+
+
+def lookup_key(value):
+    """Case- and whitespace-insensitive form of a vendor, product or version name."""
+    return " ".join(str(value or "").split()).lower()
+
+
+def iso_date(value):
+    """ISO date found in a vendor date value ("2032-01-13 (IoT only)" included), or None."""
+    match = _ISO_DATE.search(normalize_date(value))
+    return match.group() if match else None
+
+
+def latest_date(values):
+    """Latest ISO date among ``values`` (text such as "End of servicing" is skipped), or None."""
+    dates = [d for d in (iso_date(v) for v in values) if d]
+    return max(dates) if dates else None
+
+
+def eol_record(vendor, product, version="", eol_date=None, release_date=None, edition="",
+               replacement="", resource="", source="", extra=None):
+    """One row for :meth:`EolStore.upsert`."""
+    return {
+        "vendor": vendor,
+        "product": product,
+        "version": version or "",
+        "edition": edition or "",
+        "release_date": iso_date(release_date),
+        "eol_date": iso_date(eol_date),
+        "replacement": replacement or "",
+        "resource": resource or "",
+        "source": source,
+        "extra": extra or {},
+    }
+
+
+def number_repeats(records):
+    """Tell repeated records apart: the 2nd, 3rd, ... with one (vendor, product, version, edition) get "#2", "#3", ...
+
+    The store keeps one row per key, so without this a table that lists a
+    version twice (the Panorama plugins share version numbers) would lose
+    all but the last one.
+    """
+    seen = {}
+    numbered = []
+    for record in records:
+        key = (lookup_key(record["vendor"]), lookup_key(record["product"]), lookup_key(record["version"]), record["edition"])
+        seen[key] = seen.get(key, 0) + 1
+        if seen[key] > 1:
+            record = {**record, "edition": f"{record['edition']}#{seen[key]}"}
+        numbered.append(record)
+    return numbered
+
+
+def windows_release_records(df, product, source):
+    """Records for a Windows release-health table, one per version and servicing option.
+
+    ``product`` is the product name, or a function of the row returning it.
+    The EOL date is the latest "End of servicing ..." / "... support end
+    date" date; update-history rows have no version and are skipped.
+    """
+    end_columns = [c for c in df.columns if c.startswith("End of servicing") or c.endswith("support end date")]
+    records = []
+    for row in df.fillna("").to_dict("records"):
+        if not row.get("Version"):
+            continue
+        records.append(eol_record(
+            "Microsoft", product(row) if callable(product) else product, row["Version"],
+            eol_date=latest_date(row[c] for c in end_columns),
+            release_date=row.get("Availability date"),
+            edition=row.get("Servicing option", ""), source=source, extra=row,
+        ))
+    return records
+
+
+class EolStore:
+    """EOL rows in SQLite, upserted by the scrapers and looked up by name."""
+
+    def __init__(self, path=DEFAULT_STORE):
+        self.path = path
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def upsert(self, records):
+        """Insert or update ``records`` (see :func:`eol_record`) in one transaction; returns the count."""
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        rows = [
+            {
+                **record,
+                "vendor_key": lookup_key(record["vendor"]),
+                "product_key": lookup_key(record["product"]),
+                "version_key": lookup_key(record["version"]),
+                "extra": json.dumps(record.get("extra") or {}, ensure_ascii=False, default=str),
+                "updated_at": now,
+            }
+            for record in records
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(UPSERT, rows)
+        return len(rows)
+
+    def lookup(self, vendor, product, version=None):
+        """Rows for ``vendor``/``product``, narrowed to ``version`` when given (one per edition)."""
+        sql = f"SELECT {', '.join(FIELDS)} FROM eol WHERE vendor_key = ? AND product_key = ?"
+        params = [lookup_key(vendor), lookup_key(product)]
+        if version is not None:
+            sql += " AND version_key = ?"
+            params.append(lookup_key(version))
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY version_key, edition", params).fetchall()
+        return [self._row(row) for row in rows]
+
+    def rows(self, vendor=None):
+        """Every stored row (of one vendor when given)."""
+        sql = f"SELECT {', '.join(FIELDS)} FROM eol"
+        params = []
+        if vendor is not None:
+            sql += " WHERE vendor_key = ?"
+            params.append(lookup_key(vendor))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._row(row) for row in rows]
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM eol").fetchone()[0]
+
+    def _row(self, row):
+        record = dict(row)
+        record["extra"] = json.loads(record["extra"])
+        return record
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(path=DEFAULT_STORE):
+    """Return the process-wide store for ``path``."""
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = EolStore(path)
+        return _stores[path]
+
+
+def store_records(records, store=None):
+    """Upsert ``records`` into ``store`` (the shared ``output/eol.sqlite`` one by default); returns the count."""
+    store = store or get_store()
+    count = store.upsert(records)
+    print(f"[INFO] Upserted {count} rows into {store.path}")
+    return count
+
+
+def lookup_eol(vendor, product, version=None, path=DEFAULT_STORE):
+    """Look up EOL rows in the shared store at ``path`` (see :meth:`EolStore.lookup`)."""
+    return get_store(path).lookup(vendor, product, version)
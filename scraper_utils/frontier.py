@@ -0,0 +1,113 @@
+"""Persisted crawl frontier: which URLs are known, queued, done or failed.
+
+A catalog crawl discovers URLs as it goes (categories from the navigation,
+product pages from the listings). ``Frontier`` keeps every URL once, under
+a normalized form, with its kind, status and attempt count, and saves the
+lot to a JSON file so an interrupted overnight run can continue where it
+stopped instead of starting over::
+
+    frontier = Frontier("output/troemner_frontier.json")
+    frontier.add(url, "category")
+    for url in frontier.pending("category"):
+        ...
+        frontier.mark_done(url)
+    frontier.save()
+"""
+
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_FRONTIER_FILE = os.path.join("output", "frontier.json")
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+def normalize_url(url):
+    """Canonical form used for de-duplication: lower-case scheme/host, no fragment or trailing slash."""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+class Frontier:
+    """URLs by kind with pending/done/failed status, saved as JSON between runs."""
+
+    def __init__(self, path=DEFAULT_FRONTIER_FILE, max_attempts=3, reset=False):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.urls = {}
+        self._lock = threading.Lock()
+        if not reset:
+            try:
+                with open(path, "r", encoding="utf-8") as ff:
+                    self.urls = json.load(ff)
+            except (OSError, ValueError):
+                pass
+
+    def __contains__(self, url):
+        return normalize_url(url) in self.urls
+
+    def add(self, url, kind, **info):
+        """Queue ``url`` unless it is already known; returns True if it was new.
+
+        Entries are keyed by the normalized URL; ``url`` keeps the form first seen.
+        """
+        key = normalize_url(url)
+        with self._lock:
+            if key in self.urls:
+                return False
+            self.urls[key] = {"url": url, "kind": kind, "status": PENDING, "attempts": 0, "error": "", **info}
+            return True
+
+    def pending(self, kind=None):
+        """URLs still to crawl: never tried, or failed fewer than ``max_attempts`` times."""
+        with self._lock:
+            return [
+                url for url, entry in self.urls.items()
+                if (kind is None or entry["kind"] == kind)
+                and (entry["status"] == PENDING
+                     or (entry["status"] == FAILED and entry["attempts"] < self.max_attempts))
+            ]
+
+    def get(self, url):
+        return self.urls.get(normalize_url(url))
+
+    def mark_done(self, url, **info):
+        self._finish(url, DONE, "", info)
+
+    def mark_failed(self, url, error):
+        self._finish(url, FAILED, str(error), {})
+
+    def _finish(self, url, status, error, info):
+        with self._lock:
+            entry = self.urls[normalize_url(url)]
+            entry.update(info)
+            entry["status"] = status
+            entry["error"] = error
+            entry["attempts"] += 1
+            entry["updated"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    def counts(self):
+        """{kind: {status: n}} summary of the frontier."""
+        summary = {}
+        with self._lock:
+            for entry in self.urls.values():
+                by_status = summary.setdefault(entry["kind"], {})
+                by_status[entry["status"]] = by_status.get(entry["status"], 0) + 1
+        return summary
+
+    def save(self):
+        """Write the frontier atomically, so a crash mid-write keeps the previous file."""
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with self._lock:
+            text = json.dumps(self.urls, indent=2)
+        with open(self.path + ".tmp", "w", encoding="utf-8") as ff:
+            ff.write(text)
+        os.replace(self.path + ".tmp", self.path)
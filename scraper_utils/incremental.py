@@ -0,0 +1,94 @@
+"""Incremental crawl state: skip pages, tables and rows that did not change.
+
+``CrawlState`` remembers, per URL:
+
+- the ``ETag`` / ``Last-Modified`` validators, sent back as conditional
+  request headers so an unchanged page costs a ``304 Not Modified``,
+- a hash of the response body, for servers that don't send validators,
+- a hash of every extracted table plus the hashes of the rows it produced,
+
+so a scraper can skip parsing tables that are byte-for-byte the same as the
+last run and only emit rows that are new or changed. The state is a small
+JSON file saved with :meth:`CrawlState.save`.
+"""
+
+import hashlib
+import json
+import os
+
+DEFAULT_STATE_FILE = os.path.join("output", "crawl_state.json")
+
+
+def fingerprint(value):
+    """Stable SHA-1 of bytes, a string, or any JSON-serializable value."""
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    elif not isinstance(value, bytes):
+        value = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.sha1(value).hexdigest()
+
+
+class CrawlState:
+    """Per-URL validators and content fingerprints persisted between runs."""
+
+    def __init__(self, path=DEFAULT_STATE_FILE):
+        self.path = path
+        self.urls = {}
+        try:
+            with open(path, "r", encoding="utf-8") as sf:
+                self.urls = json.load(sf)
+        except (OSError, ValueError):
+            pass
+
+    def _entry(self, url):
+        return self.urls.setdefault(url, {"etag": "", "last_modified": "", "body": "", "tables": {}})
+
+    def conditional_headers(self, url):
+        """Headers that let the server answer 304 when the page is unchanged."""
+        entry = self.urls.get(url, {})
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update_validators(self, url, response):
+        """Remember the validators a successful response came with."""
+        entry = self._entry(url)
+        entry["etag"] = response.headers.get("ETag", "")
+        entry["last_modified"] = response.headers.get("Last-Modified", "")
+
+    def body_changed(self, url, content):
+        """Record the body hash; False if it matches the previous run."""
+        entry = self._entry(url)
+        digest = fingerprint(content)
+        changed = entry["body"] != digest
+        entry["body"] = digest
+        return changed
+
+    def table_changed(self, url, key, table):
+        """Record the table hash; False if the table is identical to the previous run."""
+        tables = self._entry(url)["tables"]
+        digest = fingerprint(table)
+        previous = tables.get(str(key))
+        if previous and previous["hash"] == digest:
+            return False
+        tables[str(key)] = {"hash": digest, "rows": previous["rows"] if previous else []}
+        return True
+
+    def changed_rows(self, url, key, records):
+        """Return the records of a table that weren't emitted on the previous run."""
+        table = self._entry(url)["tables"].setdefault(str(key), {"hash": "", "rows": []})
+        previous = set(table["rows"])
+        hashes = [fingerprint(record) for record in records]
+        table["rows"] = hashes
+        return [record for record, digest in zip(records, hashes) if digest not in previous]
+
+    def save(self):
+        """Write the state file."""
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as sf:
+            json.dump(self.urls, sf, indent=2)
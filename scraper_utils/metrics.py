@@ -0,0 +1,162 @@
+"""Per-stage timings and counters for the scrapers.
+
+The shared helpers and every scraper report into one process-wide registry,
+``metrics``:
+
+    with metrics.timer("page_load", scraper="troemner"):
+        ...
+    metrics.count("rows", 140, scraper="troemner")
+
+    @metrics.timed("save", scraper="troemner")
+    def save_to_csv(self, filename): ...
+
+Stages used across the repo: ``driver_startup``, ``page_load`` (``mode``
+browser, http or replay), ``wait``, ``scroll``, ``extract`` (plus ``extract_tables``
+for the shared table snapshot) and ``save``. At the end of a run,
+``metrics.save_report(path)`` writes a JSON report and
+``metrics.save_prometheus(path)`` the Prometheus text format (for the node
+exporter's textfile collector or a push gateway). The exporter puts a
+timer's name in its ``stage`` label, so ``stage`` can't be used as a label
+of its own (``timer``, ``timed``, ``observe`` and ``count`` reject it).
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Label names the Prometheus exporter sets itself
+RESERVED_LABELS = {"stage"}
+
+
+def _key(name, labels):
+    reserved = RESERVED_LABELS.intersection(labels)
+    if reserved:
+        raise ValueError(f"Reserved metric label(s) {', '.join(sorted(reserved))} on {name}; use another name")
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _label_text(labels):
+    if not labels:
+        return ""
+    escaped = (k + '="' + v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"' for k, v in labels)
+    return "{" + ",".join(escaped) + "}"
+
+
+class Metrics:
+    """Thread-safe registry of timers (count/total/min/max seconds) and counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timers = {}
+        self._counters = {}
+        self.started = time.time()
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Time the ``with`` block under ``name``; errors are timed too, then re-raised."""
+        _key(name, labels)  # reject reserved labels before the block runs
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def timed(self, name, **labels):
+        """Decorator form of :meth:`timer`."""
+        _key(name, labels)  # reject reserved labels when decorating, not on the first call
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, **labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def observe(self, name, seconds, **labels):
+        """Record one duration for timer ``name``."""
+        key = _key(name, labels)
+        with self._lock:
+            stats = self._timers.get(key)
+            if stats is None:
+                self._timers[key] = {"count": 1, "total": seconds, "min": seconds, "max": seconds}
+            else:
+                stats["count"] += 1
+                stats["total"] += seconds
+                stats["min"] = min(stats["min"], seconds)
+                stats["max"] = max(stats["max"], seconds)
+
+    def count(self, name, value=1, **labels):
+        """Add ``value`` to counter ``name``."""
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def reset(self):
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+            self.started = time.time()
+
+    def report(self):
+        """Everything recorded so far as a JSON-serializable dict."""
+        with self._lock:
+            timers = [
+                {"name": name, "labels": dict(labels), **{k: round(v, 6) for k, v in stats.items()}}
+                for (name, labels), stats in sorted(self._timers.items())
+            ]
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+        return {
+            "started": self.started,
+            "elapsed_seconds": round(time.time() - self.started, 3),
+            "timers": timers,
+            "counters": counters,
+        }
+
+    def prometheus_text(self, prefix="scraper"):
+        """The recorded metrics in Prometheus text exposition format."""
+        with self._lock:
+            timers = sorted(self._timers.items())
+            counters = sorted(self._counters.items())
+
+        lines = []
+        if timers:
+            lines.append(f"# TYPE {prefix}_stage_seconds summary")
+            for (name, labels), stats in timers:
+                label_text = _label_text((("stage", name),) + labels)
+                lines.append(f"{prefix}_stage_seconds_sum{label_text} {stats['total']:.6f}")
+                lines.append(f"{prefix}_stage_seconds_count{label_text} {stats['count']}")
+            lines.append(f"# TYPE {prefix}_stage_seconds_max gauge")
+            for (name, labels), stats in timers:
+                lines.append(f"{prefix}_stage_seconds_max{_label_text((('stage', name),) + labels)} {stats['max']:.6f}")
+        for name in sorted({name for (name, _), _ in counters}):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for (counter, labels), value in counters:
+                if counter == name:
+                    lines.append(f"{prefix}_{name}_total{_label_text(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def save_report(self, path=os.path.join("output", "run_metrics.json")):
+        """Write :meth:`report` as JSON; returns the path."""
+        return self._write(path, json.dumps(self.report(), indent=2))
+
+    def save_prometheus(self, path=os.path.join("output", "run_metrics.prom")):
+        """Write :meth:`prometheus_text`; returns the path."""
+        return self._write(path, self.prometheus_text())
+
+    def _write(self, path, text):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        return path
+
+
+# Process-wide registry shared by the helpers and the scrapers
+metrics = Metrics()
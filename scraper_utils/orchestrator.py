@@ -0,0 +1,220 @@
+"""Run all vendor scrapers concurrently with asyncio.
+
+Every scraper is blocking Selenium/requests code, so each source runs in a
+worker thread (``asyncio.to_thread``) while the event loop enforces:
+
+- a global concurrency limit (``max_concurrency``),
+- a per-host limit (``per_host_limit`` sources at a time on one host) and a
+  minimum gap (``min_host_interval``) between the *starts* of sources on the
+  same host; requests within one source are not spaced out,
+
+and records each source's rows, status and wall-clock time. A full refresh
+then takes roughly as long as the slowest source instead of the sum. The
+per-stage timings of the run are written to ``output/run_metrics.json`` and
+``output/run_metrics.prom``.
+
+Run from the repository root::
+
+    python -m scraper_utils.orchestrator
+"""
+
+import asyncio
+import contextlib
+import importlib.util
+import os
+import time
+
+import pandas as pd
+
+from scraper_utils.driver_pool import get_driver_pool
+from scraper_utils.metrics import metrics
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TROEMNER_URL = "https://www.troemner.com/Calibration-Weights/Balance-Calibration-Weights/OIML-Calibration-Weight-Sets/c/3944"
+PALO_ALTO_SOFTWARE_URL = "https://www.paloaltonetworks.com/services/support/end-of-life-announcements/end-of-life-summary"
+PALO_ALTO_HARDWARE_URL = "https://www.paloaltonetworks.com/services/support/end-of-life-announcements/hardware-end-of-life-dates"
+WINDOWS_CLIENT_URL = "https://learn.microsoft.com/en-us/windows/release-health/supported-versions-windows-client"
+WINDOWS_11_URL = "https://learn.microsoft.com/en-us/windows/release-health/windows11-release-information"
+
+_modules = {}
+
+
+def load_scraper_module(relative_path):
+    """Import a scraper script from the Day_* folders by file path (cached)."""
+    if relative_path not in _modules:
+        path = os.path.join(REPO_ROOT, relative_path)
+        name = os.path.splitext(relative_path.replace("/", "_"))[0]
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[relative_path] = module
+    return _modules[relative_path]
+
+
+# --- Source runners: each mirrors the usage block of its script ---
+
+def run_troemner(pool):
+    module = load_scraper_module("Day_4/Program/TroemnerScraper.py")
+    scraper = module.TroemnerScraper(pool=pool)
+    try:
+        if not scraper.load_listing_pages(TROEMNER_URL):
+            scraper.open_website(TROEMNER_URL)
+            scraper.scroll_and_load()
+            scraper.scrape_products()
+        return pd.DataFrame(scraper.data)
+    finally:
+        scraper.close()
+
+
+def run_palo_alto_software(pool):
+    module = load_scraper_module("Day_5/Program/EOL_Summary_2ndScript.py")
+    scraper = module.PaloAltoScraper(pool=pool, fetch_mode="http")
+    try:
+        scraper.open_website(PALO_ALTO_SOFTWARE_URL)
+        scraper.scrape_tables()
+        return scraper.to_dataframe()
+    finally:
+        scraper.close()
+
+
+def run_palo_alto_hardware(pool):
+    module = load_scraper_module("Day_5/Program/PaloAltoScraper.py")
+    scraper = module.PaloAltoScraper(pool=pool, fetch_mode="http")
+    try:
+        scraper.open_website(PALO_ALTO_HARDWARE_URL)
+        scraper.extract_data()
+        return scraper.to_dataframe()
+    finally:
+        scraper.close()
+
+
+def run_windows_client(pool):
+    module = load_scraper_module("Day_3/Program/WindowsClientVersions.py")
+    scraper = module.WindowsClientVersions(pool=pool, fetch_mode="http")
+    try:
+        scraper.open_website(WINDOWS_CLIENT_URL)
+        return scraper.scrape_tables()
+    finally:
+        scraper.close()
+
+
+def run_windows_11(pool):
+    module = load_scraper_module("Day_3/Program/Windows11ReleaseInfo.py")
+    scraper = module.Windows11ReleaseInfo(pool=pool, fetch_mode="http")
+    try:
+        scraper.open_website(WINDOWS_11_URL)
+        scraper.expand_sections()
+        return scraper.scrape_tables()
+    finally:
+        scraper.close()
+
+
+def run_research_papers(pool, query="machine learning agriculture", max_results=5):
+    module = load_scraper_module("Day_2/Program/research_paper_scrapper.py")
+    scraper = module.ResearchPaperScraper(pool=pool)
+    scraper.collect_results(query, max_results=max_results)
+    return pd.DataFrame(scraper.all_results)
+
+
+class Source:
+    """One registered scraper: a name, the host(s) it hits, and a runner(pool) -> DataFrame."""
+
+    def __init__(self, name, hosts, run):
+        self.name = name
+        self.hosts = (hosts,) if isinstance(hosts, str) else tuple(hosts)
+        self.run = run
+
+
+SOURCES = {
+    source.name: source
+    for source in [
+        Source("troemner", "www.troemner.com", run_troemner),
+        Source("palo_alto_software_eol", "www.paloaltonetworks.com", run_palo_alto_software),
+        Source("palo_alto_hardware_eol", "www.paloaltonetworks.com", run_palo_alto_hardware),
+        Source("windows_client", "learn.microsoft.com", run_windows_client),
+        Source("windows_11_release_info", "learn.microsoft.com", run_windows_11),
+        Source("research_papers", ("arxiv.org", "citeseerx.ist.psu.edu", "core.ac.uk"), run_research_papers),
+    ]
+}
+
+
+class CrawlOrchestrator:
+    """Runs registered sources concurrently with global and per-host limits."""
+
+    def __init__(self, sources=None, max_concurrency=4, per_host_limit=1, min_host_interval=1.0, pool=None):
+        self.sources = sources or SOURCES
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.min_host_interval = min_host_interval
+        self.pool = pool  # None: each source leases from the pool of its browser profile
+        self.results = {}
+
+    async def _wait_for_host(self, host, host_state):
+        """Space out starts against the same host by ``min_host_interval`` seconds."""
+        async with host_state["lock"]:
+            delay = host_state["next_start"] - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            host_state["next_start"] = time.monotonic() + self.min_host_interval
+
+    async def _run_source(self, source, limiter, hosts):
+        # Host slots first, in a fixed order: a source queued behind a busy host
+        # must not hold a global slot another host's source could use
+        async with contextlib.AsyncExitStack() as stack:
+            for host in sorted(source.hosts):
+                await stack.enter_async_context(hosts[host]["semaphore"])
+            for host in sorted(source.hosts):
+                await self._wait_for_host(host, hosts[host])
+            async with limiter:
+                await self._run_in_thread(source)
+
+    async def _run_in_thread(self, source):
+        """Run one source on a worker thread and record its status, rows and wall-clock time."""
+        started = time.perf_counter()
+        try:
+            pool = self.pool or get_driver_pool(headless=True, profile=source.name)
+            df = await asyncio.to_thread(source.run, pool)
+            result = {"status": "ok", "rows": len(df), "data": df, "error": ""}
+        except Exception as e:
+            print(f"[ERROR] {source.name} failed: {e}")
+            result = {"status": "failed", "rows": 0, "data": pd.DataFrame(), "error": str(e)}
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        metrics.observe("source", result["seconds"], source=source.name, status=result["status"])
+        print(f"[INFO] {source.name}: {result['status']}, {result['rows']} rows in {result['seconds']}s")
+        self.results[source.name] = result
+
+    async def run(self, names=None):
+        """Run the named sources (all by default) and return {name: result}."""
+        selected = [self.sources[name] for name in (names or self.sources)]
+        limiter = asyncio.Semaphore(self.max_concurrency)
+        hosts = {
+            host: {
+                "semaphore": asyncio.Semaphore(self.per_host_limit),
+                "lock": asyncio.Lock(),
+                "next_start": 0.0,
+            }
+            for source in selected
+            for host in source.hosts
+        }
+        started = time.perf_counter()
+        await asyncio.gather(*(self._run_source(source, limiter, hosts) for source in selected))
+        print(f"[INFO] Crawl finished in {time.perf_counter() - started:.2f}s")
+        return self.results
+
+    def run_sync(self, names=None):
+        """Blocking wrapper around :meth:`run`."""
+        return asyncio.run(self.run(names))
+
+    def timings(self):
+        """Per-source status, row count and seconds as a DataFrame."""
+        return pd.DataFrame(
+            [{"source": name, **{k: v for k, v in r.items() if k != "data"}} for name, r in self.results.items()]
+        )
+
+
+if __name__ == "__main__":
+    orchestrator = CrawlOrchestrator(max_concurrency=4)
+    orchestrator.run_sync()
+    print(orchestrator.timings())
+    print(f"[INFO] Metrics saved to {metrics.save_report()} and {metrics.save_prometheus()}")
@@ -0,0 +1,137 @@
+"""On-disk cache of extracted PDF tables, per page.
+
+Extracting tables is by far the slowest part of reading a PDF, and most
+reruns see pages that were extracted before: the same file while tuning
+settings, or a new monthly edition where only a few pages changed. Entries
+are keyed on:
+
+- the extraction settings (a different ``table_settings`` never reuses
+  tables from another),
+- the page's content hash (its content streams, media box and rotation,
+  plus a digest of its resolved resources: fonts, form and image XObjects,
+  color spaces), so an unchanged page is reused even when the file around
+  it changed or the page moved, while a page that draws the same
+  operators with a different font or embedded form is extracted again,
+
+and a per-file manifest, keyed on the file's own hash, remembers each
+page's content hash so rerunning on an identical file doesn't have to
+re-read the pages at all.
+
+Layout: ``<cache_dir>/<settings hash>/pages/<page hash>.json`` and
+``<cache_dir>/<settings hash>/files/<file hash>.json``.
+"""
+
+import hashlib
+import json
+import os
+
+from pdfminer.pdftypes import PDFObjRef, PDFStream, resolve1
+from pdfminer.psparser import PSKeyword, PSLiteral
+
+from scraper_utils.incremental import fingerprint
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "scraper_utils", "pdf_tables")
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """SHA-1 of a file's bytes, read in chunks."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _object_digest(obj, memo, active):
+    """SHA-1 of a PDF object with its references resolved, stream data included.
+
+    ``memo`` holds the digest of every indirect object seen so far (fonts and
+    images are shared by many pages); ``active`` breaks reference cycles.
+    """
+    if isinstance(obj, PDFObjRef):
+        if obj.objid in memo:
+            return memo[obj.objid]
+        if obj.objid in active:
+            return f"ref:{obj.objid}"
+        active.add(obj.objid)
+        try:
+            value = _object_digest(obj.resolve(), memo, active)
+        finally:
+            active.discard(obj.objid)
+        memo[obj.objid] = value
+        return value
+
+    digest = hashlib.sha1(type(obj).__name__.encode("utf-8"))
+    if isinstance(obj, PDFStream):
+        digest.update(_object_digest(obj.attrs, memo, active).encode("utf-8"))
+        digest.update(obj.get_data())
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=str):
+            digest.update(f"{key}=".encode("utf-8"))
+            digest.update(_object_digest(obj[key], memo, active).encode("utf-8"))
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            digest.update(_object_digest(item, memo, active).encode("utf-8"))
+    elif isinstance(obj, (PSLiteral, PSKeyword)):
+        digest.update(repr(obj.name).encode("utf-8"))
+    else:
+        digest.update(repr(obj).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def page_hash(page, memo=None):
+    """SHA-1 of what a pdfplumber page draws: content streams, media box, rotation and resources.
+
+    Pass the same ``memo`` dict for every page of a document so shared
+    fonts and XObjects are only hashed once.
+    """
+    memo = {} if memo is None else memo
+    digest = hashlib.sha1(repr((page.page_obj.mediabox, page.rotation)).encode("utf-8"))
+    for stream in page.page_obj.contents:
+        digest.update(resolve1(stream).get_data())
+    digest.update(_object_digest(page.page_obj.resources, memo, set()).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class PdfTableCache:
+    """Tables per page content hash, for one set of extraction settings."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, table_settings=None):
+        self.folder = os.path.join(cache_dir, fingerprint(table_settings or {}))
+        os.makedirs(os.path.join(self.folder, "pages"), exist_ok=True)
+        os.makedirs(os.path.join(self.folder, "files"), exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def _read(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path, value):
+        with open(path + ".tmp", "w", encoding="utf-8") as fh:
+            json.dump(value, fh)
+        os.replace(path + ".tmp", path)
+
+    def manifest(self, digest):
+        """Page content hashes of the file with hash ``digest``, or None if unknown."""
+        return self._read(os.path.join(self.folder, "files", f"{digest}.json"))
+
+    def save_manifest(self, digest, page_hashes):
+        self._write(os.path.join(self.folder, "files", f"{digest}.json"), page_hashes)
+
+    def get(self, content_hash, page_number):
+        """Cached tables of a page (renumbered to ``page_number``), or None on a miss."""
+        tables = self._read(os.path.join(self.folder, "pages", f"{content_hash}.json"))
+        if tables is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        for table in tables:
+            table["page"] = page_number
+        return tables
+
+    def put(self, content_hash, tables):
+        self._write(os.path.join(self.folder, "pages", f"{content_hash}.json"), tables)
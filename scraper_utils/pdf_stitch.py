@@ -0,0 +1,140 @@
+"""Stitch PDF tables that continue across pages into typed DataFrames.
+
+``iter_pdf_tables`` yields one table per page region, so a table that runs
+over three pages comes out as three pieces, usually each with the header
+repeated. ``stitch_tables`` merges them in one pass over the page-ordered
+stream: a piece continues the current table when it is the first table on
+the next page, the current table was the last on its page, the column
+counts match and the horizontal extent (bbox) lines up. Only a row equal to
+the first piece's header is taken for a repeated header and dropped; any
+other first row, even one without numbers or dates, is data.
+
+``typed_frame`` then builds the DataFrame once, with a cleaned header and
+numeric / date columns converted, so no ad-hoc pandas cleanup is needed
+afterwards.
+"""
+
+import re
+
+import pandas as pd
+
+from scraper_utils.dates import normalize_date, normalize_date_column
+
+_NUMBER = re.compile(r"^-?\d[\d,]*(?:\.\d+)?%?$")
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+# Identifiers that look numeric but must stay strings ("10.1" is not 10.10)
+_STRING_HEADER = re.compile(r"version|build|kb|sku|model", re.IGNORECASE)
+
+
+def _clean(cell):
+    return " ".join(str(cell).split()) if cell is not None else ""
+
+
+def _looks_like_value(text):
+    return bool(_NUMBER.match(text)) or bool(_ISO_DATE.match(normalize_date(text)))
+
+
+def is_header_row(row):
+    """True for a row that names columns: mostly filled in and free of numbers and dates."""
+    cells = [_clean(c) for c in row if _clean(c)]
+    return len(cells) >= max(1, len(row) // 2) and not any(_looks_like_value(c) for c in cells)
+
+
+def header_names(row):
+    """Column names from a header row: whitespace collapsed, blanks named, duplicates numbered."""
+    names = []
+    for index, cell in enumerate(row, start=1):
+        name = _clean(cell) or f"column_{index}"
+        base, suffix = name, 2
+        while name in names:
+            name = f"{base}_{suffix}"
+            suffix += 1
+        names.append(name)
+    return names
+
+
+def _aligned(a, b, tolerance):
+    return abs(a[0] - b[0]) <= tolerance and abs(a[2] - b[2]) <= tolerance
+
+
+def _new_logical(table):
+    rows = [list(row) for row in table["rows"]]
+    has_header = bool(rows) and is_header_row(rows[0])
+    width = max((len(row) for row in rows), default=0)
+    return {
+        "pages": [table["page"]],
+        "bbox": table["bbox"],
+        "width": width,
+        "header_row": [_clean(c) for c in rows[0]] if has_header else None,
+        "header": header_names(rows[0]) if has_header else [f"column_{i}" for i in range(1, width + 1)],
+        "rows": rows[1:] if has_header else rows,
+    }
+
+
+def _continues(current, last_table, table, tolerance):
+    """Whether ``table`` carries on the logical table whose last piece is ``last_table``."""
+    rows = table["rows"]
+    if not rows or table["page"] != last_table["page"] + 1 or table["table"] != 1:
+        return False
+    # Width and position decide; the first row's text can't (a text-only data row looks like a header)
+    return max(len(row) for row in rows) == current["width"] and _aligned(last_table["bbox"], table["bbox"], tolerance)
+
+
+def _repeats_header(current, row):
+    """Whether ``row`` is the first piece's header row, repeated on a later page."""
+    return current["header_row"] is not None and [_clean(c) for c in row] == current["header_row"]
+
+
+def stitch_tables(tables, tolerance=5.0):
+    """Merge page-ordered tables into logical tables, yielding each one once it is complete.
+
+    Yields ``{"pages", "bbox", "header", "rows"}`` dicts (plus bookkeeping keys).
+    ``tables`` is any page-ordered stream of ``iter_pdf_tables`` dicts.
+    """
+    current = None
+    last_table = None
+    for table in tables:
+        if current is not None and _continues(current, last_table, table, tolerance):
+            rows = [list(row) for row in table["rows"]]
+            if _repeats_header(current, rows[0]):
+                rows = rows[1:]
+            current["rows"].extend(rows)
+            current["pages"].append(table["page"])
+        else:
+            if current is not None:
+                yield current
+            current = _new_logical(table)
+        last_table = table
+    if current is not None:
+        yield current
+
+
+def _typed_column(values):
+    """Convert a column of cell strings to numbers or datetimes when every value fits."""
+    filled = values[values != ""]
+    if filled.empty:
+        return values.astype("string")
+    if filled.str.match(_NUMBER).all():
+        return pd.to_numeric(values.str.replace(",", "").str.rstrip("%"), errors="coerce")
+    dates = normalize_date_column(values)
+    if dates[values != ""].str.match(_ISO_DATE).all():
+        return pd.to_datetime(dates.where(dates != ""), errors="coerce")
+    return values.astype("string")
+
+
+def _cell(row, index):
+    """Cell text with surrounding space stripped; line breaks inside a cell are kept."""
+    return str(row[index]).strip() if index < len(row) and row[index] is not None else ""
+
+
+def typed_frame(logical):
+    """One DataFrame for a stitched table, with numeric and date columns typed."""
+    width = len(logical["header"])
+    rows = [[_cell(row, i) for i in range(width)] for row in logical["rows"]]
+    df = pd.DataFrame(rows, columns=logical["header"])
+    for column in df.columns:
+        if _STRING_HEADER.search(column):
+            df[column] = df[column].astype("string")
+        else:
+            df[column] = _typed_column(df[column])
+    return df
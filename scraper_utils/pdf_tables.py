@@ -0,0 +1,120 @@
+"""Parallel, page-level table extraction from PDFs with pdfplumber.
+
+``pdf.pages`` walked in one process is slow on support matrices hundreds of
+pages long. ``iter_pdf_tables`` instead:
+
+- splits the document into page ranges and extracts them on a process
+  pool (each worker opens the PDF once per range),
+- skips pages with no ruling lines before running the table finder, since
+  the default "lines" strategy can't find a table there anyway,
+- with a ``PdfTableCache``, reuses the tables of pages whose content was
+  extracted before and only sends the other pages to the workers,
+- yields tables in page order as ranges finish, so callers can stream
+  them to a sink instead of keeping every table in memory.
+
+Each table is a dict: ``{"page", "table", "bbox", "rows"}`` where ``rows``
+is a list of lists of cell strings (None for empty cells).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pdfplumber
+
+from scraper_utils.pdf_cache import file_hash, page_hash
+
+LINE_STRATEGIES = ("lines", "lines_strict")
+
+
+def _needs_ruling_lines(table_settings):
+    settings = table_settings or {}
+    return (settings.get("vertical_strategy", "lines") in LINE_STRATEGIES
+            and settings.get("horizontal_strategy", "lines") in LINE_STRATEGIES)
+
+
+def extract_page_tables(page, table_settings=None):
+    """Tables on one pdfplumber page; pages without ruling lines are skipped cheaply."""
+    if _needs_ruling_lines(table_settings) and not (page.horizontal_edges and page.vertical_edges):
+        return []
+    return [
+        {"page": page.page_number, "table": index, "bbox": list(table.bbox), "rows": table.extract()}
+        for index, table in enumerate(page.find_tables(table_settings or {}), start=1)
+    ]
+
+
+def _extract_pages(task):
+    """Worker: {page number: tables} for the given 1-based page numbers of a PDF."""
+    pdf_path, page_numbers, table_settings = task
+    tables = {}
+    with pdfplumber.open(pdf_path, pages=page_numbers) as pdf:
+        for page in pdf.pages:
+            tables[page.page_number] = extract_page_tables(page, table_settings)
+            page.close()  # drop the page's cached objects before the next one
+    return tables
+
+
+def page_ranges(page_numbers, pages_per_task):
+    """Split a list of page numbers into consecutive chunks of ``pages_per_task``."""
+    return [page_numbers[i:i + pages_per_task] for i in range(0, len(page_numbers), pages_per_task)]
+
+
+def _page_hashes(pdf_path, cache):
+    """Content hash of every page, from the file manifest when the file was seen before."""
+    digest = file_hash(pdf_path)
+    hashes = cache.manifest(digest)
+    if hashes is None:
+        memo = {}
+        with pdfplumber.open(pdf_path) as pdf:
+            hashes = [page_hash(page, memo) for page in pdf.pages]
+        cache.save_manifest(digest, hashes)
+    return hashes
+
+
+def iter_pdf_tables(pdf_path, workers=None, pages_per_task=8, table_settings=None, cache=None):
+    """Yield every table of ``pdf_path`` in page order, extracting page ranges in parallel.
+
+    ``cache`` is an optional ``PdfTableCache`` built with the same
+    ``table_settings``; only pages it doesn't know are extracted.
+    """
+    cached = {}
+    if cache is not None:
+        hashes = _page_hashes(pdf_path, cache)
+        for number, content_hash in enumerate(hashes, start=1):
+            tables = cache.get(content_hash, number)
+            if tables is not None:
+                cached[number] = tables
+        page_count = len(hashes)
+    else:
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+
+    missing = [number for number in range(1, page_count + 1) if number not in cached]
+    tasks = [(pdf_path, chunk, table_settings) for chunk in page_ranges(missing, pages_per_task)]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        # A single range (or CPU) runs inline: a process pool would only add start-up cost
+        results = executor.map(_extract_pages, tasks) if executor else map(_extract_pages, tasks)
+        extracted = {}
+        for number in range(1, page_count + 1):
+            if number in cached:
+                yield from cached.pop(number)
+                continue
+            while number not in extracted:
+                extracted.update(next(results))
+            tables = extracted.pop(number)
+            if cache is not None:
+                cache.put(hashes[number - 1], tables)
+            yield from tables
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def table_records(table):
+    """One sink row per table row: page, table number, row number and cell values."""
+    return [
+        {"page": table["page"], "table": table["table"], "row": number, "cells": row}
+        for number, row in enumerate(table["rows"])
+    ]
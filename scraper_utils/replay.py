@@ -0,0 +1,158 @@
+"""Record/replay of fetched pages for fast, deterministic re-runs.
+
+In ``record`` mode every page a scraper reads is saved to a compressed zip
+archive: plain HTTP responses as fetched, browser pages as rendered (the
+DOM after waits, scrolling and expansion, right before extraction). In
+``replay`` mode the scrapers read those pages back as ``StaticPage``\\ s
+instead of touching the network or starting Chrome, so an extraction fix
+can be re-run in milliseconds, and an old archive can be re-processed
+with a newer parser.
+
+Turn it on for a whole run with environment variables::
+
+    SCRAPER_ARCHIVE_MODE=record SCRAPER_ARCHIVE=output/page_archive.zip python ...
+    SCRAPER_ARCHIVE_MODE=replay SCRAPER_ARCHIVE=output/page_archive.zip python ...
+
+or in code with ``set_archive(PageArchive(path, "replay"))``. A URL
+missing from a replayed archive is fetched live, with a warning.
+
+Each page is one zip entry; the URL is kept in the entry comment and
+re-recording a URL adds a newer entry that wins on replay.
+"""
+
+import atexit
+import hashlib
+import os
+import threading
+import time
+import zipfile
+
+from scraper_utils.http_fetch import StaticPage, parse_html
+
+DEFAULT_ARCHIVE = os.path.join("output", "page_archive.zip")
+MODES = ("off", "record", "replay")
+
+
+class PageArchive:
+    """Zip archive of page sources keyed by URL."""
+
+    def __init__(self, path=DEFAULT_ARCHIVE, mode="replay"):
+        if mode not in MODES:
+            raise ValueError(f"Archive mode must be one of {MODES}, not {mode!r}")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._zip = None
+        self._index = {}     # url -> newest entry name
+        self._versions = {}  # url hash -> entries recorded so far
+        if mode == "off":
+            return
+        if mode == "record":
+            folder = os.path.dirname(path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            self._zip = zipfile.ZipFile(path, "a", compression=zipfile.ZIP_DEFLATED, compresslevel=6)
+        else:
+            self._zip = zipfile.ZipFile(path, "r")
+        for info in self._zip.infolist():
+            self._index[info.comment.decode("utf-8")] = info.filename
+            digest = info.filename.split("/")[1]
+            self._versions[digest] = self._versions.get(digest, 0) + 1
+
+    @property
+    def recording(self):
+        return self.mode == "record"
+
+    @property
+    def replaying(self):
+        return self.mode == "replay"
+
+    def record(self, url, source):
+        """Store the page source (str or bytes) of ``url``."""
+        if not self.recording or not url:
+            return
+        data = source.encode("utf-8") if isinstance(source, str) else source
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        with self._lock:
+            version = self._versions.get(digest, 0)
+            self._versions[digest] = version + 1
+            info = zipfile.ZipInfo(f"pages/{digest}/{version:04d}.html", date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.comment = url.encode("utf-8")
+            self._zip.writestr(info, data)
+            self._index[url] = info.filename
+
+    def get(self, url):
+        """Archived source of ``url`` as bytes, or None."""
+        name = self._index.get(url)
+        if name is None or self._zip is None:
+            return None
+        with self._lock:
+            return self._zip.read(name)
+
+    def urls(self):
+        return list(self._index)
+
+    def close(self):
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_archive():
+    """The active archive; configured from SCRAPER_ARCHIVE_MODE / SCRAPER_ARCHIVE on first use."""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            mode = os.environ.get("SCRAPER_ARCHIVE_MODE", "off").lower()
+            _archive = PageArchive(os.environ.get("SCRAPER_ARCHIVE", DEFAULT_ARCHIVE), mode)
+        return _archive
+
+
+def set_archive(archive):
+    """Make ``archive`` the active one (``None`` re-reads the environment on next use)."""
+    global _archive
+    with _archive_lock:
+        if _archive is not None and _archive is not archive:
+            _archive.close()
+        _archive = archive
+
+
+def replaying():
+    return get_archive().replaying
+
+
+def replay_tree(url):
+    """Parsed archived page for ``url`` when replaying, else None."""
+    archive = get_archive()
+    if not archive.replaying:
+        return None
+    source = archive.get(url)
+    if source is None:
+        print(f"[WARN] {url} not in archive {archive.path}, fetching it live")
+        return None
+    return parse_html(source, base_url=url)
+
+
+def replay_page(url):
+    """``StaticPage`` of the archived ``url`` when replaying, else None."""
+    tree = replay_tree(url)
+    return StaticPage(tree, url) if tree is not None else None
+
+
+def record_page(url, page):
+    """When recording, save the rendered source of a browser page (StaticPages are recorded at fetch)."""
+    archive = get_archive()
+    if archive.recording and page is not None and not isinstance(page, StaticPage):
+        archive.record(url, page.page_source)
+
+
+@atexit.register
+def _close_archive():
+    if _archive is not None:
+        _archive.close()
@@ -0,0 +1,125 @@
+"""Plumbing shared by the scraper classes in the Day_* folders.
+
+Every scraper leases its browser from a ``DriverPool`` only when it needs
+one, reads static pages over plain HTTP first when it can, streams rows to
+an optional sink, and writes incremental runs next to the full snapshot
+instead of over it. ``ScraperMixin`` holds that code once. A scraper sets
+the class attributes below, and its ``__init__`` defines the instance
+attributes the methods use: ``pool``, ``driver``, ``wait``, ``page``,
+``url`` and ``data`` (plus ``fetch_mode``, ``state`` and ``sink`` when it
+supports them)::
+
+    class PaloAltoScraper(ScraperMixin):
+        SOURCE = "palo_alto_hardware_eol"
+        STATIC_XPATH = "//table//tr"
+        READY_XPATH = "//tbody//tr"
+"""
+
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from scraper_utils.columnar import write_parquet
+from scraper_utils.delta import changes_path, write_delta
+from scraper_utils.http_fetch import NOT_MODIFIED, StaticPage, fetch_tree
+from scraper_utils.metrics import metrics
+from scraper_utils.replay import replaying
+
+
+class ScraperMixin:
+    """Lazy browser lease, HTTP-first page loading, row emission and snapshot paths."""
+
+    # Label for the scraper's metrics
+    SOURCE = None
+    # Seconds the browser may take to show READY_XPATH
+    WAIT_TIMEOUT = 15
+    # Must be in the static HTML for plain HTTP to be enough
+    STATIC_XPATH = "//table"
+    # Must be in the browser's DOM before the page is scraped
+    READY_XPATH = "//table"
+    # Extra pause after READY_XPATH for content that keeps rendering
+    SETTLE_SECONDS = 0
+
+    # Defaults for scrapers without these features
+    fetch_mode = "browser"  # or "http" to try plain HTTP + lxml first
+    state = None  # optional CrawlState: only emit tables/rows changed since the last run
+    sink = None  # optional scraper_utils.sinks sink: rows are streamed to it instead of kept in self.data
+
+    def _ensure_driver(self):
+        """Lease a browser from the pool the first time one is needed."""
+        if self.driver is None:
+            self.driver = self.pool.acquire()
+            self.wait = WebDriverWait(self.driver, self.WAIT_TIMEOUT)
+
+    def open_website(self, url):
+        """Open ``url`` and wait for its content, over plain HTTP first when fetch_mode is "http".
+
+        While replaying, the archived page is always used. ``page`` is left
+        None when an incremental fetch finds the page unchanged.
+        """
+        self.url = url
+        if self.fetch_mode == "http" or replaying():
+            tree = fetch_tree(url, expected_xpath=self.STATIC_XPATH, state=self.state)
+            if tree is NOT_MODIFIED:
+                self.page = None  # unchanged since the last run: nothing to extract
+                return
+            if tree is not None:
+                self.page = StaticPage(tree, url)
+                return
+
+        self._ensure_driver()
+        self.pool.load(self.driver, url)
+        with metrics.timer("wait", scraper=self.SOURCE):
+            self.wait.until(EC.presence_of_element_located((By.XPATH, self.READY_XPATH)))
+            if self.SETTLE_SECONDS:
+                time.sleep(self.SETTLE_SECONDS)
+        self.page = self.driver
+
+    def _emit(self, records):
+        """Stream records to the sink, or keep them in ``self.data`` when there is none."""
+        metrics.count("rows", len(records), scraper=self.SOURCE)
+        if self.sink is not None:
+            self.sink.write_many(records)
+        else:
+            self.data.extend(records)
+
+    def _rows(self):
+        """The rows collected in ``self.data``; raises when they were streamed to a sink instead.
+
+        With a sink ``self.data`` stays empty, so saving it would silently
+        replace a snapshot with an empty file.
+        """
+        if self.sink is not None:
+            raise RuntimeError(f"{self.SOURCE} rows were streamed to {self.sink.path}; read them from there")
+        return self.data
+
+    def _output_path(self, path):
+        """``path``, or ``<stem>_changes<ext>`` on an incremental run, which only holds changed rows."""
+        return changes_path(path) if self.state is not None else path
+
+    def _write_csv(self, df, path, delta=False, key_columns=(), **csv_options):
+        """Write ``df`` to ``path`` (plus a delta file when delta=True); returns the path written.
+
+        An incremental run writes ``<stem>_changes.csv`` and no delta, so
+        neither the full snapshot nor its delta log sees a partial frame.
+        """
+        if self.state is None and delta and not df.empty:
+            write_delta(df, path, key_columns)
+        path = self._output_path(path)
+        df.to_csv(path, index=False, **csv_options)
+        return path
+
+    def _write_parquet(self, df, path, **columns):
+        """Write ``df`` as typed Parquet (see ``columnar.write_parquet``), next to the snapshot when incremental."""
+        return write_parquet(df, self._output_path(path), **columns)
+
+    def close(self):
+        """Return the browser to the pool, save the crawl state and flush the sink."""
+        self.pool.release(self.driver)
+        self.driver = None
+        if self.state is not None:
+            self.state.save()
+        if self.sink is not None:
+            self.sink.flush()
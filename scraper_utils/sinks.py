@@ -0,0 +1,220 @@
+"""Streaming row sinks: write scraped rows to disk as they are extracted.
+
+Scrapers used to collect every row in ``self.data`` and build a DataFrame at
+the end, so memory grew with the crawl and a crash lost everything. A sink
+buffers ``batch_size`` rows, then appends them to the output file, so memory
+stays flat and a crashed run keeps what it already flushed.
+
+With ``resume=True`` and ``key_fields`` a sink reopens an existing output,
+loads the keys already written and silently skips rows with those keys, so
+a rerun continues where the previous one stopped.
+
+- ``CsvSink``     -> one CSV file (header written once)
+- ``JsonlSink``   -> one JSON object per line
+- ``ParquetSink`` -> a directory of ``part-NNNNN.parquet`` files, one per
+  flushed batch (a Parquet file can't be appended to, and a half-written
+  single file would be unreadable after a crash)
+
+``open_sink(path)`` picks the sink from the file extension.
+"""
+
+import csv
+import glob
+import json
+import os
+
+
+class RowSink:
+    """Base class: batching, resume bookkeeping and context-manager support."""
+
+    def __init__(self, path, batch_size=100, resume=False, key_fields=None):
+        self.path = path
+        self.batch_size = batch_size
+        self.resume = resume
+        self.key_fields = list(key_fields or [])
+        self.rows_written = 0
+        self._buffer = []
+        self._keys = set()
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        if resume and self.key_fields:
+            self._keys = {self._key(row) for row in self._existing_rows()}
+
+    def _key(self, row):
+        return tuple(str(row.get(field, "")) for field in self.key_fields)
+
+    def _existing_rows(self):
+        """Rows already in the output (used to resume)."""
+        return []
+
+    def _write_batch(self, rows):
+        raise NotImplementedError
+
+    def seen(self, row):
+        """True if a row with the same key was already written (resume mode)."""
+        return bool(self.key_fields) and self._key(row) in self._keys
+
+    def write(self, row):
+        """Queue one row; the batch is flushed once ``batch_size`` rows are queued."""
+        if self.key_fields:
+            key = self._key(row)
+            if key in self._keys:
+                return
+            self._keys.add(key)
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, rows):
+        for row in rows:
+            self.write(row)
+
+    def flush(self):
+        """Write the queued rows to disk."""
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self.rows_written += len(self._buffer)
+            self._buffer = []
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class CsvSink(RowSink):
+    """Appends rows to a CSV file; the header comes from ``fieldnames`` or the first row."""
+
+    def __init__(self, path, fieldnames=None, **kwargs):
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        super().__init__(path, **kwargs)
+        self._file = None
+        self._writer = None
+
+    def _existing_rows(self):
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, "r", encoding="utf-8", newline="") as cf:
+            reader = csv.DictReader(cf)
+            self.fieldnames = self.fieldnames or reader.fieldnames
+            return list(reader)
+
+    def _write_batch(self, rows):
+        if self._writer is None:
+            append = self.resume and os.path.exists(self.path) and os.path.getsize(self.path) > 0
+            self.fieldnames = self.fieldnames or list(rows[0].keys())
+            self._file = open(self.path, "a" if append else "w", encoding="utf-8", newline="")
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction="ignore")
+            if not append:
+                self._writer.writeheader()
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def close(self):
+        super().close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+
+class JsonlSink(RowSink):
+    """Appends rows as JSON lines."""
+
+    def _existing_rows(self):
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, "r", encoding="utf-8") as jf:
+            return [json.loads(line) for line in jf if line.strip()]
+
+    def _write_batch(self, rows):
+        mode = "a" if self.resume or self.rows_written else "w"
+        with open(self.path, mode, encoding="utf-8") as jf:
+            for row in rows:
+                jf.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+
+
+def _conform(table, schema):
+    """``table`` cast to ``schema``; columns it lacks are filled with nulls."""
+    import pyarrow as pa
+    columns = [
+        table.column(field.name).cast(field.type) if field.name in table.column_names else pa.nulls(len(table), field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+class ParquetSink(RowSink):
+    """Writes each flushed batch as a new Parquet part file inside ``path``.
+
+    All parts share one schema, so the directory reads back as one table:
+    ``schema`` when given, else the one inferred from the rows. A column
+    that only held None so far takes its type from the first batch with
+    values (as do new columns, and int columns that turn out to hold
+    floats); the parts already written are then rewritten to that schema.
+    """
+
+    def __init__(self, path, schema=None, **kwargs):
+        self.schema = schema
+        self._fixed_schema = schema is not None
+        super().__init__(path, **kwargs)
+        os.makedirs(path, exist_ok=True)
+        if not self.resume:
+            for part in self._parts():
+                os.remove(part)
+        elif self.schema is None and self._parts():
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            self.schema = pa.unify_schemas([pq.read_schema(part) for part in self._parts()], promote_options="permissive")
+        self._next_part = len(self._parts())
+
+    def _parts(self):
+        return sorted(glob.glob(os.path.join(self.path, "part-*.parquet")))
+
+    def _existing_rows(self):
+        import pyarrow.parquet as pq
+        rows = []
+        for part in self._parts():
+            rows.extend(pq.read_table(part, columns=self.key_fields).to_pylist())
+        return rows
+
+    def _write_part(self, table, part):
+        import pyarrow.parquet as pq
+        pq.write_table(table, part + ".tmp")
+        os.replace(part + ".tmp", part)  # never leave a half-written part behind
+
+    def _write_batch(self, rows):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        if self._fixed_schema:
+            table = pa.Table.from_pylist(rows, schema=self.schema)
+        else:
+            table = pa.Table.from_pylist(rows)
+            schema = table.schema
+            if self.schema is not None:
+                schema = pa.unify_schemas([self.schema, schema], promote_options="permissive")
+                if not schema.equals(self.schema):
+                    # A null column got its type (or a column was added): bring the earlier parts along
+                    for part in self._parts():
+                        self._write_part(_conform(pq.read_table(part), schema), part)
+            self.schema = schema
+            table = _conform(table, schema)
+        self._write_part(table, os.path.join(self.path, f"part-{self._next_part:05d}.parquet"))
+        self._next_part += 1
+
+
+def open_sink(path, **kwargs):
+    """Create the sink matching ``path``: .csv, .jsonl, or .parquet (a directory)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return CsvSink(path, **kwargs)
+    if extension in (".jsonl", ".ndjson"):
+        return JsonlSink(path, **kwargs)
+    if extension == ".parquet":
+        return ParquetSink(path, **kwargs)
+    raise ValueError(f"Unsupported sink type for {path}")
@@ -0,0 +1,113 @@
+"""Bulk extraction of HTML tables in a single round trip.
+
+Walking a table with ``find_elements`` per row and ``.text`` per cell costs
+one WebDriver HTTP call per cell. ``extract_tables`` instead returns the full
+structure of every matching table at once: with a live browser it runs one
+``execute_script`` call, with a ``StaticPage`` it walks the lxml tree.
+
+Each table is returned as a list of rows::
+
+    {"section": "thead" | "tbody" | "tfoot",
+     "cells": [{"tag": "td", "text": ..., "html": ..., "colspan": 1,
+                "rowspan": 1, "bold": [...], "b": [...], "links": [...]}, ...]}
+
+``bold`` lists the text of every <b>/<strong> inside the cell (empty strings
+included, so "has bold" checks still work), ``b`` the same for <b> alone
+(what the scrapers' ``.//b`` lookups matched), and ``links`` holds the
+absolute hrefs of its anchors.
+"""
+
+from scraper_utils.http_fetch import StaticPage, element_text, inner_html
+from scraper_utils.metrics import metrics
+
+TABLE_SNAPSHOT_JS = """
+const snapshot = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const tables = [];
+for (let i = 0; i < snapshot.snapshotLength; i++) {
+    const rows = [];
+    for (const tr of snapshot.snapshotItem(i).rows) {
+        const cells = [];
+        for (const cell of tr.cells) {
+            cells.push({
+                tag: cell.tagName.toLowerCase(),
+                text: cell.innerText.trim(),
+                html: cell.innerHTML,
+                colspan: cell.colSpan,
+                rowspan: cell.rowSpan,
+                bold: Array.from(cell.querySelectorAll("b, strong"), b => b.innerText.trim()),
+                b: Array.from(cell.querySelectorAll("b"), b => b.innerText.trim()),
+                links: Array.from(cell.querySelectorAll("a[href]"), a => a.href),
+            });
+        }
+        rows.push({section: tr.parentNode.tagName.toLowerCase(), cells: cells});
+    }
+    tables.push(rows);
+}
+return tables;
+"""
+
+
+def _span(value):
+    """Parse a colspan/rowspan attribute, defaulting to 1."""
+    try:
+        return max(int(value), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+def _tree_tables(page, xpath):
+    """Extract tables from a parsed lxml page."""
+    tables = []
+    for table in page.element.xpath(xpath):
+        rows = []
+        # Direct rows and rows of thead/tbody/tfoot only, so nested tables stay separate
+        for tr in table.xpath("./tr | ./thead/tr | ./tbody/tr | ./tfoot/tr"):
+            section = tr.getparent().tag
+            cells = []
+            for cell in tr.xpath("./td | ./th"):
+                cells.append({
+                    "tag": cell.tag,
+                    "text": element_text(cell),
+                    "html": inner_html(cell),
+                    "colspan": _span(cell.get("colspan")),
+                    "rowspan": _span(cell.get("rowspan")),
+                    "bold": [element_text(b) for b in cell.xpath(".//b | .//strong")],
+                    "b": [element_text(b) for b in cell.xpath(".//b")],
+                    "links": cell.xpath(".//a/@href"),
+                })
+            # lxml doesn't insert an implicit <tbody> the way browsers do
+            rows.append({"section": section if section in ("thead", "tbody", "tfoot") else "tbody", "cells": cells})
+        tables.append(rows)
+    return tables
+
+
+def extract_tables(page, xpath="//table"):
+    """Return every table matching ``xpath`` as a list of rows, in one round trip."""
+    if isinstance(page, StaticPage):
+        with metrics.timer("extract_tables", mode="http"):
+            return _tree_tables(page, xpath)
+    with metrics.timer("extract_tables", mode="browser"):
+        return page.execute_script(TABLE_SNAPSHOT_JS, xpath)
+
+
+def header_texts(table):
+    """Text of every <th> cell in the table, in document order."""
+    return [cell["text"] for row in table for cell in row["cells"] if cell["tag"] == "th"]
+
+
+def data_rows(table, section=None):
+    """Rows that contain at least one <td>, optionally limited to one section."""
+    return [
+        row for row in table
+        if any(cell["tag"] == "td" for cell in row["cells"]) and (section is None or row["section"] == section)
+    ]
+
+
+def section_rows(table, section):
+    """Rows of one section (e.g. "tbody"), mirroring XPath like ``.//tbody/tr``."""
+    return [row for row in table if row["section"] == section]
+
+
+def td_cells(row):
+    """The <td> cells of a row (row-header <th> cells are skipped)."""
+    return [cell for cell in row["cells"] if cell["tag"] == "td"]
@@ -0,0 +1,36 @@
+import json
+
+from benchmarks.fixtures import arxiv_page
+from benchmarks.run import ARXIV_URL, CASES, compare, main
+from scraper_utils.replay import PageArchive
+
+
+def test_fixture_run_saves_a_baseline(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    assert main(["palo_alto_hardware", "--repeat", "1", "--save-baseline", "--baseline", str(baseline)]) == 0
+    result = json.loads(baseline.read_text())["palo_alto_hardware"]
+    assert result["pages"] == 1 and result["rows"] > 0
+
+
+def test_snapshot_run_replays_recorded_pages(tmp_path):
+    arxiv_page(str(tmp_path))
+    search = f"{ARXIV_URL}?query=machine learning agriculture&searchtype=all&abstracts=show&size=50&order=-announced_date_first"
+    archive = PageArchive(str(tmp_path / "snapshots.zip"), "record")
+    archive.record(search, (tmp_path / "arxiv" / "search" / "index.html").read_bytes())
+    archive.close()
+
+    output = tmp_path / "results.json"
+    code = main(["arxiv", "--snapshots", str(tmp_path / "snapshots.zip"), "--repeat", "1",
+                 "--baseline", str(tmp_path / "none.json"), "--output", str(output)])
+    assert code == 0
+    result = json.loads(output.read_text())["arxiv"]
+    assert (result["pages"], result["rows"]) == (1, 50)
+
+
+def test_compare_flags_regressions():
+    baseline = {"troemner": {"pages_per_sec": 100.0, "peak_mb": 1.0}}
+    slower = compare({"troemner": {"pages_per_sec": 70.0, "peak_mb": 1.0}}, baseline, 0.2)
+    assert bool(slower["regression"].iloc[0])
+    same = compare({"troemner": {"pages_per_sec": 95.0, "peak_mb": 1.1}}, baseline, 0.2)
+    assert not bool(same["regression"].iloc[0])
+    assert set(CASES) >= {"troemner", "arxiv"}
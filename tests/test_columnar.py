@@ -0,0 +1,37 @@
+import datetime
+import decimal
+
+import pandas as pd
+import pyarrow as pa
+
+from scraper_utils.columnar import to_arrow_table, to_date, to_decimal
+
+
+def test_to_date():
+    assert to_date("Jan 31, 2024") == datetime.date(2024, 1, 31)
+    assert to_date(pd.Timestamp("2024-01-31 00:00")) == datetime.date(2024, 1, 31)
+    assert to_date(datetime.date(2024, 1, 31)) == datetime.date(2024, 1, 31)
+    assert to_date(pd.NaT) is None
+    assert to_date("End of servicing") is None
+
+
+def test_to_decimal():
+    assert to_decimal("$3,150.00") == decimal.Decimal("3150.00")
+    assert to_decimal(12.5, scale=1) == decimal.Decimal("12.5")
+    assert to_decimal(float("nan")) is None
+    assert to_decimal("call for price") is None
+
+
+def test_to_arrow_table_types():
+    df = pd.DataFrame({
+        "Version": [10.1, "139.12.x.x"],
+        "EOL Date": [pd.Timestamp("2025-06-01"), pd.NaT],
+        "price": ["$1.50", None],
+        "vendor": ["Palo Alto", "Palo Alto"],
+    })
+    table = to_arrow_table(df, date_columns=["EOL Date"], decimal_columns=["price"], dictionary_columns=["vendor"])
+    assert table.schema.field("Version").type == pa.string()
+    assert table.column("Version").to_pylist() == ["10.1", "139.12.x.x"]
+    assert table.column("EOL Date").to_pylist() == [datetime.date(2025, 6, 1), None]
+    assert table.column("price").to_pylist() == [decimal.Decimal("1.50"), None]
+    assert pa.types.is_dictionary(table.schema.field("vendor").type)
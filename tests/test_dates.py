@@ -0,0 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from scraper_utils import dates
+from scraper_utils.dates import DateNormalizer, normalize_date, normalize_date_column
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2025-08-13", "2025-08-13"),
+    ("8/13/2025", "2025-08-13"),
+    ("8/13/25", "2025-08-13"),
+    ("August 13, 2025", "2025-08-13"),
+    ("Aug 13th, 2025", "2025-08-13"),
+    ("Sept. 1 2025", "2025-09-01"),
+    ("  2/30/2025 ", "2/30/2025"),
+    ("End of servicing", "End of servicing"),
+    (None, ""),
+])
+def test_normalize_date(value, expected):
+    assert normalize_date(value) == expected
+
+
+def test_unparsed_text_is_not_cached():
+    normalize_date("Contact your account team")
+    assert "Contact your account team" not in dates._cache
+    normalize_date("March 3, 2021")
+    assert dates._cache["March 3, 2021"] == "2021-03-03"
+
+
+def test_normalize_date_column():
+    series = pd.Series(["Jan 5, 2024", None, "1/5/2024", "TBD"])
+    assert list(normalize_date_column(series)) == ["2024-01-05", "", "2024-01-05", "TBD"]
+
+
+def test_shared_normalizer_across_threads():
+    normalizer = DateNormalizer()
+    values = [f"{m}/{d}/2024" for m in range(1, 13) for d in range(1, 29)]
+    values += [f"2024-{m:02d}-{d:02d}" for m in range(1, 13) for d in range(1, 29)]
+    values += [f"March {d}, 2023" for d in range(1, 32)]
+    expected = [normalizer(v) for v in values]
+    dates._cache.clear()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: [normalizer(v) for v in values], range(16)))
+    assert all(result == expected for result in results)
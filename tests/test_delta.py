@@ -0,0 +1,58 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from scraper_utils.delta import diff_snapshots, read_snapshot, write_delta
+from scraper_utils.orchestrator import load_scraper_module
+
+KEY = ["Software Name", "Version"]
+
+
+def frame(*rows):
+    return pd.DataFrame(rows, columns=["Software Name", "Version", "EOL Date"])
+
+
+def test_diff_snapshots_inserts_updates_removals():
+    previous = frame(["PAN-OS", "10.1", "2025-06-01"], ["PAN-OS", "9.1", "2023-12-31"])
+    current = frame(["PAN-OS", "10.1", "2025-07-01"], ["PAN-OS", "11.0", "2026-11-17"])
+    changes = diff_snapshots(previous, current, KEY)
+    assert list(changes["inserts"]["Version"]) == ["11.0"]
+    assert list(changes["updates"]["EOL Date"]) == ["2025-07-01"]
+    assert list(changes["removals"]["Version"]) == ["9.1"]
+
+
+def test_diff_snapshots_needs_a_key():
+    with pytest.raises(ValueError):
+        diff_snapshots(frame(), frame(), [])
+
+
+@pytest.mark.parametrize("empty", [pd.DataFrame(), frame()])
+def test_write_delta_on_empty_input(tmp_path, empty):
+    snapshot = str(tmp_path / "eol.csv")
+    frame(["PAN-OS", "10.1", "2025-06-01"]).to_csv(snapshot, index=False)
+    summary = write_delta(empty, snapshot, KEY)
+    assert (summary["inserts"], summary["updates"], summary["removals"]) == (0, 0, 1)
+    with open(tmp_path / "eol_changes.jsonl", encoding="utf-8") as lf:
+        assert json.loads(lf.readline())["removals"] == 1
+
+
+def test_write_delta_without_previous_snapshot(tmp_path):
+    summary = write_delta(pd.DataFrame(), str(tmp_path / "eol.csv"), KEY)
+    assert summary["inserts"] == summary["removals"] == 0
+    assert summary["delta_file"] == ""
+
+
+@pytest.mark.parametrize("script", [
+    "Day_5/Program/PaloAltoScraper.py",
+    "Day_5/Program/EOL_Summary_PaloAlto.py",
+    "Day_5/Program/EOL_Summary_2ndScript.py",
+])
+def test_palo_alto_save_without_rows(tmp_path, script):
+    module = load_scraper_module(script)
+    scraper = module.PaloAltoScraper()
+    path = str(tmp_path / "eol.csv")
+    scraper.save_to_csv(path, delta=True)
+    assert list(read_snapshot(path).columns) == module.COLUMNS
+    assert not os.path.exists(tmp_path / "eol_changes.jsonl")
@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+from scraper_utils import driver_pool
+from scraper_utils.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+        self.crashed = False
+
+    def execute_script(self, script):
+        if self.crashed:
+            raise RuntimeError("invalid session id")
+        return 1
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def fake_browsers(monkeypatch):
+    """Two shared browser slots and drivers that need no Chrome."""
+    started = []
+
+    def create(pool):
+        driver = FakeDriver()
+        started.append(driver)
+        return driver
+
+    monkeypatch.setattr(driver_pool, "_browser_slots", threading.BoundedSemaphore(2))
+    monkeypatch.setattr(driver_pool, "_live_pools", set())
+    monkeypatch.setattr(DriverPool, "_create_driver", create)
+    return started
+
+
+def live(started):
+    return [d for d in started if not d.quit_called]
+
+
+def test_idle_driver_is_reused(fake_browsers):
+    pool = DriverPool(max_size=2)
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        assert second is first
+    assert len(fake_browsers) == 1
+
+
+def test_driver_is_recycled_after_max_pages(fake_browsers):
+    pool = DriverPool(max_size=1, max_pages=2)
+    with pool.lease() as first:
+        pool.load(first, "https://example.com/1")
+    with pool.lease() as again:
+        assert again is first
+        pool.load(again, "https://example.com/2")
+    assert first.quit_called
+    with pool.lease() as fresh:
+        assert fresh is not first
+    assert len(fake_browsers) == 2
+
+
+def test_unhealthy_driver_is_discarded_on_release(fake_browsers):
+    pool = DriverPool(max_size=1)
+    with pool.lease() as crashed:
+        crashed.crashed = True
+    assert crashed.quit_called
+    with pool.lease() as fresh:
+        assert fresh is not crashed
+    assert live(fake_browsers) == [fresh]
+
+
+def test_idle_browser_of_another_profile_is_evicted(fake_browsers):
+    troemner = DriverPool(max_size=2, profile="troemner")
+    research = DriverPool(max_size=2, profile="research_papers", lease_timeout=1)
+    idle = troemner.acquire()
+    busy = troemner.acquire()
+    troemner.release(idle)
+    driver = research.acquire()
+    assert idle.quit_called and not busy.quit_called
+    assert live(fake_browsers) == [busy, driver]
+
+
+def test_pools_share_the_browser_cap(fake_browsers):
+    troemner = DriverPool(max_size=2, profile="troemner")
+    windows = DriverPool(max_size=2, profile="windows", lease_timeout=0.2)
+    leased = [troemner.acquire(), troemner.acquire()]
+    with pytest.raises(TimeoutError):
+        windows.acquire()
+    assert len(live(fake_browsers)) == 2
+
+    # Idle browsers of another pool are quit to make room
+    for driver in leased:
+        troemner.release(driver)
+    driver = windows.acquire()
+    assert len(live(fake_browsers)) == 2
+    windows.release(driver)
+
+
+def test_closing_a_pool_frees_its_slots(fake_browsers):
+    first = DriverPool(max_size=2)
+    first.acquire()
+    first.acquire()
+    first.close_all()
+    second = DriverPool(max_size=2, lease_timeout=0.2)
+    second.acquire()
+    second.acquire()
+    assert len(live(fake_browsers)) == 2
@@ -0,0 +1,64 @@
+import json
+import time
+
+import pytest
+
+from scraper_utils import driver_resolver
+from scraper_utils.driver_resolver import resolve_chromedriver
+
+
+@pytest.fixture
+def resolver(tmp_path, monkeypatch):
+    """Fresh in-process memo, no CHROMEDRIVER_PATH, a fake driver binary and a counted download."""
+    driver = tmp_path / "chromedriver"
+    driver.write_text("")
+    downloads = []
+
+    def install():
+        downloads.append(1)
+        raise ConnectionError("offline")
+
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    monkeypatch.setattr(driver_resolver, "_resolved_path", driver_resolver._UNRESOLVED)
+    monkeypatch.setattr(driver_resolver, "_install_with_manager", install)
+    monkeypatch.setattr(driver_resolver, "detect_browser_version", lambda: "139")
+    monkeypatch.setattr(driver_resolver.shutil, "which", lambda name: None)
+    return str(tmp_path / "cache.json"), str(driver), downloads
+
+
+def write_cache(cache_file, driver_path, age, version="139"):
+    with open(cache_file, "w", encoding="utf-8") as cf:
+        json.dump({"driver_path": driver_path, "browser_version": version, "resolved_at": time.time() - age}, cf)
+
+
+def test_fresh_cache_needs_no_network(resolver, monkeypatch):
+    cache_file, driver, downloads = resolver
+    write_cache(cache_file, driver, age=60)
+    monkeypatch.setattr(driver_resolver, "detect_browser_version", lambda: pytest.fail("browser probed"))
+    assert resolve_chromedriver(cache_file) == driver
+    assert downloads == []
+
+
+def test_stale_cache_kept_for_the_same_browser(resolver):
+    cache_file, driver, downloads = resolver
+    write_cache(cache_file, driver, age=driver_resolver.DEFAULT_MAX_AGE + 60)
+    assert resolve_chromedriver(cache_file) == driver
+    assert downloads == []
+    with open(cache_file, encoding="utf-8") as cf:
+        assert time.time() - json.load(cf)["resolved_at"] < 60  # cache entry renewed
+
+
+def test_stale_cache_used_offline_after_browser_upgrade(resolver):
+    cache_file, driver, downloads = resolver
+    write_cache(cache_file, driver, age=driver_resolver.DEFAULT_MAX_AGE + 60, version="138")
+    assert resolve_chromedriver(cache_file) == driver
+    assert downloads == [1]
+
+
+def test_offline_without_driver_is_resolved_once(resolver):
+    cache_file, _, downloads = resolver
+    assert resolve_chromedriver(cache_file) is None
+    assert resolve_chromedriver(cache_file) is None
+    assert downloads == [1]
+    resolve_chromedriver(cache_file, refresh=True)
+    assert downloads == [1, 1]
@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+
+from scraper_utils.eol_matcher import MATCH_COLUMNS, EolMatcher, SkuTrie, split_skus, version_parts
+from scraper_utils.eol_store import EolStore, eol_record, lookup_eol
+
+ROWS = [
+    eol_record("Palo Alto", "PA-7000 Series PAN-PA-7000-100G-NPC-A, PAN-PA-7000-LFC-A", eol_date="2026-01-31"),
+    eol_record("Palo Alto", "PA-220R", eol_date="2027-06-30"),
+    eol_record("Palo Alto", "Prisma Access Browser", "139.12.x.x", eol_date="2025-09-01"),
+    eol_record("Palo Alto", "PAN-OS", "10.1", eol_date="2025-08-31"),
+    eol_record("Microsoft", "Windows 11", "23H2", eol_date="2025-11-11", edition="Home"),
+    eol_record("Microsoft", "Windows 11", "23H2", eol_date="2026-11-10", edition="Enterprise"),
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with EolStore(str(tmp_path / "eol.sqlite")) as store:
+        store.upsert(ROWS)
+        yield store
+
+
+def test_split_skus_and_version_parts():
+    assert "PA-7000-LFC-A" in split_skus("PA-7000 Series PAN-PA-7000-100G-NPC-A, PAN-PA-7000-LFC-A")
+    assert version_parts("139.12.x.x") == (("139", "12"), True)
+    assert version_parts("10.1.9-h3") == (("10", "1", "9", "h3"), False)
+
+
+def test_sku_trie():
+    trie = SkuTrie()
+    trie.insert("PA-220R", 0)
+    trie.insert("PA-220", 1)
+    assert trie.get("PA-220") == [1]
+    assert trie.longest_prefix("PA-220R-AC") == ("PA-220R", [0])
+    assert set(trie.with_prefix("PA-22")) == {"PA-220", "PA-220R"}
+    assert len(trie) == 2
+
+
+def test_store_lookup(store):
+    assert store.count() == len(ROWS)
+    [row] = store.lookup(" palo alto ", "pan-os", "10.1")
+    assert row["eol_date"] == "2025-08-31"
+    assert lookup_eol("Palo Alto", "PAN-OS", path=store.path)[0]["version"] == "10.1"
+
+
+def test_match(store):
+    matcher = EolMatcher.from_store(store)
+    assert matcher.match("Palo Alto", "PA-7000-LFC-A")["match"] == "sku"
+    assert matcher.match("Palo Alto", "PA-220R-AC")["match"] == "sku_prefix"
+    assert matcher.match("Palo Alto", "Prisma Access Browser", "139.12.4.1")["eol_date"] == "2025-09-01"
+    assert matcher.match("Palo Alto", "PAN-OS", "10.1.9-h3")["matched_version"] == "10.1"
+    # Ties go to the earliest EOL unless the edition is known
+    assert matcher.match("Microsoft", "Windows 11", "23H2")["edition"] == "Home"
+    assert matcher.match("Microsoft", "Windows 11", "23H2", "Enterprise")["eol_date"] == "2026-11-10"
+    assert matcher.match("Palo Alto", "PA-9999") is None
+
+
+def test_match_frame_keeps_the_callers_index(store):
+    matcher = EolMatcher.from_store(store)
+    assets = pd.DataFrame(
+        {
+            "vendor": ["Palo Alto", "Palo Alto", "Palo Alto", "Microsoft"],
+            "model": ["PAN-OS", "PA-9999", "PAN-OS", "Windows 11"],
+            "version": ["10.1.3", None, "10.1.3", "23H2"],
+        },
+        index=["fw-2", "fw-9", "fw-1", "laptop"],
+    )
+    matched = matcher.match_frame(assets, "vendor", "model", "version")
+    assert list(matched.index) == ["fw-2", "fw-9", "fw-1", "laptop"]
+    assert list(matched.columns) == ["vendor", "model", "version", *MATCH_COLUMNS]
+    assert matched.loc["fw-1", "eol_date"] == "2025-08-31"
+    assert pd.isna(matched.loc["fw-9", "eol_date"])
+    assert matched.loc["laptop", "edition"] == "Home"
+    # Assignable straight back onto the inventory
+    assets["eol_date"] = matched["eol_date"]
+    assert assets.loc["fw-2", "eol_date"] == "2025-08-31"
@@ -0,0 +1,31 @@
+import pandas as pd
+
+from scraper_utils.eol_store import EolStore, eol_record, number_repeats, store_records, windows_release_records
+
+
+def test_number_repeats_keeps_repeated_versions_apart(tmp_path):
+    records = number_repeats([
+        eol_record("Palo Alto", "Panorama Plugin", "5.0.1", "2026-01-31", source="test"),
+        eol_record("Palo Alto", "panorama plugin", "5.0.1", "2026-06-30", source="test"),
+        eol_record("Palo Alto", "Panorama Plugin", "5.1.0", "2027-01-31", source="test"),
+    ])
+    assert [r["edition"] for r in records] == ["", "#2", ""]
+    with EolStore(str(tmp_path / "eol.sqlite")) as store:
+        assert store_records(records, store) == 3
+        assert store.count() == 3
+
+
+def test_windows_release_records():
+    df = pd.DataFrame({
+        "Version": ["24H2", "24H2", ""],
+        "Servicing option": ["General Availability Channel", "Long-Term Servicing Channel", ""],
+        "Availability date": ["2024-10-01", "2024-10-01", "2025-01-14"],
+        "End of servicing: Home and Pro": ["2026-10-13", "", ""],
+        "End of servicing: Enterprise": ["2027-10-12", "2029-10-09", ""],
+    })
+    records = windows_release_records(df, lambda row: f"Windows 11 {row['Version']}", "test")
+    assert [(r["product"], r["edition"], r["eol_date"]) for r in records] == [
+        ("Windows 11 24H2", "General Availability Channel", "2027-10-12"),
+        ("Windows 11 24H2", "Long-Term Servicing Channel", "2029-10-09"),
+    ]
+    assert {r["vendor"] for r in records} == {"Microsoft"}
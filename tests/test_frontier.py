@@ -0,0 +1,36 @@
+from scraper_utils.frontier import Frontier, normalize_url
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://Example.com/c/12/#top") == "https://example.com/c/12"
+    assert normalize_url("https://example.com") == "https://example.com/"
+    assert normalize_url("https://example.com/c?page=2") == "https://example.com/c?page=2"
+
+
+def test_add_pending_and_retries(tmp_path):
+    frontier = Frontier(str(tmp_path / "frontier.json"), max_attempts=2)
+    assert frontier.add("https://example.com/c/1/", "category")
+    assert not frontier.add("https://EXAMPLE.com/c/1", "category")
+    assert frontier.add("https://example.com/p/1", "product", category="https://example.com/c/1")
+    assert frontier.get("https://example.com/c/1")["url"] == "https://example.com/c/1/"
+
+    frontier.mark_failed("https://example.com/c/1", RuntimeError("timeout"))
+    assert frontier.pending("category") == ["https://example.com/c/1"]
+    frontier.mark_failed("https://example.com/c/1", RuntimeError("timeout"))
+    assert frontier.pending("category") == []
+    frontier.mark_done("https://example.com/p/1", specs=3)
+    assert frontier.counts() == {"category": {"failed": 1}, "product": {"done": 1}}
+
+
+def test_save_and_resume(tmp_path):
+    path = str(tmp_path / "frontier.json")
+    frontier = Frontier(path)
+    frontier.add("https://example.com/c/1", "category")
+    frontier.add("https://example.com/c/2", "category")
+    frontier.mark_done("https://example.com/c/1", products=24)
+    frontier.save()
+
+    resumed = Frontier(path)
+    assert resumed.pending() == ["https://example.com/c/2"]
+    assert resumed.get("https://example.com/c/1")["products"] == 24
+    assert Frontier(path, reset=True).urls == {}
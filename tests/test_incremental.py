@@ -0,0 +1,119 @@
+import pandas as pd
+import pytest
+
+from scraper_utils import http_fetch
+from scraper_utils.delta import read_snapshot
+from scraper_utils.http_fetch import NOT_MODIFIED, fetch_tree
+from scraper_utils.incremental import CrawlState, fingerprint
+from scraper_utils.orchestrator import load_scraper_module
+
+URL = "https://example.com/eol"
+
+
+def row(version, eol):
+    return {"Software Name": "PAN-OS", "Version": version, "Release Date": "", "EOL Date": eol}
+
+
+def test_changed_rows_only_returns_new_or_changed(tmp_path):
+    state = CrawlState(str(tmp_path / "state.json"))
+    first = [row("10.1", "2025-06-01"), row("11.0", "2026-11-17")]
+    assert state.changed_rows(URL, 1, first) == first
+    second = [row("10.1", "2025-07-01"), row("11.0", "2026-11-17")]
+    assert state.changed_rows(URL, 1, second) == [row("10.1", "2025-07-01")]
+
+
+def test_table_changed_survives_save(tmp_path):
+    path = str(tmp_path / "state.json")
+    state = CrawlState(path)
+    assert state.table_changed(URL, 1, [["a", "b"]])
+    state.save()
+    assert not CrawlState(path).table_changed(URL, 1, [["a", "b"]])
+    assert fingerprint("x") == fingerprint(b"x")
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = URL
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def served(monkeypatch):
+    """Queue of responses for fetch_tree, the request headers it sent and how many pages it parsed."""
+    responses, requests_headers, parsed = [], [], []
+
+    class Session:
+        def get(self, url, timeout=None, headers=None):
+            requests_headers.append(headers)
+            return responses.pop(0)
+
+    real_parse = http_fetch.parse_html
+
+    def parse(content, base_url=None):
+        parsed.append(base_url)
+        return real_parse(content, base_url)
+
+    monkeypatch.setattr(http_fetch, "get_session", Session)
+    monkeypatch.setattr(http_fetch, "parse_html", parse)
+    return responses, requests_headers, parsed
+
+
+def test_not_modified_response_is_not_parsed(tmp_path, served):
+    responses, requests_headers, parsed = served
+    state = CrawlState(str(tmp_path / "state.json"))
+    responses += [FakeResponse(content=b"<table><tr><td>1</td></tr></table>", headers={"ETag": '"v1"'}),
+                  FakeResponse(status_code=304)]
+    assert fetch_tree(URL, expected_xpath="//td", state=state) not in (None, NOT_MODIFIED)
+    assert fetch_tree(URL, expected_xpath="//td", state=state) is NOT_MODIFIED
+    assert requests_headers[1] == {"If-None-Match": '"v1"'}
+    assert len(parsed) == 1
+
+
+def test_unchanged_body_is_not_parsed(tmp_path, served):
+    responses, _, parsed = served
+    state = CrawlState(str(tmp_path / "state.json"))
+    body = b"<table><tr><td>1</td></tr></table>"
+    responses += [FakeResponse(content=body), FakeResponse(content=body), FakeResponse(content=body + b"<p>2</p>")]
+    assert fetch_tree(URL, expected_xpath="//td", state=state) not in (None, NOT_MODIFIED)
+    assert fetch_tree(URL, expected_xpath="//td", state=state) is NOT_MODIFIED
+    assert len(parsed) == 1
+    assert fetch_tree(URL, expected_xpath="//td", state=state) not in (None, NOT_MODIFIED)
+    assert len(parsed) == 2
+
+
+def test_incremental_save_keeps_full_snapshot(tmp_path):
+    module = load_scraper_module("Day_5/Program/EOL_Summary_2ndScript.py")
+    snapshot = str(tmp_path / "eol.csv")
+
+    full = module.PaloAltoScraper()
+    full.data = [row("10.1", "2025-06-01"), row("11.0", "2026-11-17")]
+    full.save_to_csv(snapshot, delta=True)
+
+    incremental = module.PaloAltoScraper(state=CrawlState(str(tmp_path / "state.json")))
+    incremental.data = [row("10.1", "2025-07-01")]
+    written = incremental.save_to_csv(snapshot, delta=True)
+
+    assert written == str(tmp_path / "eol_changes.csv")
+    assert list(read_snapshot(written)["Version"]) == ["10.1"]
+    assert list(read_snapshot(snapshot)["Version"]) == ["10.1", "11.0"]
+    # No delta against a partial frame, so 11.0 is never reported as removed
+    with open(tmp_path / "eol_changes.jsonl", encoding="utf-8") as lf:
+        assert len(lf.readlines()) == 1  # only the full run logged a delta
+
+
+def test_incremental_windows_save_keeps_full_snapshot(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    module = load_scraper_module("Day_3/Program/WindowsClientVersions.py")
+    full = pd.DataFrame({"Version": ["22H2", "23H2"], "Build": ["19045", "22631"]})
+    module.WindowsClientVersions().save_to_csv(full, "windows.csv", delta=True)
+
+    scraper = module.WindowsClientVersions(state=CrawlState("state.json"))
+    scraper.save_to_csv(pd.DataFrame(), "windows.csv", delta=True)
+
+    assert list(read_snapshot("output/windows.csv")["Version"]) == ["22H2", "23H2"]
+    assert (tmp_path / "output" / "windows_changes.csv").exists()
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from scraper_utils.metrics import Metrics
+
+
+@pytest.fixture
+def registry():
+    return Metrics()
+
+
+def test_timer_records_errors_and_reraises(registry):
+    with registry.timer("page_load", mode="http"):
+        pass
+    with pytest.raises(KeyError):
+        with registry.timer("page_load", mode="http"):
+            raise KeyError("boom")
+    (timer,) = registry.report()["timers"]
+    assert timer["name"] == "page_load" and timer["labels"] == {"mode": "http"}
+    assert timer["count"] == 2
+    assert 0 <= timer["min"] <= timer["max"] and timer["total"] >= timer["max"]
+
+
+def test_timed_and_count(registry):
+    @registry.timed("save", scraper="troemner")
+    def save(rows):
+        registry.count("rows", len(rows), scraper="troemner")
+        return len(rows)
+
+    assert save([1, 2]) == 2 and save([3]) == 1
+    registry.count("not_modified")
+    report = registry.report()
+    assert [(t["name"], t["count"]) for t in report["timers"]] == [("save", 2)]
+    assert {c["name"]: c["value"] for c in report["counters"]} == {"not_modified": 1, "rows": 3}
+    json.dumps(report)  # the report is written as JSON
+
+
+def test_prometheus_text(registry):
+    registry.observe("scrape", 1.5, scraper='troemner "catalog"', phase="categories")
+    registry.count("rows", 3, scraper="troemner")
+    lines = registry.prometheus_text().splitlines()
+    labels = '{stage="scrape",phase="categories",scraper="troemner \\"catalog\\""}'
+    assert "# TYPE scraper_stage_seconds summary" in lines
+    assert f"scraper_stage_seconds_sum{labels} 1.500000" in lines
+    assert f"scraper_stage_seconds_count{labels} 1" in lines
+    assert f"scraper_stage_seconds_max{labels} 1.500000" in lines
+    assert lines[-2:] == ["# TYPE scraper_rows_total counter", 'scraper_rows_total{scraper="troemner"} 3']
+
+
+def test_stage_is_a_reserved_label(registry):
+    with pytest.raises(ValueError, match="stage"):
+        with registry.timer("scrape", stage="categories"):
+            pytest.fail("the block ran with a reserved label")
+    with pytest.raises(ValueError, match="stage"):
+        registry.timed("scrape", stage="details")
+    with pytest.raises(ValueError, match="stage"):
+        registry.count("rows", stage="details")
+    assert registry.report()["timers"] == [] and registry.report()["counters"] == []
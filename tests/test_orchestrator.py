@@ -0,0 +1,54 @@
+import time
+
+import pandas as pd
+
+from scraper_utils.orchestrator import SOURCES, CrawlOrchestrator, Source
+
+
+def recording_source(name, hosts, seconds, starts):
+    def run(pool):
+        starts[name] = time.monotonic()
+        time.sleep(seconds)
+        return pd.DataFrame({"row": [1, 2]})
+    return Source(name, hosts, run)
+
+
+def test_busy_host_does_not_block_other_hosts():
+    starts = {}
+    sources = {
+        s.name: s for s in [
+            recording_source("first", "a.example", 0.3, starts),
+            recording_source("second", "a.example", 0.0, starts),
+            recording_source("other", "b.example", 0.0, starts),
+        ]
+    }
+    orchestrator = CrawlOrchestrator(sources, max_concurrency=2, min_host_interval=0.0, pool=object())
+    began = time.monotonic()
+    results = orchestrator.run_sync()
+    assert {r["status"] for r in results.values()} == {"ok"}
+    assert starts["other"] - began < 0.2
+    assert starts["second"] - starts["first"] >= 0.3
+
+
+def test_min_host_interval_spaces_starts():
+    starts = {}
+    sources = {
+        s.name: s for s in [
+            recording_source("first", "a.example", 0.0, starts),
+            recording_source("second", "a.example", 0.0, starts),
+        ]
+    }
+    CrawlOrchestrator(sources, per_host_limit=2, min_host_interval=0.2, pool=object()).run_sync()
+    assert abs(starts["second"] - starts["first"]) >= 0.2
+
+
+def test_failed_source_is_recorded():
+    def boom(pool):
+        raise RuntimeError("no table")
+    orchestrator = CrawlOrchestrator({"bad": Source("bad", "a.example", boom)}, pool=object())
+    result = orchestrator.run_sync()["bad"]
+    assert (result["status"], result["rows"], result["error"]) == ("failed", 0, "no table")
+
+
+def test_research_source_covers_every_host_it_hits():
+    assert set(SOURCES["research_papers"].hosts) == {"arxiv.org", "citeseerx.ist.psu.edu", "core.ac.uk"}
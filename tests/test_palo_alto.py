@@ -0,0 +1,56 @@
+import pytest
+
+from benchmarks.fixtures import palo_alto_hardware_page
+from benchmarks.server import FixtureServer
+from scraper_utils.http_fetch import StaticPage, parse_html
+from scraper_utils.orchestrator import load_scraper_module
+
+hardware = load_scraper_module("Day_5/Program/PaloAltoScraper.py")
+software = load_scraper_module("Day_5/Program/EOL_Summary_2ndScript.py")
+
+SOFTWARE_PAGE = """<html><body><div class="text baseComponent parbase section"><table><tbody>
+<tr><td colspan="3">&nbsp;</td></tr>
+<tr><td colspan="3"><p><b>PAN-OS</b></p></td></tr>
+<tr><td><b>Version</b></td><td><b>Release Date</b></td><td><b>End-of-Life Date</b></td></tr>
+<tr><td>11.1</td><td>May 3, 2023</td><td>May 3, 2027</td></tr>
+<tr><td><strong>10.2</strong></td><td>February 27, 2022</td><td>August 27, 2025</td></tr>
+</tbody></table></div></body></html>"""
+
+
+class NoBrowserPool:
+    """Pool stand-in that fails the test if a browser is leased."""
+
+    def acquire(self):
+        raise AssertionError("fell back to the browser")
+
+    def release(self, driver):
+        pass
+
+
+@pytest.fixture
+def hardware_page(tmp_path):
+    palo_alto_hardware_page(str(tmp_path))
+    path = tmp_path / "paloalto" / "hardware.html"
+    # Server-rendered tables often leave <tbody> implicit; lxml doesn't add it
+    path.write_text(path.read_text(encoding="utf-8").replace("<tbody>", "").replace("</tbody>", ""), encoding="utf-8")
+    return tmp_path
+
+
+def test_http_mode_reads_tables_without_tbody(hardware_page):
+    scraper = hardware.PaloAltoScraper(pool=NoBrowserPool(), fetch_mode="http")
+    with FixtureServer(str(hardware_page)) as server:
+        scraper.open_website(f"{server.base_url}/paloalto/hardware")
+    scraper.extract_data()
+    scraper.close()
+    assert len(scraper.data) > 0
+    assert all(row["productName"] and row["EOL Date"] for row in scraper.data)
+
+
+def test_software_rows_with_strong_text_are_kept():
+    scraper = software.PaloAltoScraper(pool=NoBrowserPool())
+    scraper.page = StaticPage(parse_html(SOFTWARE_PAGE), "https://example.com/eol")
+    scraper.scrape_tables()
+    assert [(r["Software Name"], r["Version"], r["EOL Date"]) for r in scraper.data] == [
+        ("PAN-OS", "11.1", "2027-05-03"),
+        ("PAN-OS", "10.2", "2025-08-27"),
+    ]
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from pdfminer.pdftypes import PDFObjRef, PDFStream
+from pdfminer.psparser import LIT
+
+from scraper_utils.pdf_cache import PdfTableCache, page_hash
+
+
+class FakeDoc:
+    """Resolves PDFObjRefs from a dict of object id -> object."""
+
+    def __init__(self, objects):
+        self.objects = objects
+
+    def getobj(self, objid):
+        return self.objects[objid]
+
+
+def fake_page(resources, content=b"BT /F1 12 Tf (Hello) Tj ET"):
+    page_obj = SimpleNamespace(mediabox=[0, 0, 612, 792], contents=[PDFStream({}, content)], resources=resources)
+    return SimpleNamespace(page_obj=page_obj, rotation=0)
+
+
+def font(name):
+    return {"Type": LIT("Font"), "Subtype": LIT("TrueType"), "BaseFont": LIT(name)}
+
+
+def test_same_page_same_hash():
+    assert page_hash(fake_page({"Font": {"F1": font("Arial")}})) == page_hash(fake_page({"Font": {"F1": font("Arial")}}))
+
+
+def test_content_changes_the_hash():
+    resources = {"Font": {"F1": font("Arial")}}
+    assert page_hash(fake_page(resources)) != page_hash(fake_page(resources, b"BT /F1 12 Tf (Bye) Tj ET"))
+
+
+def test_font_changes_the_hash():
+    assert page_hash(fake_page({"Font": {"F1": font("Arial")}})) != page_hash(fake_page({"Font": {"F1": font("Courier")}}))
+
+
+def test_xobject_stream_changes_the_hash():
+    def page(form):
+        doc = FakeDoc({5: PDFStream({"Subtype": LIT("Form")}, form)})
+        return fake_page({"XObject": {"Fm1": PDFObjRef(doc, 5)}})
+    assert page_hash(page(b"0 0 m 10 10 l S")) == page_hash(page(b"0 0 m 10 10 l S"))
+    assert page_hash(page(b"0 0 m 10 10 l S")) != page_hash(page(b"0 0 m 20 20 l S"))
+
+
+def test_reference_cycles_terminate():
+    doc = FakeDoc({})
+    doc.objects[7] = {"Resources": PDFObjRef(doc, 8)}
+    doc.objects[8] = {"Parent": PDFObjRef(doc, 7)}
+    assert len(page_hash(fake_page({"XObject": {"Fm1": PDFObjRef(doc, 7)}}), memo={})) == 40
+
+
+def test_cache_round_trip(tmp_path):
+    cache = PdfTableCache(str(tmp_path), {"vertical_strategy": "lines"})
+    assert cache.get("abc", 1) is None
+    cache.put("abc", [{"page": 1, "table": 1, "bbox": [0, 0, 1, 1], "rows": [["a"]]}])
+    assert cache.get("abc", 4)[0]["page"] == 4
+    assert (cache.hits, cache.misses) == (1, 1)
+    # Other settings never reuse these tables
+    assert PdfTableCache(str(tmp_path), {"vertical_strategy": "text"}).get("abc", 1) is None
@@ -0,0 +1,68 @@
+from scraper_utils.pdf_stitch import header_names, is_header_row, stitch_tables, typed_frame
+
+BBOX = (50.0, 100.0, 550.0, 700.0)
+
+
+def piece(page, rows, table=1, bbox=BBOX):
+    return {"page": page, "table": table, "bbox": bbox, "rows": rows}
+
+
+def test_is_header_row():
+    assert is_header_row(["Product", "End of life"])
+    assert not is_header_row(["PA-220", "2024-01-31"])
+    assert not is_header_row(["10.1", "Jan 31, 2024"])
+
+
+def test_header_names_fill_blanks_and_number_duplicates():
+    assert header_names(["Name", None, "Name"]) == ["Name", "column_2", "Name_2"]
+
+
+def test_repeated_header_is_dropped():
+    tables = [
+        piece(1, [["Product", "EOL"], ["a", "2024-01-01"]]),
+        piece(2, [["Product", "EOL"], ["b", "2025-01-01"]]),
+    ]
+    [logical] = stitch_tables(tables)
+    assert logical["pages"] == [1, 2]
+    assert logical["rows"] == [["a", "2024-01-01"], ["b", "2025-01-01"]]
+
+
+def test_continuation_without_repeated_header():
+    # Page 3 starts with a text-only data row: it must not open a new table
+    tables = [
+        piece(1, [["Key", "Value"], ["x", "y"]]),
+        piece(2, [["u", "v"]]),
+        piece(3, [["z", "w"]]),
+    ]
+    [logical] = stitch_tables(tables)
+    assert logical["pages"] == [1, 2, 3]
+    assert logical["header"] == ["Key", "Value"]
+    assert logical["rows"] == [["x", "y"], ["u", "v"], ["z", "w"]]
+
+
+def test_misaligned_or_wider_piece_starts_new_table():
+    tables = [
+        piece(1, [["Key", "Value"], ["x", "y"]]),
+        piece(2, [["u", "v"]], bbox=(120.0, 100.0, 480.0, 700.0)),
+        piece(3, [["Key", "Value", "Note"], ["z", "w", "n"]], bbox=(120.0, 100.0, 480.0, 700.0)),
+    ]
+    assert [t["pages"] for t in stitch_tables(tables)] == [[1], [2], [3]]
+
+
+def test_second_table_on_a_page_is_not_a_continuation():
+    tables = [
+        piece(1, [["Key", "Value"], ["x", "y"]]),
+        piece(2, [["Other", "Table"], ["p", "q"]], table=2),
+    ]
+    assert len(list(stitch_tables(tables))) == 2
+
+
+def test_typed_frame_types_columns():
+    logical = {
+        "header": ["Model", "Count", "EOL Date"],
+        "rows": [["10.1", "1,200", "Jan 31, 2024"], ["11.0", "3", "2025-02-28"]],
+    }
+    df = typed_frame(logical)
+    assert list(df["Model"]) == ["10.1", "11.0"]
+    assert list(df["Count"]) == [1200, 3]
+    assert str(df["EOL Date"].dtype).startswith("datetime64")
@@ -0,0 +1,39 @@
+import pytest
+
+from scraper_utils.http_fetch import StaticPage, fetch_tree
+from scraper_utils.replay import PageArchive, replay_page, set_archive
+
+URL = "https://example.com/eol"
+PAGE = "<html><body><table><tr><td><a href='/kb/1'>PAN-OS</a></td></tr></table></body></html>"
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    yield str(tmp_path / "archive.zip")
+    set_archive(None)
+
+
+def test_record_then_replay(archive_path):
+    archive = PageArchive(archive_path, "record")
+    archive.record(URL, "<html>old</html>")
+    archive.record(URL, PAGE)  # a newer entry wins on replay
+    archive.close()
+
+    set_archive(PageArchive(archive_path, "replay"))
+    tree = fetch_tree(URL, expected_xpath="//table")
+    assert tree is not None
+    assert tree.xpath("//a/@href") == ["https://example.com/kb/1"]
+    assert fetch_tree(URL, expected_xpath="//ul") is None
+    page = replay_page(URL)
+    assert isinstance(page, StaticPage)
+    assert "PAN-OS" in page.page_source
+
+
+def test_archive_modes(archive_path):
+    with pytest.raises(ValueError):
+        PageArchive(archive_path, "rewind")
+    off = PageArchive(archive_path, "off")
+    off.record(URL, PAGE)
+    assert off.get(URL) is None
+    set_archive(off)
+    assert replay_page(URL) is None
@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from scraper_utils import driver_pool
+from scraper_utils.driver_pool import DriverPool
+from scraper_utils.http_fetch import StaticPage, parse_html
+from scraper_utils.orchestrator import load_scraper_module
+from scraper_utils.replay import PageArchive, set_archive
+
+research = load_scraper_module("Day_2/Program/research_paper_scrapper.py")
+
+QUERY = "crop yield"
+ARXIV_URL = "https://arxiv.org/search/"
+
+ARXIV_PAGE = """<html><body><ol>
+<li class="arxiv-result">
+  <p class="list-title"><a href="https://arxiv.org/abs/2401.00001">arXiv:2401.00001</a></p>
+  <p class="title is-5">Predicting crop yield</p>
+  <p class="authors">Authors: A. Author, B. Author</p>
+  <p class="is-size-7"><span>Submitted 1 January, 2024</span></p>
+</li>
+</ol></body></html>"""
+
+CORE_PAGE = """<html><body>
+<div class="result__body"><a class="result__title" href="https://core.ac.uk/1">Soil data</a></div>
+</body></html>"""
+
+
+class NoBrowserPool:
+    """Pool stand-in that fails the test if a browser is leased."""
+
+    max_size = 3
+
+    def __init__(self):
+        self.released = []
+
+    def acquire(self):
+        raise AssertionError("a browser was leased although every page was replayed")
+
+    lease = acquire
+
+    def release(self, driver):
+        self.released.append(driver)
+
+
+@pytest.fixture
+def replayed(tmp_path):
+    path = str(tmp_path / "archive.zip")
+    recorder = PageArchive(path, "record")
+    search = f"{ARXIV_URL}?query={QUERY}&searchtype=all&abstracts=show&size=5&order=-announced_date_first"
+    recorder.record(search, ARXIV_PAGE)
+    recorder.record("https://citeseerx.ist.psu.edu/search?q=crop+yield&submit=Search&sort=rlv&t=doc", "<html></html>")
+    recorder.record("https://core.ac.uk/search?q=crop+yield", CORE_PAGE)
+    recorder.close()
+    set_archive(PageArchive(path, "replay"))
+    yield
+    set_archive(None)
+
+
+def test_collect_results_from_replay_never_leases_a_browser(replayed, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pool = NoBrowserPool()
+    scraper = research.ResearchPaperScraper(pool=pool)
+    scraper.collect_results(QUERY, max_results=5)
+    assert pool.released == []
+    assert sorted(r["source"] for r in scraper.all_results) == ["CORE", "arXiv"]
+    arxiv = next(r for r in scraper.all_results if r["source"] == "arXiv")
+    assert arxiv["title"] == "Predicting crop yield"
+    assert arxiv["authors"] == "A. Author, B. Author"
+    assert arxiv["query"] == QUERY
+
+
+class CoreDriver:
+    """Fake browser that renders CORE_PAGE; ``crash`` makes it fail like a dead Chrome session."""
+
+    def __init__(self, crash=False):
+        self.crash = crash
+        self.page = None
+        self.quit_called = False
+
+    def get(self, url):
+        if self.crash:
+            raise WebDriverException("invalid session id")
+        self.page = StaticPage(parse_html(CORE_PAGE), url)
+
+    def execute_script(self, script):
+        if self.crash:
+            raise WebDriverException("invalid session id")
+        return 1
+
+    def find_elements(self, by, xpath):
+        return self.page.find_elements(by, xpath)
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_crashed_browser_costs_one_task(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(research.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(driver_pool, "_browser_slots", threading.BoundedSemaphore(2))
+    monkeypatch.setattr(driver_pool, "_live_pools", set())
+    started = []
+
+    def create(pool):
+        started.append(CoreDriver(crash=not started))  # the first browser dies on its first page
+        return started[-1]
+
+    monkeypatch.setattr(DriverPool, "_create_driver", create)
+    pool = DriverPool(max_size=1, max_pages=2)
+    scraper = research.ResearchPaperScraper(pool=pool)
+    scraper.collect_results(["soil", "crops", "rain", "wheat"], sources=[scraper.scrape_core], max_workers=1)
+
+    assert len(scraper.all_results) == 3
+    assert started[0].quit_called  # discarded by the release health check
+    # 3 good pages with max_pages=2: the second browser was recycled after two loads
+    assert len(started) == 3 and started[1].quit_called and not started[2].quit_called
+    pool.close_all()
@@ -0,0 +1,105 @@
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from scraper_utils.sinks import CsvSink, JsonlSink, ParquetSink, open_sink
+
+ROWS = [{"productURL": f"https://example.com/p/{i}", "price": str(i)} for i in range(5)]
+
+
+@pytest.mark.parametrize("name, kind", [("rows.csv", CsvSink), ("rows.jsonl", JsonlSink), ("rows.parquet", ParquetSink)])
+def test_open_sink_by_extension(tmp_path, name, kind):
+    assert isinstance(open_sink(str(tmp_path / name)), kind)
+
+
+def test_open_sink_rejects_unknown_extension(tmp_path):
+    with pytest.raises(ValueError):
+        open_sink(str(tmp_path / "rows.xlsx"))
+
+
+def test_csv_sink_batches_and_resumes(tmp_path):
+    path = str(tmp_path / "rows.csv")
+    with open_sink(path, batch_size=2, key_fields=["productURL"]) as sink:
+        sink.write_many(ROWS[:3] + ROWS[:1])  # the repeated row is skipped
+    assert sink.rows_written == 3
+
+    with open_sink(path, resume=True, key_fields=["productURL"]) as sink:
+        assert sink.seen(ROWS[0])
+        sink.write_many(ROWS)
+    assert sink.rows_written == 2
+    assert list(pd.read_csv(path, dtype=str)["price"]) == ["0", "1", "2", "3", "4"]
+
+
+def test_jsonl_sink_overwrites_unless_resuming(tmp_path):
+    path = str(tmp_path / "rows.jsonl")
+    with open_sink(path) as sink:
+        sink.write_many(ROWS[:2])
+    with open_sink(path) as sink:
+        sink.write(ROWS[4])
+    with open(path, encoding="utf-8") as jf:
+        assert [json.loads(line)["price"] for line in jf] == ["4"]
+
+
+def test_parquet_sink_writes_one_part_per_batch(tmp_path):
+    path = str(tmp_path / "rows.parquet")
+    with open_sink(path, batch_size=2) as sink:
+        sink.write_many(ROWS)
+    assert len(sink._parts()) == 3
+    assert list(pd.read_parquet(path)["price"]) == ["0", "1", "2", "3", "4"]
+
+    with open_sink(path, resume=True, key_fields=["productURL"]) as sink:
+        sink.write_many(ROWS)
+    assert sink.rows_written == 0
+
+
+def test_parquet_sink_keeps_one_schema_across_parts(tmp_path):
+    path = str(tmp_path / "products.parquet")
+    call_for_price = {"productURL": "https://example.com/p/0", "price": None}
+    with open_sink(path, batch_size=1, key_fields=["productURL"]) as sink:
+        sink.write(call_for_price)
+        sink.write({"productURL": "https://example.com/p/1", "price": 3150})
+        sink.write({"productURL": "https://example.com/p/2", "price": 12.5, "currency": "USD"})
+        sink.write({"productURL": "https://example.com/p/3", "price": None})
+    assert {str(pq.read_schema(part)) for part in sink._parts()} == {str(sink.schema)}
+    df = pd.read_parquet(path)
+    assert list(df["price"].fillna(-1)) == [-1, 3150.0, 12.5, -1]
+    assert list(df["currency"].fillna("")) == ["", "", "USD", ""]
+
+    with open_sink(path, resume=True, batch_size=1, key_fields=["productURL"]) as sink:
+        sink.write({"productURL": "https://example.com/p/4", "price": None, "currency": None})
+    assert len(pd.read_parquet(path)) == 5
+
+
+def test_parquet_sink_casts_to_an_explicit_schema(tmp_path):
+    path = str(tmp_path / "products.parquet")
+    schema = pa.schema([("productURL", pa.string()), ("price", pa.float64())])
+    with open_sink(path, batch_size=1, schema=schema) as sink:
+        sink.write({"productURL": "https://example.com/p/0", "price": None})
+        sink.write({"productURL": "https://example.com/p/1", "price": 3})
+    assert all(pq.read_schema(part).field("price").type == pa.float64() for part in sink._parts())
+    assert list(pd.read_parquet(path)["price"].fillna(-1)) == [-1, 3.0]
+
+
+def test_scrapers_refuse_to_save_rows_held_by_a_sink(tmp_path, monkeypatch):
+    from scraper_utils.orchestrator import load_scraper_module
+
+    monkeypatch.chdir(tmp_path)
+    software = load_scraper_module("Day_5/Program/EOL_Summary_2ndScript.py")
+    research = load_scraper_module("Day_2/Program/research_paper_scrapper.py")
+    snapshot = tmp_path / "eol.csv"
+    snapshot.write_text("Software Name,Version,Release Date,EOL Date\nPAN-OS,11.1,,2027-05-03\n", encoding="utf-8")
+
+    with open_sink(str(tmp_path / "rows.jsonl")) as sink:
+        scraper = software.PaloAltoScraper(pool=object(), sink=sink)
+        scraper._emit([{"Software Name": "PAN-OS", "Version": "11.2", "Release Date": "", "EOL Date": ""}])
+        for save in (scraper.to_dataframe, lambda: scraper.save_to_csv(str(snapshot)), scraper.to_eol_records):
+            with pytest.raises(RuntimeError, match="rows.jsonl"):
+                save()
+        papers = research.ResearchPaperScraper(pool=object(), sink=sink)
+        for save in (papers.save_data, papers.save_parquet, papers.generate_summary):
+            with pytest.raises(RuntimeError, match="rows.jsonl"):
+                save()
+    assert "11.1" in snapshot.read_text(encoding="utf-8")  # the snapshot was left alone
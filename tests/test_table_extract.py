@@ -0,0 +1,41 @@
+from selenium.webdriver.common.by import By
+
+from scraper_utils.http_fetch import StaticPage, element_text, parse_html
+from scraper_utils.table_extract import data_rows, extract_tables, header_texts, section_rows, td_cells
+
+PAGE = """<html><body>
+<table>
+  <thead><tr><th>Version</th><th>Release<br>date</th><th>End of servicing</th></tr></thead>
+  <tbody>
+    <tr><th>Enterprise</th><td colspan="2"><b>24H2</b> 2024-10-01</td></tr>
+    <tr><td><strong>23H2</strong></td><td>2023-10-31</td><td><a href="/kb/5031">2026-11-10</a></td></tr>
+  </tbody>
+</table>
+<table><tr><td>no sections</td></tr></table>
+</body></html>"""
+
+
+def page():
+    return StaticPage(parse_html(PAGE, base_url="https://learn.example.com/windows/"), "https://learn.example.com/windows/")
+
+
+def test_extract_tables_from_static_page():
+    first, second = extract_tables(page())
+    assert header_texts(first) == ["Version", "Release\ndate", "End of servicing", "Enterprise"]
+    assert len(section_rows(first, "tbody")) == 2
+    enterprise, release = data_rows(first, "tbody")
+    assert [c["text"] for c in td_cells(enterprise)] == ["24H2 2024-10-01"]
+    assert td_cells(enterprise)[0]["colspan"] == 2
+    assert td_cells(enterprise)[0]["bold"] == td_cells(enterprise)[0]["b"] == ["24H2"]
+    assert td_cells(release)[0]["bold"] == ["23H2"] and td_cells(release)[0]["b"] == []
+    assert td_cells(release)[2]["links"] == ["https://learn.example.com/kb/5031"]
+    # lxml has no implicit tbody: rows outside a section still count as tbody
+    assert second[0]["section"] == "tbody"
+
+
+def test_static_page_mimics_webdriver():
+    static = page()
+    cells = static.find_elements(By.XPATH, "//tbody/tr[2]/td")
+    assert [cell.text for cell in cells] == ["23H2", "2023-10-31", "2026-11-10"]
+    assert static.find_element(By.XPATH, "//a").get_attribute("href") == "https://learn.example.com/kb/5031"
+    assert element_text(parse_html("<p>a<br>b   c</p>")) == "a\nb c"
@@ -0,0 +1,62 @@
+import glob
+import os
+import shutil
+
+import pytest
+
+from benchmarks.fixtures import troemner_pages
+from benchmarks.server import FixtureServer
+from scraper_utils.orchestrator import load_scraper_module
+
+troemner = load_scraper_module("Day_4/Program/TroemnerScraper.py")
+
+
+@pytest.fixture
+def listing(tmp_path):
+    troemner_pages(str(tmp_path))
+    return tmp_path / "troemner"
+
+
+def load(root):
+    scraper = troemner.TroemnerScraper()
+    with FixtureServer(str(root)) as server:
+        added = scraper.load_listing_pages(f"{server.base_url}/troemner/listing")
+    return added, scraper
+
+
+def test_paginated_listing(listing):
+    pages = len(glob.glob(str(listing / "listing_*.html")))
+    assert pages > 1
+    added, scraper = load(listing.parent)
+    assert added == len(scraper.data) == len({r["productURL"] for r in scraper.data})
+    assert added > 0
+
+
+def test_single_page_listing(listing):
+    for path in glob.glob(str(listing / "listing_*.html")):
+        if not path.endswith("listing_0.html"):
+            os.remove(path)
+    added, scraper = load(listing.parent)
+    assert added == len(scraper.data) > 0
+
+
+def test_ignored_page_parameter_falls_back(listing):
+    # Every ?page=N answers with the first page, as a server without pagination does
+    for path in glob.glob(str(listing / "listing_*.html")):
+        if not path.endswith("listing_0.html"):
+            shutil.copy(listing / "listing_0.html", path)
+    added, scraper = load(listing.parent)
+    assert added == 0
+    assert scraper.data == []
+
+
+def test_parse_price_and_model_number():
+    assert troemner.parse_price("$3,150.00") == (3150.0, "USD")
+    assert troemner.parse_price("USD 3,150.00") == (3150.0, "USD")
+    assert troemner.parse_price("1250.5 EUR") == (1250.5, "EUR")
+    assert troemner.parse_price("SALE $99.00") == (99.0, "USD")
+    assert troemner.parse_price("Call for price") == (None, "")
+    assert troemner.parse_price("Call for price (ships in 2 weeks)") == (None, "")
+    assert troemner.parse_price("SALE 99.00") == (None, "")
+    assert troemner.parse_price("") == (None, "")
+    assert troemner.model_number("(80780388)") == "80780388"